@@ -179,4 +179,35 @@ async def reset_metrics():
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to reset metrics: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+@router.post(
+    "/classification/cache/clear",
+    summary="Clear classification cache",
+    description="Drop cached classification results (use after changing anchors or the model)"
+)
+async def clear_classification_cache():
+    """
+    Clear the exact-text classification result cache.
+    """
+    try:
+        from app.services.classification_service import get_classification_service
+        
+        service = get_classification_service()
+        stats = service.get_cache_stats()
+        service.clear_cache()
+        
+        logger.warning("Classification result cache cleared via admin API")
+        
+        return {
+            "success": True,
+            "message": "Classification cache cleared",
+            "entries_cleared": stats["size"]
+        }
+        
+    except Exception as e:
+        logger.error(f"Failed to clear classification cache: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to clear classification cache: {str(e)}"
+        )
@@ -4,7 +4,7 @@ Dashboard API Endpoints
 Day 8.4 - Admin dashboard data contract
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from typing import Optional
 from datetime import datetime, timedelta
 
@@ -59,28 +59,27 @@ async def get_priority_issues(
                 except KeyError:
                     pass
             
-            issues = issue_repo.get_all(
+            # Priority is computed in Python, so every matching issue is a
+            # candidate; the heap keeps only the top `limit`
+            issues = issue_repo.get_all_lite(
                 status=status_enum,
-                limit=limit,
-                eager_load_complaints=False
+                limit=None
             )
             
             # Build priority queue
-            enriched = AdminQueueService.build(issues)
+            enriched = AdminQueueService.build(issues, top_k=limit)
             
-            # Convert to API format
-            formatted = AdminQueueService.to_api_format(enriched)
+            # Serialize directly (skips FastAPI's jsonable_encoder pass)
+            content = AdminQueueService.to_api_json(
+                enriched, generated_at=datetime.utcnow()
+            )
             
             logger.info(
                 "priority_queue_returned",
-                count=len(formatted)
+                count=len(enriched)
             )
             
-            return {
-                "generated_at": datetime.utcnow().isoformat(),
-                "count": len(formatted),
-                "issues": formatted
-            }
+            return Response(content=content, media_type="application/json")
     
     except Exception as e:
         logger.error(
@@ -112,7 +111,7 @@ async def get_health_summary():
         
         with get_db_context() as db:
             issue_repo = IssueRepository(db)
-            issues = issue_repo.get_all(limit=1000)
+            issues = issue_repo.get_all_lite(limit=1000)
             
             # Filter to only OPEN, IN_PROGRESS, and REOPENED issues (exclude RESOLVED)
             from app.db.models.issue import IssueStatus
@@ -178,7 +177,7 @@ async def get_sla_timers():
         
         with get_db_context() as db:
             issue_repo = IssueRepository(db)
-            issues = issue_repo.get_all(limit=500)
+            issues = issue_repo.get_all_lite(limit=500)
             
             breaching = []
             warning = []
@@ -276,12 +275,12 @@ async def get_trends(
             ])
             
             current_issues = len([
-                i for i in issue_repo.get_all(limit=1000)
+                i for i in issue_repo.get_all_lite(limit=1000)
                 if i.created_at >= window_start
             ])
             
             current_resolved = len([
-                i for i in issue_repo.get_all(limit=1000)
+                i for i in issue_repo.get_all_lite(limit=1000)
                 if i.resolved_at and i.resolved_at >= window_start
             ])
             
@@ -292,12 +291,12 @@ async def get_trends(
             ])
             
             prev_issues = len([
-                i for i in issue_repo.get_all(limit=1000)
+                i for i in issue_repo.get_all_lite(limit=1000)
                 if i.created_at < window_start and i.created_at >= prev_window_start
             ])
             
             prev_resolved = len([
-                i for i in issue_repo.get_all(limit=1000)
+                i for i in issue_repo.get_all_lite(limit=1000)
                 if i.resolved_at and i.resolved_at < window_start and i.resolved_at >= prev_window_start
             ])
             
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Combined classification result model.
+Category + urgency analysis as a slotted dataclass; converted to the
+public JSON shape only at the API boundary.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional
+
+
+# Optional sections, emitted by to_dict() in this order when present
+_OPTIONAL_FIELDS = (
+    "combined_priority",
+    "category_scores",
+    "urgency_scores",
+    "top_categories",
+    "top_urgencies",
+    "category_error",
+    "urgency_error",
+)
+
+
+@dataclass(slots=True)
+class ClassificationResult:
+    """
+    Result of ClassificationService.classify_with_urgency_result().
+
+    In-process callers read attributes directly; to_dict() produces the
+    same dictionary classify_with_urgency() returns.
+    """
+    text: str
+    category: str = "Others"
+    category_confidence: float = 0.0
+    category_similarity: float = 0.0
+    category_description: str = ""
+    urgency: str = "Medium"
+    urgency_confidence: float = 0.0
+    urgency_similarity: float = 0.0
+    urgency_description: str = ""
+    response_time_hours: int = 24
+    processing_info: Optional[Dict[str, Any]] = None
+
+    combined_priority: Optional[Dict[str, Any]] = None
+    category_scores: Optional[Dict[str, float]] = None
+    urgency_scores: Optional[Dict[str, float]] = None
+    top_categories: Optional[List[Dict[str, Any]]] = None
+    top_urgencies: Optional[List[Dict[str, Any]]] = None
+    category_error: Optional[str] = None
+    urgency_error: Optional[str] = None
+    service_info: Optional[Dict[str, Any]] = None
+
+    # Set only when the whole analysis failed (empty input, exception)
+    error: Optional[str] = None
+
+    def copy(self) -> "ClassificationResult":
+        """
+        Copy whose dicts/lists can be mutated without touching this one.
+
+        service_info stays shared (it is read-only service metadata).
+        """
+        def _dict(value):
+            return dict(value) if value is not None else None
+
+        def _rows(value):
+            return [dict(row) for row in value] if value is not None else None
+
+        return replace(
+            self,
+            processing_info=_dict(self.processing_info),
+            combined_priority=_dict(self.combined_priority),
+            category_scores=_dict(self.category_scores),
+            urgency_scores=_dict(self.urgency_scores),
+            top_categories=_rows(self.top_categories),
+            top_urgencies=_rows(self.top_urgencies),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the public combined-analysis response shape"""
+        result = {
+            "text": self.text,
+            "category": self.category,
+            "category_confidence": self.category_confidence,
+            "category_similarity": self.category_similarity,
+            "category_description": self.category_description,
+            "urgency": self.urgency,
+            "urgency_confidence": self.urgency_confidence,
+            "urgency_similarity": self.urgency_similarity,
+            "urgency_description": self.urgency_description,
+            "response_time_hours": self.response_time_hours,
+            "processing_info": self.processing_info,
+        }
+
+        for name in _OPTIONAL_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = value
+
+        result["service_info"] = self.service_info if self.service_info is not None else {}
+
+        if self.error is not None:
+            result["error"] = self.error
+
+        return result
@@ -3,16 +3,249 @@
 Similarity-based classifier using category anchors.
 Uses cosine similarity between complaint embeddings and category anchors.
 """
+import atexit
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
 import numpy as np
 from typing import Dict, List, Tuple, Optional
-from sklearn.metrics.pairwise import cosine_similarity
 
 from app.classification.category_anchors import CATEGORY_ANCHORS
+from app.config import (
+    EMBEDDING_CACHE_CAPACITY,
+    EMBEDDING_CACHE_DIR,
+    QUANTIZE_ANCHORS
+)
 from app.services.embedding_service import get_embedding_service
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row so dot products equal cosine similarity"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+def unit_query(text_embedding: np.ndarray) -> np.ndarray:
+    """float32, unit-length copy of a single query embedding"""
+    query = np.asarray(text_embedding, dtype=np.float32)
+    return query / max(float(np.linalg.norm(query)), 1e-12)
+
+
+def quantize_rows_int8(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Symmetric per-row int8 quantization.
+    
+    Returns (int8 matrix, float32 per-row scales) such that
+    matrix ~= q8 * scales[:, None]. For unit-norm rows the reconstructed
+    cosine is within ~0.5% in the 0.4-0.9 range.
+    """
+    scales = np.abs(matrix).max(axis=1) / 127.0
+    scales = np.maximum(scales, 1e-12).astype(np.float32)
+    quantized = np.round(matrix / scales[:, None]).astype(np.int8)
+    return np.ascontiguousarray(quantized), scales
+
+
+class DiskEmbeddingCache:
+    """
+    Append-only embedding store that survives restarts.
+    
+    Rows live in a memory-mapped float32 file (emb.f32, shape
+    (capacity, D)); idx.json maps hex key -> row. Rows are flushed before
+    the index, so every indexed row is complete even after a crash. Once
+    capacity is reached new embeddings are simply not persisted. The
+    index records the model name; a different model starts a fresh store.
+    """
+    
+    def __init__(self, path: str, dimension: int,
+                 capacity: int = 100_000, flush_every: int = 256,
+                 model_name: Optional[str] = None):
+        self.path = path
+        self.dimension = dimension
+        self.model_name = model_name
+        self.capacity = capacity
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._pending = 0
+        
+        os.makedirs(path, exist_ok=True)
+        self._rows_path = os.path.join(path, "emb.f32")
+        self._index_path = os.path.join(path, "idx.json")
+        
+        self._index: Dict[str, int] = {}
+        if os.path.exists(self._index_path) and os.path.exists(self._rows_path):
+            try:
+                with open(self._index_path) as f:
+                    stored = json.load(f)
+                if (stored.get("dimension") == dimension
+                        and stored.get("capacity") == capacity
+                        and stored.get("model") == model_name):
+                    self._index = stored.get("rows", {})
+                else:
+                    logger.warning("Embedding cache shape or model changed, starting fresh")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read embedding cache index: {str(e)}")
+        
+        mode = "r+" if self._index else "w+"
+        self._rows = np.memmap(
+            self._rows_path, dtype=np.float32, mode=mode, shape=(capacity, dimension)
+        )
+        atexit.register(self.flush)
+        logger.info(f"Disk embedding cache at {path}: {len(self._index)}/{capacity} rows")
+    
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        """Return a copy of the stored row for key, or None"""
+        row = self._index.get(key.hex())
+        if row is None:
+            return None
+        return np.array(self._rows[row])
+    
+    def put(self, key: bytes, embedding: np.ndarray):
+        """Persist embedding under key (no-op when full or already stored)"""
+        hex_key = key.hex()
+        with self._lock:
+            if hex_key in self._index or len(self._index) >= self.capacity:
+                return
+            row = len(self._index)
+            self._rows[row] = embedding
+            self._index[hex_key] = row
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._flush_locked()
+    
+    def flush(self):
+        """Write pending rows, then the index"""
+        with self._lock:
+            self._flush_locked()
+    
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        self._rows.flush()
+        tmp_path = self._index_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "dimension": self.dimension,
+                "capacity": self.capacity,
+                "model": self.model_name,
+                "rows": self._index
+            }, f)
+        os.replace(tmp_path, self._index_path)
+        self._pending = 0
+    
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class EmbeddingCache:
+    """
+    Process-wide LRU cache of unit-normalized complaint embeddings.
+    
+    Grievance datasets repeat template phrases a lot, and the transformer
+    forward pass dominates classification cost. Keys are a blake2b digest
+    of the stripped text, so category and urgency classifiers share hits.
+    Case is preserved in the key because the encoder is case-sensitive.
+    
+    An optional DiskEmbeddingCache sits behind the LRU so previously seen
+    complaints skip the encoder after a restart too.
+    """
+    
+    def __init__(self, maxsize: int = 10_000, embedding_service=None,
+                 disk_cache: Optional[DiskEmbeddingCache] = None):
+        self.maxsize = maxsize
+        self.embedding_service = embedding_service or get_embedding_service()
+        self.disk_cache = disk_cache
+        self._entries: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(text.strip().encode("utf-8"), digest_size=16).digest()
+    
+    def get_or_compute(self, text: str) -> np.ndarray:
+        """Return the normalized float32 embedding for text, encoding on miss"""
+        key = self._key(text)
+        
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return embedding
+            self.misses += 1
+        
+        # Fall back to disk, then the encoder. Both happen outside the lock;
+        # a concurrent miss on the same key just stores an identical vector
+        embedding = self.disk_cache.get(key) if self.disk_cache is not None else None
+        if embedding is None:
+            vector = np.asarray(self.embedding_service.generate_embedding(text), dtype=np.float32)
+            embedding = normalize_rows(vector.reshape(1, -1))[0]
+            if self.disk_cache is not None:
+                self.disk_cache.put(key, embedding)
+        embedding.setflags(write=False)
+        
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        
+        return embedding
+    
+    def clear(self):
+        """Drop all cached embeddings"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Cache size and hit/miss counters"""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_rows": len(self.disk_cache) if self.disk_cache is not None else 0
+        }
+
+
+_embedding_cache_instance = None
+_embedding_cache_lock = threading.Lock()
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get singleton embedding cache shared by all classifiers"""
+    global _embedding_cache_instance
+    if _embedding_cache_instance is None:
+        # Double-checked: two callers must not open the disk cache files twice
+        with _embedding_cache_lock:
+            if _embedding_cache_instance is None:
+                embedding_service = get_embedding_service()
+                disk_cache = None
+                if EMBEDDING_CACHE_DIR:
+                    try:
+                        disk_cache = DiskEmbeddingCache(
+                            EMBEDDING_CACHE_DIR,
+                            embedding_service.embedding_dim,
+                            capacity=EMBEDDING_CACHE_CAPACITY,
+                            model_name=embedding_service.embedder.model_name
+                        )
+                    except Exception as e:
+                        logger.error(f"Disk embedding cache unavailable, using memory only: {str(e)}")
+                _embedding_cache_instance = EmbeddingCache(
+                    embedding_service=embedding_service,
+                    disk_cache=disk_cache
+                )
+    return _embedding_cache_instance
+
+
 class SimilarityClassifier:
     """
     Classify complaints by comparing their embeddings with category anchors.
@@ -24,66 +257,99 @@ class SimilarityClassifier:
     - Confidence based on score gaps
     """
     
-    def __init__(self, similarity_threshold: float = 0.0):
+    def __init__(self, similarity_threshold: float = 0.0,
+                 quantize_anchors: bool = QUANTIZE_ANCHORS):
         """
         Initialize classifier with category anchors.
         
         Args:
             similarity_threshold: Minimum similarity to consider (0-1)
+            quantize_anchors: Score against an int8 copy of the anchor matrix
         """
         self.embedding_service = get_embedding_service()
+        self.embedding_cache = get_embedding_cache()
         self.similarity_threshold = similarity_threshold
         self.category_embeddings: Dict[str, np.ndarray] = {}
         self.category_names: List[str] = []
         
+        # Stacked (A, D) anchor matrix grouped by category, the category
+        # index of each row, and the row offset where each category starts
+        self.anchor_matrix: Optional[np.ndarray] = None
+        self.anchor_labels: Optional[np.ndarray] = None
+        self.cat_offsets: Optional[np.ndarray] = None
+        
+        # Optional int8 copy of anchor_matrix with per-row scales
+        self.quantize_anchors = quantize_anchors
+        self.anchor_matrix_i8: Optional[np.ndarray] = None
+        self.anchor_scales: Optional[np.ndarray] = None
+        
         # Load and embed anchors
         self._initialize_anchors()
         logger.info(f"SimilarityClassifier initialized with {len(self.category_names)} categories")
     
     def _initialize_anchors(self):
-        """Embed all category anchors once at initialization"""
+        """
+        Embed all category anchors once at initialization.
+        
+        Anchors are stored as one C-contiguous, row-normalized float32
+        (A, D) matrix grouped by category; category_embeddings holds
+        per-category views into it. Classification is then a single GEMV
+        plus a per-category max over the grouped rows.
+        """
         try:
             self.category_names = list(CATEGORY_ANCHORS.keys())
             
+            anchor_rows = []
+            counts = []
             for category, anchors in CATEGORY_ANCHORS.items():
                 # Generate embeddings for all anchors in this category
-                anchor_embeddings = []
-                
                 for anchor in anchors:
-                    embedding = self.embedding_service.generate_embedding(anchor)
-                    anchor_embeddings.append(embedding)
-                
-                # Store as numpy array for efficient computation
-                self.category_embeddings[category] = np.array(anchor_embeddings)
+                    anchor_rows.append(self.embedding_service.generate_embedding(anchor))
+                counts.append(len(anchors))
                 
                 logger.debug(f"Embedded {len(anchors)} anchors for category: {category}")
             
+            self.anchor_matrix = np.ascontiguousarray(
+                normalize_rows(np.asarray(anchor_rows, dtype=np.float32))
+            )
+            self.anchor_labels = np.repeat(
+                np.arange(len(counts), dtype=np.int32), counts
+            )
+            self.cat_offsets = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int32)
+            
+            for category, start, count in zip(self.category_names, self.cat_offsets, counts):
+                self.category_embeddings[category] = self.anchor_matrix[start:start + count]
+            
+            if self.quantize_anchors:
+                self.anchor_matrix_i8, self.anchor_scales = quantize_rows_int8(self.anchor_matrix)
+            
             logger.info(f"Successfully embedded anchors for {len(self.category_names)} categories")
             
         except Exception as e:
             logger.error(f"Failed to initialize anchors: {str(e)}")
             raise
     
-    def _compute_similarities(self, text_embedding: np.ndarray) -> Dict[str, float]:
+    def _anchor_dot(self, queries: np.ndarray) -> np.ndarray:
+        """Dot (N, D) or (D,) normalized queries with every anchor row"""
+        if self.anchor_matrix_i8 is None:
+            return queries @ self.anchor_matrix.T
+        return (queries @ self.anchor_matrix_i8.T) * self.anchor_scales
+    
+    def _compute_similarities(self, text_embedding: np.ndarray) -> np.ndarray:
         """
         Compute similarity scores between text and all category anchors.
         
         Strategy: Use maximum similarity per category (best matching anchor)
-        """
-        scores = {}
-        
-        for category, anchor_embeddings in self.category_embeddings.items():
-            # Compute cosine similarity with all anchors in this category
-            similarities = cosine_similarity(
-                text_embedding.reshape(1, -1), 
-                anchor_embeddings
-            )[0]
-            
-            # Use maximum similarity (best matching anchor)
-            max_similarity = float(np.max(similarities))
-            scores[category] = max_similarity
         
-        return scores
+        Returns:
+            (C,) float64 scores in category_names order
+        """
+        # One GEMV over all anchors, then max within each category's rows
+        return self._reduce_anchor_scores(self._anchor_dot(unit_query(text_embedding)))
+    
+    def _reduce_anchor_scores(self, anchor_similarities: np.ndarray) -> np.ndarray:
+        """Per-category max over raw (A,) similarities to anchor_matrix rows"""
+        return np.maximum.reduceat(anchor_similarities, self.cat_offsets).astype(np.float64)
     
     def _compute_confidence(self, sorted_scores: List[Tuple[str, float]]) -> float:
         """
@@ -104,19 +370,68 @@ class SimilarityClassifier:
         # Ensure confidence is between 0 and 1
         return max(0.0, min(1.0, confidence))
     
-    def _get_top_categories(self, scores: Dict[str, float], top_k: int = 3) -> List[Dict]:
-        """Get top k categories with their scores"""
-        sorted_items = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    def _get_top_categories(self, order: List[int], rounded: List[float],
+                            top_k: int = 3) -> List[Dict]:
+        """Get top k categories with their (pre-rounded) scores"""
+        names = self.category_names
+        primary = order[0]
         
-        top_categories = []
-        for category, score in sorted_items[:top_k]:
-            top_categories.append({
-                "category": category,
-                "score": round(score, 4),
-                "is_primary": (category == sorted_items[0][0])
-            })
+        return [
+            {
+                "category": names[i],
+                "score": rounded[i],
+                "is_primary": (i == primary)
+            }
+            for i in order[:top_k]
+        ]
+    
+    def _build_result(self, text: str, scores: np.ndarray,
+                      return_scores: bool = False) -> Dict:
+        """
+        Turn per-category similarity scores into a classification result.
+        
+        Args:
+            scores: (C,) float64 scores in category_names order
+        """
+        names = self.category_names
+        score_list = scores.tolist()
+        
+        # Round every score once, vectorized; shared by top_categories
+        # and all_scores
+        rounded = np.round(scores, 4).tolist()
+        
+        # Sort categories by similarity score (stable, like sorted())
+        order = np.argsort(-scores, kind="stable").tolist()
+        sorted_scores = [(names[i], score_list[i]) for i in order[:2]]
+        
+        # Determine primary category
+        primary_category, primary_score = sorted_scores[0]
+        
+        # Compute confidence
+        confidence = self._compute_confidence(sorted_scores)
+        
+        # Check if score meets threshold
+        meets_threshold = primary_score >= self.similarity_threshold
+        
+        result = {
+            "text": text,
+            "category": primary_category,
+            "confidence": round(confidence, 4),
+            "similarity_score": rounded[order[0]],
+            "meets_threshold": meets_threshold,
+            "top_categories": self._get_top_categories(order, rounded, top_k=3),
+            "processing_info": {
+                "categories_considered": len(names),
+                "threshold": self.similarity_threshold,
+                "strategy": "max_similarity_per_category"
+            }
+        }
+        
+        # Include all scores if requested
+        if return_scores:
+            result["all_scores"] = dict(zip(names, rounded))
         
-        return top_categories
+        return result
     
     def classify(self, text: str, return_scores: bool = False) -> Dict:
         """
@@ -127,7 +442,8 @@ class SimilarityClassifier:
             return_scores: If True, return all similarity scores
             
         Returns:
-            Dictionary with classification results
+            Dictionary with classification results. The dict is freshly built
+            and owned by the caller, who may mutate it without copying.
         """
         if not text or not isinstance(text, str):
             return {
@@ -137,53 +453,67 @@ class SimilarityClassifier:
             }
         
         try:
-            # Step 1: Generate embedding for the complaint
-            text_embedding = np.array(
-                self.embedding_service.generate_embedding(text)
-            )
-            
+            # Step 1: Generate embedding for the complaint (cached)
+            text_embedding = self.embed(text)
+        except Exception as e:
+            logger.error(f"Classification failed for text: {str(e)}")
+            return {
+                "category": "Others",
+                "confidence": 0.0,
+                "error": f"Classification failed: {str(e)}"
+            }
+        
+        return self.classify_from_embedding(text_embedding, text, return_scores)
+    
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Unit-normalized embedding for text, via the shared cache.
+        
+        Callers that need several classifications of the same text (category
+        + urgency) embed once here and pass the vector to
+        classify_from_embedding on each classifier.
+        """
+        return self.embedding_cache.get_or_compute(text)
+    
+    def classify_from_embedding(self, text_embedding: np.ndarray, text: str,
+                                return_scores: bool = False) -> Dict:
+        """
+        Classify a precomputed embedding (no re-encoding).
+        
+        Args:
+            text_embedding: Embedding of text, as returned by embed()
+            text: Original complaint text (echoed in the result)
+            return_scores: If True, return all similarity scores
+        """
+        try:
             # Step 2: Compute similarities with all category anchors
-            scores = self._compute_similarities(text_embedding)
-            
-            # Step 3: Sort categories by similarity score
-            sorted_scores = sorted(
-                scores.items(), 
-                key=lambda x: x[1], 
-                reverse=True
-            )
-            
-            # Step 4: Determine primary category
-            primary_category, primary_score = sorted_scores[0]
-            
-            # Step 5: Compute confidence
-            confidence = self._compute_confidence(sorted_scores)
-            
-            # Step 6: Check if score meets threshold
-            meets_threshold = primary_score >= self.similarity_threshold
-            
-            # Step 7: Build response
-            result = {
-                "text": text,
-                "category": primary_category,
-                "confidence": round(confidence, 4),
-                "similarity_score": round(primary_score, 4),
-                "meets_threshold": meets_threshold,
-                "top_categories": self._get_top_categories(scores, top_k=3),
-                "processing_info": {
-                    "categories_considered": len(self.category_names),
-                    "threshold": self.similarity_threshold,
-                    "strategy": "max_similarity_per_category"
-                }
+            anchor_similarities = self._anchor_dot(unit_query(text_embedding))
+        except Exception as e:
+            logger.error(f"Classification failed for text: {str(e)}")
+            return {
+                "category": "Others",
+                "confidence": 0.0,
+                "error": f"Classification failed: {str(e)}"
             }
+        
+        return self.classify_from_anchor_scores(anchor_similarities, text, return_scores)
+    
+    def classify_from_anchor_scores(self, anchor_similarities: np.ndarray, text: str,
+                                    return_scores: bool = False) -> Dict:
+        """
+        Classify from raw similarities to every anchor_matrix row.
+        
+        Lets a caller score several classifiers' anchors in one GEMV
+        against a stacked matrix and hand each its slice.
+        """
+        try:
+            scores = self._reduce_anchor_scores(anchor_similarities)
             
-            # Include all scores if requested
-            if return_scores:
-                result["all_scores"] = {
-                    category: round(score, 4) 
-                    for category, score in scores.items()
-                }
+            # Steps 3-7: Rank categories and build response
+            result = self._build_result(text, scores, return_scores)
             
-            logger.debug(f"Classified: '{text[:50]}...' → {primary_category} (conf: {confidence:.3f})")
+            logger.debug("Classified: '%.50s...' → %s (conf: %.3f)",
+                         text, result['category'], result['confidence'])
             
             return result
             
@@ -195,22 +525,67 @@ class SimilarityClassifier:
                 "error": f"Classification failed: {str(e)}"
             }
     
-    def classify_batch(self, texts: List[str]) -> List[Dict]:
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed many texts in a single encoder call.
+        
+        Returns:
+            (N, D) row-normalized float32 matrix
+        """
+        embeddings = self.embedding_service.generate_embeddings_batch(texts)
+        if len(embeddings) != len(texts):
+            raise RuntimeError("Batch embedding returned incomplete results")
+        
+        return normalize_rows(np.asarray(embeddings, dtype=np.float32))
+    
+    def score_embeddings(self, text_matrix: np.ndarray) -> np.ndarray:
+        """
+        Score normalized embeddings against every category.
+        
+        One matmul against the stacked anchor matrix; the per-category
+        maximum is taken with np.maximum.reduceat over the grouped rows.
+        
+        Returns:
+            (N, C) float32 array of max similarity, columns in category_names order
+        """
+        similarities = self._anchor_dot(text_matrix)
+        return np.maximum.reduceat(similarities, self.cat_offsets, axis=1)
+    
+    def score_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed and score many texts in one pass (see score_embeddings)"""
+        return self.score_embeddings(self.embed_batch(texts))
+    
+    def classify_batch(self, texts: List[str], return_scores: bool = False,
+                       embeddings: Optional[np.ndarray] = None) -> List[Dict]:
         """
         Classify multiple texts efficiently.
         
         Args:
             texts: List of complaint texts
+            return_scores: If True, return all similarity scores
+            embeddings: Optional precomputed (N, D) normalized embeddings
+                for texts (e.g. encoded concurrently by the caller)
             
         Returns:
-            List of classification results
+            List of classification results (same shape as classify())
         """
-        results = []
+        if not texts:
+            return []
         
-        for text in texts:
-            result = self.classify(text)
-            results.append(result)
+        try:
+            if embeddings is None:
+                embeddings = self.embed_batch(texts)
+            category_scores = self.score_embeddings(embeddings)
+        except Exception as e:
+            logger.error(f"Batch classification failed, falling back to per-text: {str(e)}")
+            return [self.classify(text, return_scores) for text in texts]
+        
+        category_scores = category_scores.astype(np.float64)
+        results = []
+        for text, row in zip(texts, category_scores):
+            results.append(self._build_result(text, row, return_scores))
         
+        logger.debug("Batch classified %d texts", len(results))
         return results
     
     def explain_classification(self, text: str, category: str) -> Dict:
@@ -221,11 +596,23 @@ class SimilarityClassifier:
             Explanation including top matching anchors
         """
         try:
-            # Get embedding for the text
-            text_embedding = np.array(
-                self.embedding_service.generate_embedding(text)
-            )
-            
+            # Get embedding for the text (cached)
+            text_embedding = self.embedding_cache.get_or_compute(text)
+        except Exception as e:
+            logger.error(f"Explanation failed: {str(e)}")
+            return {"error": f"Explanation failed: {str(e)}"}
+        
+        return self.explain_from_embedding(text_embedding, text, category)
+    
+    def explain_from_embedding(self, text_embedding: np.ndarray, text: str,
+                               category: str) -> Dict:
+        """
+        Explain a classification from a precomputed normalized embedding.
+        
+        Returns:
+            Explanation including top matching anchors
+        """
+        try:
             # Get anchors for the category
             anchors = CATEGORY_ANCHORS.get(category, [])
             anchor_embeddings = self.category_embeddings.get(category, np.array([]))
@@ -233,11 +620,8 @@ class SimilarityClassifier:
             if len(anchor_embeddings) == 0:
                 return {"error": "No anchors found for category"}
             
-            # Compute similarities with each anchor
-            similarities = cosine_similarity(
-                text_embedding.reshape(1, -1), 
-                anchor_embeddings
-            )[0]
+            # Anchor rows and the query are unit-normalized: dot == cosine
+            similarities = (anchor_embeddings @ text_embedding).tolist()
             
             # Get top matching anchors
             anchor_scores = list(zip(anchors, similarities))
@@ -253,7 +637,7 @@ class SimilarityClassifier:
                 "category": category,
                 "explanation": f"Text is most similar to '{category}' anchors",
                 "top_matching_anchors": top_anchors,
-                "max_similarity": round(float(np.max(similarities)), 4)
+                "max_similarity": round(max(similarities), 4)
             }
             
         except Exception as e:
@@ -262,12 +646,16 @@ class SimilarityClassifier:
 
 # Singleton instance
 _classifier_instance = None
+_classifier_lock = threading.Lock()
 
 def get_classifier() -> SimilarityClassifier:
     """Get singleton classifier instance"""
     global _classifier_instance
     if _classifier_instance is None:
-        _classifier_instance = SimilarityClassifier()
+        # Double-checked so concurrent first callers build (and warm up) one
+        with _classifier_lock:
+            if _classifier_instance is None:
+                _classifier_instance = SimilarityClassifier()
     return _classifier_instance
 
 if __name__ == "__main__":
@@ -3,11 +3,20 @@
 Similarity-based urgency classifier using urgency anchors.
 Uses cosine similarity between complaint embeddings and urgency anchors.
 """
+import threading
+
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from sklearn.metrics.pairwise import cosine_similarity
 
 from app.classification.urgency_anchors import URGENCY_ANCHORS, URGENCY_LEVELS
+from app.classification.similarity_classifier import (
+    get_embedding_cache,
+    normalize_rows,
+    quantize_rows_int8,
+    unit_query
+)
+from app.config import QUANTIZE_ANCHORS
 from app.services.embedding_service import get_embedding_service
 from app.utils.logger import get_logger
 
@@ -25,75 +34,112 @@ class UrgencyClassifier:
     - Independent of category classification
     """
     
-    def __init__(self):
-        """Initialize urgency classifier with anchors"""
+    def __init__(self, quantize_anchors: bool = QUANTIZE_ANCHORS):
+        """
+        Initialize urgency classifier with anchors.
+        
+        Args:
+            quantize_anchors: Score against an int8 copy of the anchor matrix
+        """
         self.embedding_service = get_embedding_service()
+        self.embedding_cache = get_embedding_cache()
         self.urgency_levels = URGENCY_LEVELS
         self.anchor_embeddings: Dict[str, np.ndarray] = {}
         
+        # Stacked (A, D) anchor matrix grouped by level (see _initialize_anchors)
+        self.level_names: List[str] = []
+        self.anchor_matrix: Optional[np.ndarray] = None
+        self.anchor_labels: Optional[np.ndarray] = None
+        self.level_offsets: Optional[np.ndarray] = None
+        self.level_counts: Optional[np.ndarray] = None
+        
+        # Optional int8 copy of anchor_matrix with per-row scales
+        self.quantize_anchors = quantize_anchors
+        self.anchor_matrix_i8: Optional[np.ndarray] = None
+        self.anchor_scales: Optional[np.ndarray] = None
+        
         # Load and embed anchors
         self._initialize_anchors()
         logger.info(f"UrgencyClassifier initialized with {len(self.urgency_levels)} urgency levels")
     
     def _initialize_anchors(self):
-        """Embed all urgency anchors once at initialization"""
+        """
+        Embed all urgency anchors once at initialization.
+        
+        Anchors are stored as one C-contiguous, row-normalized float32
+        (A, D) matrix grouped by level; anchor_embeddings holds per-level
+        views into it.
+        """
         try:
+            self.level_names = list(URGENCY_ANCHORS.keys())
+            
+            anchor_rows = []
+            counts = []
             for level, anchors in URGENCY_ANCHORS.items():
                 # Generate embeddings for all anchors in this urgency level
-                anchor_embeddings = []
-                
                 for anchor in anchors:
-                    embedding = self.embedding_service.generate_embedding(anchor)
-                    anchor_embeddings.append(embedding)
-                
-                # Store as numpy array for efficient computation
-                self.anchor_embeddings[level] = np.array(anchor_embeddings)
+                    anchor_rows.append(self.embedding_service.generate_embedding(anchor))
+                counts.append(len(anchors))
                 
                 logger.debug(f"Embedded {len(anchors)} anchors for urgency level: {level}")
             
+            self.anchor_matrix = np.ascontiguousarray(
+                normalize_rows(np.asarray(anchor_rows, dtype=np.float32))
+            )
+            self.anchor_labels = np.repeat(
+                np.arange(len(counts), dtype=np.int32), counts
+            )
+            self.level_offsets = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int32)
+            self.level_counts = np.asarray(counts, dtype=np.float32)
+            
+            for level, start, count in zip(self.level_names, self.level_offsets, counts):
+                self.anchor_embeddings[level] = self.anchor_matrix[start:start + count]
+            
+            if self.quantize_anchors:
+                self.anchor_matrix_i8, self.anchor_scales = quantize_rows_int8(self.anchor_matrix)
+            
             logger.info(f"Successfully embedded anchors for {len(self.urgency_levels)} urgency levels")
             
         except Exception as e:
             logger.error(f"Failed to initialize urgency anchors: {str(e)}")
             raise
     
-    def _compute_similarities(self, text_embedding: np.ndarray) -> Dict[str, float]:
+    def _compute_similarities(self, text_embedding: np.ndarray) -> np.ndarray:
         """
         Compute similarity scores between text and all urgency anchors.
         
         Strategy: Use mean similarity per urgency level
         (more stable than max for urgency detection)
-        """
-        scores = {}
-        
-        for level, anchor_embeddings in self.anchor_embeddings.items():
-            # Compute cosine similarity with all anchors in this urgency level
-            similarities = cosine_similarity(
-                text_embedding.reshape(1, -1), 
-                anchor_embeddings
-            )[0]
-            
-            # Use mean similarity (more robust for urgency)
-            mean_similarity = float(np.mean(similarities))
-            scores[level] = mean_similarity
         
-        return scores
+        Returns:
+            (L,) float64 scores in level_names order
+        """
+        # One GEMV over all anchors, then mean within each level's rows
+        return self._reduce_anchor_scores(self._anchor_dot(unit_query(text_embedding)))
+    
+    def _anchor_dot(self, query: np.ndarray) -> np.ndarray:
+        """Dot a normalized query with every anchor row"""
+        if self.anchor_matrix_i8 is None:
+            return self.anchor_matrix @ query
+        return (self.anchor_matrix_i8 @ query) * self.anchor_scales
+    
+    def _reduce_anchor_scores(self, anchor_similarities: np.ndarray) -> np.ndarray:
+        """Per-level mean over raw (A,) similarities to anchor_matrix rows"""
+        level_mean = np.add.reduceat(anchor_similarities, self.level_offsets) / self.level_counts
+        return level_mean.astype(np.float64)
     
-    def _compute_confidence(self, scores: Dict[str, float], top_level: str) -> float:
+    def _compute_confidence(self, sorted_scores: List[float]) -> float:
         """
         Compute confidence based on gap between top score and others.
         
         Confidence = (top_score - second_score) / top_score
         Normalized to 0-1 range
         """
-        if len(scores) < 2:
+        if len(sorted_scores) < 2:
             return 0.5  # Default moderate confidence
         
-        # Get sorted scores
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        
-        top_score = sorted_scores[0][1]
-        second_score = sorted_scores[1][1]
+        top_score = sorted_scores[0]
+        second_score = sorted_scores[1]
         
         # Avoid division by zero
         if top_score == 0:
@@ -105,19 +151,20 @@ class UrgencyClassifier:
         # Ensure confidence is between 0 and 1
         return max(0.0, min(1.0, confidence))
     
-    def _get_top_urgencies(self, scores: Dict[str, float], top_k: int = 3) -> List[Dict]:
-        """Get top k urgency levels with their scores"""
-        sorted_items = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        
-        top_urgencies = []
-        for level, score in sorted_items[:top_k]:
-            top_urgencies.append({
-                "level": level,
-                "score": round(score, 4),
-                "is_primary": (level == sorted_items[0][0])
-            })
+    def _get_top_urgencies(self, order: List[int], rounded: List[float],
+                           top_k: int = 3) -> List[Dict]:
+        """Get top k urgency levels with their (pre-rounded) scores"""
+        names = self.level_names
+        primary = order[0]
         
-        return top_urgencies
+        return [
+            {
+                "level": names[i],
+                "score": rounded[i],
+                "is_primary": (i == primary)
+            }
+            for i in order[:top_k]
+        ]
     
     def classify(self, text: str, return_scores: bool = False) -> Dict:
         """
@@ -128,7 +175,8 @@ class UrgencyClassifier:
             return_scores: If True, return all similarity scores
             
         Returns:
-            Dictionary with urgency classification results
+            Dictionary with urgency classification results. The dict is freshly built
+            and owned by the caller, who may mutate it without copying.
         """
         if not text or not isinstance(text, str):
             return {
@@ -138,28 +186,72 @@ class UrgencyClassifier:
             }
         
         try:
-            # Step 1: Generate embedding for the complaint
-            text_embedding = np.array(
-                self.embedding_service.generate_embedding(text)
-            )
-            
+            # Step 1: Generate embedding for the complaint (shared cache)
+            text_embedding = self.embedding_cache.get_or_compute(text)
+        except Exception as e:
+            logger.error(f"Urgency classification failed: {str(e)}")
+            return {
+                "urgency": "Medium",
+                "confidence": 0.0,
+                "error": f"Urgency classification failed: {str(e)}"
+            }
+        
+        return self.classify_from_embedding(text_embedding, text, return_scores)
+    
+    def classify_from_embedding(self, text_embedding: np.ndarray, text: str,
+                                return_scores: bool = False) -> Dict:
+        """
+        Classify urgency of a precomputed embedding (no re-encoding).
+        
+        Args:
+            text_embedding: Normalized embedding of text (SimilarityClassifier.embed)
+            text: Original complaint text (echoed in the result)
+            return_scores: If True, return all similarity scores
+        """
+        try:
             # Step 2: Compute similarities with all urgency anchors
-            scores = self._compute_similarities(text_embedding)
+            anchor_similarities = self._anchor_dot(unit_query(text_embedding))
+        except Exception as e:
+            logger.error(f"Urgency classification failed: {str(e)}")
+            return {
+                "urgency": "Medium",
+                "confidence": 0.0,
+                "error": f"Urgency classification failed: {str(e)}"
+            }
+        
+        return self.classify_from_anchor_scores(anchor_similarities, text, return_scores)
+    
+    def classify_from_anchor_scores(self, anchor_similarities: np.ndarray, text: str,
+                                    return_scores: bool = False) -> Dict:
+        """
+        Classify urgency from raw similarities to every anchor_matrix row.
+        
+        Lets a caller score category and urgency anchors in one GEMV against
+        a stacked matrix and hand each classifier its slice.
+        """
+        try:
+            scores = self._reduce_anchor_scores(anchor_similarities)
             
-            # Step 3: Determine primary urgency level
-            primary_level = max(scores.items(), key=lambda x: x[1])[0]
-            primary_score = scores[primary_level]
+            names = self.level_names
+            score_list = scores.tolist()
+            
+            # Round every score once, vectorized
+            rounded = np.round(scores, 4).tolist()
+            
+            # Step 3: Determine primary urgency level (first max, like max())
+            order = np.argsort(-scores, kind="stable").tolist()
+            primary_level = names[order[0]]
             
             # Step 4: Compute confidence
-            confidence = self._compute_confidence(scores, primary_level)
+            confidence = self._compute_confidence([score_list[i] for i in order[:2]])
             
             # Step 5: Build response
             result = {
                 "text": text,
                 "urgency": primary_level,
                 "confidence": round(confidence, 4),
-                "similarity_score": round(primary_score, 4),
-                "top_urgencies": self._get_top_urgencies(scores, top_k=3),
+                "similarity_score": rounded[order[0]],
+                "top_urgencies": self._get_top_urgencies(order, rounded, top_k=3),
                 "processing_info": {
                     "urgency_levels_considered": len(self.urgency_levels),
                     "strategy": "mean_similarity_per_level",
@@ -169,12 +261,10 @@ class UrgencyClassifier:
             
             # Include all scores if requested
             if return_scores:
-                result["all_scores"] = {
-                    level: round(score, 4) 
-                    for level, score in scores.items()
-                }
+                result["all_scores"] = dict(zip(names, rounded))
             
-            logger.debug(f"Urgency classified: '{text[:50]}...' → {primary_level} (conf: {confidence:.3f})")
+            logger.debug("Urgency classified: '%.50s...' → %s (conf: %.3f)",
+                         text, primary_level, confidence)
             
             return result
             
@@ -212,10 +302,8 @@ class UrgencyClassifier:
             Explanation including matching anchors
         """
         try:
-            # Get embedding for the text
-            text_embedding = np.array(
-                self.embedding_service.generate_embedding(text)
-            )
+            # Get embedding for the text (shared cache)
+            text_embedding = self.embedding_cache.get_or_compute(text)
             
             # Get anchors for the urgency level
             anchors = URGENCY_ANCHORS.get(urgency_level, [])
@@ -253,12 +341,16 @@ class UrgencyClassifier:
 
 # Singleton instance
 _classifier_instance = None
+_classifier_lock = threading.Lock()
 
 def get_urgency_classifier() -> UrgencyClassifier:
     """Get singleton urgency classifier instance"""
     global _classifier_instance
     if _classifier_instance is None:
-        _classifier_instance = UrgencyClassifier()
+        # Double-checked so concurrent first callers build (and warm up) one
+        with _classifier_lock:
+            if _classifier_instance is None:
+                _classifier_instance = UrgencyClassifier()
     return _classifier_instance
 
 if __name__ == "__main__":
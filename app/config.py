@@ -11,6 +11,32 @@ EMBEDDING_MODEL_NAME = "sentence-transformers/distiluse-base-multilingual-cased-
 # - "l3cube-pune/hindi-sentence-similarity-sbert" (Hindi-focused, 768-dim)[citation:2]
 # - "paraphrase-multilingual-mpnet-base-v2" (heavier but more accurate)[citation:3]
 
+# Store classifier anchor matrices as int8 + per-row scale (off by default:
+# at the current anchor counts the float32 matrices already sit in cache)
+QUANTIZE_ANCHORS = os.getenv("QUANTIZE_ANCHORS", "false").lower() == "true"
+
+# Directory for the persistent (mmap'd) classifier embedding cache; unset
+# keeps the cache in memory only
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR")
+EMBEDDING_CACHE_CAPACITY = int(os.getenv("EMBEDDING_CACHE_CAPACITY", "100000"))
+
+# Day 7A embedding micro-batching: concurrent requests' encoder calls are
+# coalesced into one forward pass of up to this many texts, waiting at most
+# this long for company after the first arrives
+EMBEDDING_MICRO_BATCH_SIZE = int(os.getenv("EMBEDDING_MICRO_BATCH_SIZE", "32"))
+EMBEDDING_MICRO_BATCH_WAIT_MS = float(os.getenv("EMBEDDING_MICRO_BATCH_WAIT_MS", "10"))
+
+# Day 6 issue urgency stats: O(1) running update (default) or a full
+# recompute from the issue's complaints (slow; for cross-checking)
+INCREMENTAL_ISSUE_STATS = os.getenv("INCREMENTAL_ISSUE_STATS", "true").lower() == "true"
+
+# Day 7B.3 per-request trace marks (debugging only; off makes trace.mark a no-op)
+ENABLE_TRACING = os.getenv("ENABLE_TRACING", "false").lower() == "true"
+
+# Day 7B.1 routine per-step INFO events (info_sampled) are logged 1 in this
+# many calls; 1 logs every call. Warnings, errors and summaries are never sampled
+LOG_SAMPLE_N = max(1, int(os.getenv("LOG_SAMPLE_N", "10")))
+
 # Service Configuration
 SERVICE_NAME = "hostel-grievance-ai"
 SERVICE_VERSION = "0.2.0"
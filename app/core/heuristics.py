@@ -76,7 +76,7 @@ class HeuristicEngine:
             for entry in previous_entries:
                 if entry.issue_id == current_issue_id:
                     result["is_follow_up"] = True
-                    logger.debug(f"Follow-up detected for issue {current_issue_id}")
+                    logger.debug("Follow-up detected for issue %s", current_issue_id)
                     break
 
         # ----------------------------------
@@ -13,6 +13,7 @@ import time
 from typing import Dict, Optional, List
 from dataclasses import dataclass, field
 
+from app.issues.urgency_rules import get_urgency_display_label, get_urgency_score
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -92,8 +93,6 @@ class Session:
     
     def get_max_urgency_for_issue(self, issue_id: str) -> Optional[str]:
         """Get maximum urgency level for an issue in this session"""
-        from app.issues.urgency_rules import get_urgency_score
-        
         entries = self.get_issue_history(issue_id)
         if not entries:
             return None
@@ -102,8 +101,7 @@ class Session:
         max_score = max(urgencies)
         
         # Convert back to label
-        urgency_map = {1: "Low", 2: "Medium", 3: "High", 4: "Critical"}
-        return urgency_map.get(max_score, "Low")
+        return get_urgency_display_label(max_score)
 
 
 # -------------------------
@@ -161,10 +159,17 @@ class SessionManager:
         category: str,
         urgency: str,
         similarity_score: Optional[float],
-        is_duplicate: bool
+        is_duplicate: bool,
+        session: Optional[Session] = None
     ) -> bool:
-        """Register a complaint in session"""
-        session = self.get_session(session_id)
+        """
+        Register a complaint in session
+        
+        Pass the Session the caller already resolved for this request to
+        skip the second lookup (it is re-resolved only if it has expired).
+        """
+        if session is None or session.session_id != session_id or session.is_expired():
+            session = self.get_session(session_id)
 
         if not session:
             logger.warning(f"Session not found: {session_id}")
@@ -186,7 +191,7 @@ class SessionManager:
 
         success = session.add_entry(entry)
         if success:
-            logger.debug(f"Complaint {complaint_id} registered in session {session_id}")
+            logger.debug("Complaint %s registered in session %s", complaint_id, session_id)
         
         return success
 
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Schema upgrades for existing databases
+Brings databases created by an older create_all up to the current models
+
+create_all only creates missing tables; it never adds columns or indexes
+to tables that already exist. Each step below is applied once, in order,
+and recorded in the schema_version table. Steps are written to be
+idempotent, so a database that already has a step's change (e.g. one
+created before versioning existed) upgrades cleanly.
+"""
+
+from typing import Callable, List, Tuple
+
+import numpy as np
+from sqlalchemy import (
+    Column, Integer, LargeBinary, MetaData, Table, bindparam, column, func,
+    inspect, or_, select, table, update
+)
+from sqlalchemy.engine import Connection, Engine
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Rows re-packed per UPDATE round by the embedding consolidation step
+_BACKFILL_BATCH_SIZE = 1000
+
+_version_metadata = MetaData()
+
+schema_version = Table(
+    "schema_version",
+    _version_metadata,
+    Column("version", Integer, primary_key=True),
+)
+
+
+def _add_issue_duplicate_index(conn: Connection):
+    """Partial index on complaints(issue_id) WHERE is_duplicate"""
+    from app.db.models.complaint import ComplaintModel
+
+    for index in ComplaintModel.__table__.indexes:
+        if index.name == "ix_complaint_issue_dup":
+            index.create(conn, checkfirst=True)
+
+
+def _add_column(conn: Connection, table: str, column: Column):
+    """ALTER TABLE ... ADD COLUMN unless the column is already there"""
+    existing = {col["name"] for col in inspect(conn).get_columns(table)}
+    if column.name in existing:
+        return
+
+    ddl = f"ALTER TABLE {table} ADD COLUMN {column.name} {column.type.compile(dialect=conn.dialect)}"
+    if column.server_default is not None:
+        ddl += f" DEFAULT {column.server_default.arg}"
+    if not column.nullable:
+        ddl += " NOT NULL"
+    conn.exec_driver_sql(ddl)
+
+
+def _drop_column(conn: Connection, table_name: str, column_name: str):
+    """ALTER TABLE ... DROP COLUMN if the column is there (SQLite 3.35+)"""
+    existing = {col["name"] for col in inspect(conn).get_columns(table_name)}
+    if column_name not in existing:
+        return
+    
+    if conn.dialect.name == "sqlite" and conn.dialect.dbapi.sqlite_version_info < (3, 35):
+        logger.warning(
+            f"SQLite {conn.dialect.dbapi.sqlite_version} cannot drop columns; "
+            f"{table_name}.{column_name} is left in place, unused"
+        )
+        return
+    conn.exec_driver_sql(f"ALTER TABLE {table_name} DROP COLUMN {column_name}")
+
+
+def _add_embedding_blob(conn: Connection):
+    """float32 complaint embeddings (Day 6 duplicate detection; dropped in 5)"""
+    _add_column(conn, "complaints", Column("embedding_blob", LargeBinary, nullable=True))
+
+
+def _add_embedding_fp16(conn: Connection):
+    """float16 complaint embeddings (dropped in 5)"""
+    _add_column(conn, "complaints", Column("embedding_fp16", LargeBinary, nullable=True))
+
+
+def _add_issue_centroid(conn: Connection):
+    """Duplicate-screening centroid; NULL until the issue's next duplicate check"""
+    _add_column(conn, "issues", Column("centroid", LargeBinary, nullable=True))
+    _add_column(
+        conn, "issues",
+        Column("centroid_count", Integer, nullable=False, server_default="0")
+    )
+
+
+def _consolidate_embeddings(conn: Connection):
+    """
+    Make complaints.embedding_i8 the only embedding column
+    
+    Rows that only have embedding_fp16 / embedding_blob are re-packed as
+    int8 (ComplaintRepository.pack_embedding_i8), then both older columns
+    are dropped.
+    """
+    from app.repositories.complaint_repository import pack_embedding_i8
+    
+    _add_column(conn, "complaints", Column("embedding_i8", LargeBinary, nullable=True))
+    
+    existing = {col["name"] for col in inspect(conn).get_columns("complaints")}
+    legacy = [name for name in ("embedding_fp16", "embedding_blob") if name in existing]
+    if legacy:
+        complaints = table(
+            "complaints", column("id"), column("embedding_i8"),
+            *(column(name) for name in legacy)
+        )
+        pending = select(complaints.c.id, *(complaints.c[name] for name in legacy)).where(
+            complaints.c.embedding_i8.is_(None),
+            or_(*(complaints.c[name].isnot(None) for name in legacy))
+        ).limit(_BACKFILL_BATCH_SIZE)
+        backfilled = 0
+        
+        while rows := conn.execute(pending).all():
+            params = []
+            for complaint_id, *values in rows:
+                name, value = next(
+                    (name, value) for name, value in zip(legacy, values) if value is not None
+                )
+                dtype = np.float16 if name == "embedding_fp16" else np.float32
+                embedding = np.frombuffer(value, dtype=dtype).astype(np.float32)
+                params.append({"cid": complaint_id, "packed": pack_embedding_i8(embedding)})
+            conn.execute(
+                update(complaints)
+                .where(complaints.c.id == bindparam("cid"))
+                .values(embedding_i8=bindparam("packed")),
+                params
+            )
+            backfilled += len(params)
+        
+        if backfilled:
+            logger.info(f"Re-packed {backfilled} complaint embeddings as int8")
+    
+    for name in legacy:
+        _drop_column(conn, "complaints", name)
+
+
+# (version, description, step) - append only; never renumber
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "add ix_complaint_issue_dup partial index", _add_issue_duplicate_index),
+    (2, "add complaints.embedding_blob", _add_embedding_blob),
+    (3, "add complaints.embedding_fp16", _add_embedding_fp16),
+    (4, "add issues.centroid and issues.centroid_count", _add_issue_centroid),
+    (5, "move complaint embeddings to embedding_i8; drop embedding_fp16/_blob",
+     _consolidate_embeddings),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(engine: Engine) -> int:
+    """Highest applied migration (0 for an unversioned database)"""
+    _version_metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        return conn.execute(select(func.max(schema_version.c.version))).scalar() or 0
+
+
+def stamp(engine: Engine, version: int = SCHEMA_VERSION):
+    """Mark a database as being at `version` without running any steps"""
+    _version_metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(schema_version.delete())
+        conn.execute(schema_version.insert().values(version=version))
+
+
+def upgrade(engine: Engine) -> int:
+    """
+    Apply every pending migration, one transaction per step.
+
+    Returns:
+        Schema version after the upgrade
+    """
+    current = get_schema_version(engine)
+
+    for version, description, step in MIGRATIONS:
+        if version <= current:
+            continue
+
+        logger.info(f"Applying schema migration {version}: {description}")
+        with engine.begin() as conn:
+            step(conn)
+            conn.execute(schema_version.delete())
+            conn.execute(schema_version.insert().values(version=version))
+        current = version
+
+    return current
+
+
+def is_new_database(engine: Engine) -> bool:
+    """True when none of the application tables exist yet"""
+    tables = set(inspect(engine).get_table_names())
+    return not tables & {"issues", "complaints"}
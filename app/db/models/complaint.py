@@ -6,7 +6,8 @@ Day 7A.1 & 7A.2 - Integrity constraints + Indexing
 
 from sqlalchemy import (
     Column, String, Text, Float, Boolean, DateTime, 
-    ForeignKey, JSON, CheckConstraint, Index
+    ForeignKey, JSON, CheckConstraint, Index, LargeBinary,
+    text as sql_text  # `text` is shadowed by the column below
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -50,6 +51,11 @@ class ComplaintModel(Base):
         nullable=True
     )
     
+    # Unit-norm embedding as a float32 scale followed by int8 components
+    # (see ComplaintRepository); the only embedding column. Schema step 5
+    # re-packed the older embedding_fp16 / embedding_blob columns into it
+    embedding_i8 = Column(LargeBinary, nullable=True)
+    
     # Session tracking
     session_id = Column(String, nullable=True)
     
@@ -103,6 +109,14 @@ class ComplaintModel(Base):
         
         # Composite index for issue + time
         Index("ix_complaint_issue_time", "issue_id", "created_at"),
+        
+        # Partial index: duplicate complaints per issue (index-only count)
+        Index(
+            "ix_complaint_issue_dup",
+            "issue_id",
+            postgresql_where=sql_text("is_duplicate = true"),
+            sqlite_where=sql_text("is_duplicate = 1")
+        ),
     )
     
     def __repr__(self):
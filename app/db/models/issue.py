@@ -5,10 +5,10 @@ Day 7A.1 & 7A.2 - Integrity constraints + Indexing
 """
 
 from sqlalchemy import (
-    Column, String, Integer, Float, DateTime, 
+    Column, String, Integer, Float, DateTime, LargeBinary,
     UniqueConstraint, CheckConstraint, Index
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from datetime import datetime
 import enum
 
@@ -53,6 +53,11 @@ class IssueModel(Base):
     unique_complaint_count = Column(Integer, nullable=False, default=0)
     duplicate_count = Column(Integer, nullable=False, default=0)
     
+    # Duplicate screening: running mean of the complaints' unit embeddings
+    # (raw float32 bytes) and how many embeddings it averages
+    centroid = Column(LargeBinary, nullable=True)
+    centroid_count = Column(Integer, nullable=False, default=0)
+    
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
     last_updated = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -111,25 +116,18 @@ class IssueModel(Base):
         Index("ix_issue_resolved_at", "resolved_at"),
     )
     
+    @validates("status")
+    def _validate_status(self, key, value):
+        # Keep the plain string, so issue.status is a str on every code path
+        return value.value if isinstance(value, IssueStatus) else value
+    
     def __repr__(self):
         return f"<Issue {self.id} ({self.hostel}/{self.category}) - {self.status}>"
     
     def to_dict(self, include_complaints=False, summary=False):
         """Convert to dictionary representation"""
         if summary:
-            return {
-                "issue_id": self.id,
-                "category": self.category,
-                "hostel": self.hostel,
-                "status": self.status,
-                "complaint_count": self.complaint_count,
-                "unique_complaint_count": self.unique_complaint_count,
-                "urgency_max": self.urgency_max,
-                "urgency_avg": round(self.urgency_avg, 2),
-                "created_at": self.created_at.isoformat(),
-                "last_updated": self.last_updated.isoformat(),
-                "duplicate_count": self.duplicate_count
-            }
+            return issue_summary(self)
         
         data = {
             "issue_id": self.id,
@@ -149,4 +147,25 @@ class IssueModel(Base):
         if include_complaints:
             data["complaints"] = [c.to_dict() for c in self.complaints]
         
-        return data
\ No newline at end of file
+        return data
+
+
+def issue_summary(issue) -> dict:
+    """
+    to_dict(summary=True) for an IssueModel or a column row with the same
+    attribute names (IssueRepository.get_all_lite), so listings can skip
+    ORM hydration
+    """
+    return {
+        "issue_id": issue.id,
+        "category": issue.category,
+        "hostel": issue.hostel,
+        "status": issue.status,
+        "complaint_count": issue.complaint_count,
+        "unique_complaint_count": issue.unique_complaint_count,
+        "urgency_max": issue.urgency_max,
+        "urgency_avg": round(issue.urgency_avg, 2),
+        "created_at": issue.created_at.isoformat(),
+        "last_updated": issue.last_updated.isoformat(),
+        "duplicate_count": issue.duplicate_count
+    }
@@ -7,6 +7,7 @@ Day 6.1 & 7A - Engine and session factory with constraint enforcement
 import os
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
 from typing import Generator
 
@@ -18,14 +19,27 @@ logger = get_logger(__name__)
 # Database URL - defaults to SQLite in data directory
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///data/hostel_grievance.db")
 
+# Connection pool, tuned for PgBouncer transaction-mode deployments:
+# connections are reused across requests, and instead of a SELECT 1 ping
+# on every checkout, pooled connections are recycled after
+# DB_POOL_RECYCLE_SECONDS so stale ones never live long
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+DB_POOL_TIMEOUT_SECONDS = int(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "60"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+
 # Create engine with optimized settings for SQLite
 engine = create_engine(
     DATABASE_URL,
     echo=False,  # Set to True for SQL debugging
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10
+    poolclass=QueuePool,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=DB_POOL_RECYCLE_SECONDS
 )
 
 # Day 7A: Enable SQLite constraints
@@ -44,16 +58,29 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def init_db():
     """
-    Initialize database - create all tables.
+    Initialize database - create all tables, then upgrade the schema.
     Safe to call multiple times (idempotent).
+    
+    New databases get the current schema from create_all and are stamped
+    at the latest version; existing ones run pending steps from
+    app.db.migrations.
     """
     try:
         # Import all models to register them
         from app.db.models import issue, complaint  # noqa
+        from app.db import migrations
+        
+        is_new = migrations.is_new_database(engine)
         
         # Create tables
         Base.metadata.create_all(bind=engine)
-        logger.info("Database initialized successfully")
+        
+        if is_new:
+            migrations.stamp(engine)
+            version = migrations.SCHEMA_VERSION
+        else:
+            version = migrations.upgrade(engine)
+        logger.info(f"Database initialized successfully (schema version {version})")
         
     except Exception as e:
         logger.error(f"Database initialization failed: {str(e)}")
@@ -5,6 +5,7 @@ Handles PyTorch meta tensor issues
 """
 
 import logging
+import threading
 from typing import List, Union
 import numpy as np
 from sentence_transformers import SentenceTransformer
@@ -62,7 +63,10 @@ class Embedder:
             logger.error(f"Failed to load model {self.model_name}: {str(e)}")
             raise
   
-    def embed(self, text: str) -> List[float]:
+    def _zero_vector(self) -> np.ndarray:
+        return np.zeros(self.dimension or 0, dtype=np.float32)
+  
+    def embed(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single text.
       
@@ -70,21 +74,25 @@ class Embedder:
             text: Input text (any language)
           
         Returns:
-            List of floats representing the semantic vector
+            Unit-norm float32 vector (cosine similarity is a plain dot product)
         """
         if not text:
-            return [0.0] * self.dimension if self.dimension else []
+            return self._zero_vector()
       
         try:
             # The model handles multiple languages automatically
-            vector = self.model.encode(text, convert_to_numpy=True)
-            return vector.tolist()
+            vector = self.model.encode(
+                text,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
+            return vector.astype(np.float32, copy=False)
         except Exception as e:
             logger.error(f"Embedding generation failed: {str(e)}")
             # Return zero vector on failure
-            return [0.0] * self.dimension if self.dimension else []
+            return self._zero_vector()
   
-    def embed_batch(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+    def embed_batch(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
         """
         Generate embeddings for multiple texts efficiently.
       
@@ -93,10 +101,10 @@ class Embedder:
             batch_size: Batch size for processing
           
         Returns:
-            List of embedding vectors
+            (N, D) float32 matrix of unit-norm rows; empty (0, D) on failure
         """
         if not texts:
-            return []
+            return np.empty((0, self.dimension or 0), dtype=np.float32)
       
         try:
             # Batch processing for efficiency
@@ -104,12 +112,13 @@ class Embedder:
                 texts,
                 batch_size=batch_size,
                 convert_to_numpy=True,
+                normalize_embeddings=True,
                 show_progress_bar=False
             )
-            return embeddings.tolist()
+            return embeddings.astype(np.float32, copy=False)
         except Exception as e:
             logger.error(f"Batch embedding failed: {str(e)}")
-            return []
+            return np.empty((0, self.dimension or 0), dtype=np.float32)
   
     def get_dimension(self) -> int:
         """Get embedding dimension"""
@@ -118,11 +127,15 @@ class Embedder:
 
 # Singleton instance for reuse
 _embedder_instance = None
+_embedder_lock = threading.Lock()
 
 
 def get_embedder() -> Embedder:
     """Get singleton embedder instance"""
     global _embedder_instance
     if _embedder_instance is None:
-        _embedder_instance = Embedder()
+        # Double-checked so concurrent first callers load the weights once
+        with _embedder_lock:
+            if _embedder_instance is None:
+                _embedder_instance = Embedder()
     return _embedder_instance
\ No newline at end of file
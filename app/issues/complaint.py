@@ -6,7 +6,9 @@ Day 5.1 - Immutable atomic complaint
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Optional
+
+import numpy as np
 
 
 @dataclass
@@ -21,7 +23,7 @@ class Complaint:
     urgency: str           # From Day 4 urgency system
     hostel: str
     timestamp: datetime
-    embedding: List[float]  # For duplicate detection
+    embedding: np.ndarray  # Unit-norm float32, for duplicate detection
     metadata: Dict = field(default_factory=dict)
     
     # Duplicate tracking
@@ -41,6 +43,6 @@ class Complaint:
             "is_duplicate": self.is_duplicate,
             "duplicate_of": self.duplicate_of,
             "similarity_score": round(self.similarity_score, 4) if self.similarity_score else None,
-            "embedding_length": len(self.embedding) if self.embedding else 0,
+            "embedding_length": len(self.embedding) if self.embedding is not None else 0,
             "metadata": self.metadata
         }
\ No newline at end of file
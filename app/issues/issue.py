@@ -10,8 +10,8 @@ from typing import List, Dict, Optional, Tuple
 import numpy as np
 
 from app.issues.complaint import Complaint
-from app.issues.similarity import cosine_similarity
-from app.issues.urgency_rules import get_urgency_score, get_urgency_label
+from app.issues.similarity_numba import max_cosine
+from app.issues.urgency_rules import get_urgency_score, get_urgency_label, get_urgency_stats
 
 
 @dataclass
@@ -70,14 +70,14 @@ class Issue:
         if self.complaint_count == 0:
             self.created_at = complaint.timestamp
         
-        # Recalculate derived fields
-        self._recalculate_derived_fields()
+        # Advance derived fields by the new complaint (O(1), no rescan)
+        self._add_to_derived_fields(complaint)
         
         return is_new, duplicate_of, similarity_score
     
     def _find_duplicate(self, new_complaint: Complaint) -> Tuple[Optional[Complaint], float]:
         """Find if complaint is duplicate of existing one. Returns (best_match, similarity_score)"""
-        if not self.complaints or not new_complaint.embedding:
+        if not self.complaints or new_complaint.embedding is None or len(new_complaint.embedding) == 0:
             return None, 0.0
         
         # HARD RULE: Must be same hostel
@@ -88,25 +88,29 @@ class Issue:
         if new_complaint.category != self.category:
             return None, 0.0  # Different category → no duplicate possible
         
-        best_match = None
-        best_score = 0.0
-        
-        for existing in self.complaints:
-            if not existing.embedding:
-                continue
-            
-            # Additional safety check (should already be same hostel/category)
-            if existing.hostel != new_complaint.hostel or existing.category != new_complaint.category:
-                continue  # Skip if somehow different hostel/category
-            
-            score = cosine_similarity(new_complaint.embedding, existing.embedding)
-            
-            if score > best_score:
-                best_score = score
-                best_match = existing
+        # Additional safety check (should already be same hostel/category)
+        candidates = [
+            existing for existing in self.complaints
+            if existing.embedding is not None and len(existing.embedding) > 0
+            and existing.hostel == new_complaint.hostel
+            and existing.category == new_complaint.category
+        ]
+        if not candidates:
+            return None, 0.0
+        
+        # One fused scan over unit rows instead of a cosine call per complaint
+        matrix = np.vstack([existing.embedding for existing in candidates]).astype(np.float32)
+        matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+        query = np.asarray(new_complaint.embedding, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        
+        idx, best = max_cosine(matrix, query)
+        best_score = min(best, 1.0)
+        if best_score <= 0.0:
+            return None, 0.0
         
         if best_score >= self.duplicate_threshold:
-            return best_match, best_score
+            return candidates[idx], best_score
         
         return None, best_score  # Return score even if not duplicate
         
@@ -121,10 +125,24 @@ class Issue:
             return
         
         # Calculate urgency statistics
-        urgency_scores = [get_urgency_score(c.urgency) for c in self.complaints]
-        max_score = max(urgency_scores)
+        max_score, self.urgency_avg = get_urgency_stats(c.urgency for c in self.complaints)
+        self.urgency_max = get_urgency_label(max_score)
+    
+    def _add_to_derived_fields(self, complaint: Complaint):
+        """Running update of derived fields for one appended complaint"""
+        score = get_urgency_score(complaint.urgency)
+        count = self.complaint_count
+        if count == 0:
+            max_score, avg_score = score, float(score)
+        else:
+            max_score = max(get_urgency_score(self.urgency_max), score)
+            avg_score = (self.urgency_avg * count + score) / (count + 1)
+        
+        self.complaint_count = count + 1
+        if not complaint.is_duplicate:
+            self.unique_complaint_count += 1
         self.urgency_max = get_urgency_label(max_score)
-        self.urgency_avg = sum(urgency_scores) / len(urgency_scores)
+        self.urgency_avg = avg_score
     
     def get_complaint_ids(self) -> List[str]:
         """Get all complaint IDs in this issue"""
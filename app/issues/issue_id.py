@@ -4,9 +4,19 @@ Issue ID Utilities
 Day 5.2
 """
 
+import functools
 import hashlib
+import os
 import re
-from typing import Tuple
+import sys
+import threading
+import time
+from typing import Optional, Tuple
+
+# Keys/IDs are pure functions of a small set of (category, hostel) pairs;
+# memoized so the regex + hash work runs once per pair, and interned so
+# dict lookups on them compare by identity
+_KEY_CACHE_SIZE = 1024
 
 def normalize_text(text: str) -> str:
     """Normalize text for consistent hashing"""
@@ -15,6 +25,7 @@ def normalize_text(text: str) -> str:
     text = re.sub(r'\s+', '_', text.strip())
     return text
 
+@functools.lru_cache(maxsize=_KEY_CACHE_SIZE)
 def generate_issue_key(category: str, hostel: str) -> str:
     """
     Stable key used internally for grouping
@@ -22,8 +33,9 @@ def generate_issue_key(category: str, hostel: str) -> str:
     """
     normalized_hostel = normalize_text(hostel)
     normalized_category = normalize_text(category)
-    return f"{normalized_hostel}::{normalized_category}"
+    return sys.intern(f"{normalized_hostel}::{normalized_category}")
 
+@functools.lru_cache(maxsize=_KEY_CACHE_SIZE)
 def generate_issue_id(category: str, hostel: str, sequence: int = None) -> str:
     """
     Public-facing issue ID
@@ -32,7 +44,7 @@ def generate_issue_id(category: str, hostel: str, sequence: int = None) -> str:
     base = f"{hostel}-{category}"
     digest = hashlib.sha1(base.encode()).hexdigest()[:6]
     
-    return f"ISSUE-{normalize_text(hostel)}-{normalize_text(category)}-{digest}"
+    return sys.intern(f"ISSUE-{normalize_text(hostel)}-{normalize_text(category)}-{digest}")
 
 def parse_issue_id(issue_id: str) -> Tuple[str, str, str]:
     """Parse issue ID into components"""
@@ -42,4 +54,91 @@ def parse_issue_id(issue_id: str) -> Tuple[str, str, str]:
         category = parts[2]
         hash_part = parts[3]
         return hostel, category, hash_part
-    return "", "", ""
\ No newline at end of file
+    return "", "", ""
+
+
+class ComplaintIdGenerator:
+    """
+    k-sortable 64-bit complaint IDs:
+    (ms since 2024-01-01) << 22 | worker_id << 12 | sequence
+    
+    IDs from one generator strictly increase, so they are unique within a
+    process: after 4096 IDs in one millisecond (or if the clock steps back)
+    the sequence borrows the next millisecond. Processes are kept apart
+    only by worker_id, so WORKER_ID (0-1023) is required, and must differ
+    per process, whenever more than one process writes complaints to the
+    same database. Unset, the low 10 bits of the pid are used: fine for a
+    single writer, but any two pids 1024 apart collide.
+    
+    Unless given explicitly, worker_id is resolved from the environment
+    on the first next_id() and again after fork(), so pre-fork servers
+    (gunicorn --preload) can set WORKER_ID per worker in a post_fork hook.
+    """
+    
+    EPOCH_MS = 1_704_067_200_000
+    
+    def __init__(self, worker_id: Optional[int] = None):
+        if worker_id is not None:
+            self._check_worker_id(worker_id)
+        self._fixed_worker_id = worker_id
+        self._worker_id = worker_id
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._sequence = 0
+    
+    @staticmethod
+    def _check_worker_id(worker_id: int):
+        if not 0 <= worker_id <= 0x3FF:
+            raise ValueError(f"worker_id must be in 0-1023, got {worker_id}")
+    
+    @staticmethod
+    def _worker_id_from_env() -> int:
+        configured = os.getenv("WORKER_ID")
+        if not configured:
+            return os.getpid() & 0x3FF
+        worker_id = int(configured)
+        ComplaintIdGenerator._check_worker_id(worker_id)
+        return worker_id
+    
+    @property
+    def worker_id(self) -> int:
+        with self._lock:
+            return self._resolve_worker_id()
+    
+    def _resolve_worker_id(self) -> int:
+        # Caller holds self._lock
+        if self._worker_id is None:
+            self._worker_id = self._worker_id_from_env()
+        return self._worker_id
+    
+    def _after_fork_in_child(self):
+        """The child is a new process: new lock, worker_id re-resolved"""
+        self._lock = threading.Lock()
+        self._worker_id = self._fixed_worker_id
+    
+    def next_id(self) -> int:
+        """Next ID from this generator"""
+        with self._lock:
+            worker_id = self._resolve_worker_id()
+            now_ms = time.time_ns() // 1_000_000 - self.EPOCH_MS
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._sequence = 0
+            else:
+                self._sequence = (self._sequence + 1) & 0xFFF
+                if self._sequence == 0:
+                    self._last_ms += 1
+            return (self._last_ms << 22) | (worker_id << 12) | self._sequence
+
+
+_complaint_ids = ComplaintIdGenerator()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_complaint_ids._after_fork_in_child)
+
+def generate_complaint_id() -> str:
+    """
+    Public-facing complaint ID
+    Format: COMP-{HEX} (lowercase hex of the 64-bit ID, currently 15 digits;
+    complaints stored earlier keep their COMP-{8 random hex} IDs)
+    """
+    return f"COMP-{_complaint_ids.next_id():x}"
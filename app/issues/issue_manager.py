@@ -8,6 +8,8 @@ from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 import uuid
 
+import numpy as np
+
 from app.issues.issue import Issue
 from app.issues.complaint import Complaint
 from app.issues.issue_id import generate_issue_id, generate_issue_key
@@ -46,7 +48,7 @@ class IssueManager:
         category: str,
         urgency: str,
         hostel: str,
-        embedding: List[float],
+        embedding: np.ndarray,
         timestamp: Optional[datetime] = None,
         metadata: Optional[Dict] = None,
     ) -> Dict[str, any]:
@@ -204,8 +206,6 @@ class IssueManager:
     
     def get_issues_by_urgency(self, min_urgency: str = "MEDIUM") -> List[Dict]:
         """Get issues filtered by minimum urgency"""
-        from app.issues.urgency_rules import get_urgency_score
-        
         min_score = get_urgency_score(min_urgency)
         filtered = [
             issue for issue in self.issues.values()
@@ -258,7 +258,6 @@ class IssueManager:
             hostels[hostel] = hostels.get(hostel, 0) + issue.complaint_count
             
             # Urgency stats
-            from app.issues.urgency_rules import get_urgency_label
             urgency_label = issue.urgency_max.upper()
             if urgency_label in urgency_counts:
                 urgency_counts[urgency_label] += 1
@@ -339,7 +338,6 @@ class IssueManager:
                 similarity += 0.3
             
             # Urgency similarity
-            from app.issues.urgency_rules import get_urgency_score
             urgency_diff = abs(get_urgency_score(issue.urgency_max) - get_urgency_score(target_issue.urgency_max))
             similarity += max(0, 0.3 - (urgency_diff * 0.1))
             
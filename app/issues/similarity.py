@@ -5,16 +5,19 @@ Day 5.3.1
 """
 
 import numpy as np
-from typing import List
+from typing import List, Union
 
+Vector = Union[List[float], np.ndarray]
 
-def cosine_similarity(a: List[float], b: List[float]) -> float:
+
+def cosine_similarity(a: Vector, b: Vector) -> float:
     """Compute cosine similarity between two vectors"""
-    if not a or not b:
+    if a is None or b is None or len(a) == 0 or len(b) == 0:
         return 0.0
     
-    a_np = np.array(a)
-    b_np = np.array(b)
+    # No copy for float32 ndarrays (the embedder's native output)
+    a_np = np.asarray(a, dtype=np.float32)
+    b_np = np.asarray(b, dtype=np.float32)
     
     # Handle zero vectors
     norm_a = np.linalg.norm(a_np)
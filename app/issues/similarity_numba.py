@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Compiled duplicate-scan kernel
+Best match of a query against an issue's embedding matrix
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    # Optional JIT: fused dot-product + argmax, vectorized and multi-core
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - NumPy fallback
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _row_dots(matrix, query):
+        sims = np.empty(matrix.shape[0], dtype=np.float32)
+        for i in prange(matrix.shape[0]):
+            s = np.float32(0.0)
+            for j in range(matrix.shape[1]):
+                s += matrix[i, j] * query[j]
+            sims[i] = s
+        return sims
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _max_cosine(matrix, query):
+        # Rows are scored in parallel; the argmax runs serially so ties
+        # resolve to the first row, exactly like np.argmax
+        sims = _row_dots(matrix, query)
+        best = -np.inf
+        idx = -1
+        for i in range(sims.shape[0]):
+            if sims[i] > best:
+                best = sims[i]
+                idx = i
+        return idx, best
+else:
+    _max_cosine = None
+
+
+def max_cosine(matrix: np.ndarray, query: np.ndarray) -> Tuple[int, float]:
+    """
+    Index and score of the row most similar to query.
+
+    Both inputs must be L2-normalized float32 (matrix (K, D), query (D,)),
+    so the dot product is the cosine similarity. Returns (-1, -inf) for
+    an empty matrix.
+    """
+    if matrix.shape[0] == 0:
+        return -1, float("-inf")
+
+    if _max_cosine is not None:
+        idx, best = _max_cosine(
+            np.ascontiguousarray(matrix, dtype=np.float32),
+            np.ascontiguousarray(query, dtype=np.float32)
+        )
+        return int(idx), float(best)
+
+    sims = matrix @ query
+    idx = int(sims.argmax())
+    return idx, float(sims[idx])
+
+
+if _max_cosine is not None:
+    # Compile at import so the first duplicate check doesn't pay for the JIT
+    _max_cosine(np.zeros((1, 8), dtype=np.float32), np.zeros(8, dtype=np.float32))
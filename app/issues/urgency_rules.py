@@ -4,6 +4,9 @@ Urgency Rules - Single source of truth
 Day 5.2
 """
 
+from collections import Counter
+from typing import Iterable, Tuple
+
 URGENCY_SCORES = {
     "LOW": 1,
     "MEDIUM": 2,
@@ -11,14 +14,56 @@ URGENCY_SCORES = {
     "CRITICAL": 4,
 }
 
+# Title-case labels as produced by the urgency classifier ("High")
+URGENCY_DISPLAY_LABELS = {score: level.title() for level, score in URGENCY_SCORES.items()}
+
+# Every casing callers actually pass, so the hot path is one dict lookup
+_SCORE_LOOKUP = {
+    **URGENCY_SCORES,
+    **{level.title(): score for level, score in URGENCY_SCORES.items()},
+    **{level.lower(): score for level, score in URGENCY_SCORES.items()},
+}
+_LABEL_LOOKUP = {score: level for level, score in URGENCY_SCORES.items()}
+
+# Display labels indexed by score (slot 0 unused), so labelling is one tuple index
+_DISPLAY_BY_SCORE = (None,) + tuple(URGENCY_DISPLAY_LABELS[s] for s in range(1, len(URGENCY_SCORES) + 1))
+
 def get_urgency_score(level: str) -> int:
     """Convert urgency label to numeric score"""
-    return URGENCY_SCORES.get(level.upper(), 1)
+    score = _SCORE_LOOKUP.get(level)
+    if score is None:
+        # Mixed casing ("hIgh") - normalize like before
+        score = URGENCY_SCORES.get(level.upper(), 1)
+    return score
 
 def get_urgency_label(score: int) -> str:
     """Convert numeric score to label"""
-    reverse = {v: k for k, v in URGENCY_SCORES.items()}
-    return reverse.get(score, "LOW")
+    return _LABEL_LOOKUP.get(score, "LOW")
+
+def get_urgency_display_label(score: int) -> str:
+    """Convert numeric score to title-case label ("High"), "Low" if out of range"""
+    if 1 <= score < len(_DISPLAY_BY_SCORE):
+        return _DISPLAY_BY_SCORE[score]
+    return "Low"
+
+def get_urgency_stats(levels: Iterable[str]) -> Tuple[int, float]:
+    """
+    (max score, mean score) over urgency labels; (1, 1.0) when empty
+    
+    Labels are tallied first, so only each distinct label is scored.
+    """
+    tally = Counter(levels)
+    if not tally:
+        return 1, 1.0
+    
+    max_score = 0
+    total = 0
+    for level, count in tally.items():
+        score = get_urgency_score(level)
+        if score > max_score:
+            max_score = score
+        total += score * count
+    return max_score, total / sum(tally.values())
 
 def get_max_urgency(levels: list) -> str:
     """Return highest urgency from list"""
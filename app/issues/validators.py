@@ -4,9 +4,13 @@ Domain Validators
 Day 5.2
 """
 
-from typing import List
+from typing import List, Union
 import numpy as np
 
+# Shortest complaint worth a model pass; longer texts are truncated
+MIN_TEXT_LENGTH = 3
+MAX_TEXT_LENGTH = 8192
+
 def validate_category(category: str, allowed_categories: List[str] = None) -> None:
     """Validate category"""
     if not category or not isinstance(category, str):
@@ -23,6 +27,11 @@ def validate_hostel(hostel: str) -> None:
     if len(hostel.strip()) < 2:
         raise ValueError("Hostel name too short")
 
+def validate_complaint_text(text: str) -> None:
+    """Validate complaint text (cheap check before classifier/embedder)"""
+    if not text or not isinstance(text, str) or len(text.strip()) < MIN_TEXT_LENGTH:
+        raise ValueError("Complaint text too short")
+
 def validate_complaint_id(cid: str) -> None:
     """Validate complaint ID"""
     if not cid or not isinstance(cid, str):
@@ -31,15 +40,17 @@ def validate_complaint_id(cid: str) -> None:
     if len(cid) < 3:
         raise ValueError("Complaint ID too short")
 
-def validate_embedding(embedding: List[float]) -> None:
+def validate_embedding(embedding: Union[List[float], np.ndarray]) -> None:
     """Validate embedding vector"""
-    if not embedding:
+    if embedding is None or len(embedding) == 0:
         raise ValueError("Embedding cannot be empty")
     
-    if not isinstance(embedding, list):
-        raise ValueError("Embedding must be a list")
-    
-    if not all(isinstance(x, (int, float)) for x in embedding):
+    if isinstance(embedding, np.ndarray):
+        if embedding.ndim != 1 or embedding.dtype.kind not in "fiu":
+            raise ValueError("Embedding must be a 1-D numeric array")
+    elif not isinstance(embedding, list):
+        raise ValueError("Embedding must be a list or numpy array")
+    elif not all(isinstance(x, (int, float)) for x in embedding):
         raise ValueError("Embedding must contain only numbers")
     
     # Check for zero vector
@@ -7,9 +7,16 @@ ENGLISH-ONLY SCOPE: Optimized for English complaint processing.
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 from typing import List, Dict, Any
 from datetime import datetime
 import uvicorn
+
+try:
+    # Optional C serializer for response bodies (falls back to json.dumps)
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 from app.services.issue_service_day7a import get_issue_service_day7a
 from app.middleware.request_context import RequestContextMiddleware
 from app.api.observability import router as observability_router
@@ -35,6 +42,17 @@ issue_service = get_issue_service()
 
 logger = get_logger(__name__)
 
+if orjson is not None:
+    class FastJSONResponse(JSONResponse):
+        """JSONResponse rendered with orjson (non-str keys and numpy allowed)"""
+        
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(
+                content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+else:
+    FastJSONResponse = JSONResponse
+
 # Create FastAPI app
 app = FastAPI(
     title=SERVICE_NAME,
@@ -42,6 +60,7 @@ app = FastAPI(
     description="AI Service for Hostel Complaint Processing with Issue Aggregation (English Scope)",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=FastJSONResponse,
     openapi_tags=[
         {
             "name": "Health",
@@ -291,6 +310,11 @@ async def day5_status():
 from app.api.schemas import ComplaintRequest, ComplaintResponse, BatchComplaintRequest
 from app.api.schemas import IssueSummary, IssueDetails, SystemStats
 
+# ComplaintResponse field names in declaration order (pydantic v2 or v1)
+_COMPLAINT_RESPONSE_FIELDS = tuple(
+    getattr(ComplaintResponse, "model_fields", None) or ComplaintResponse.__fields__
+)
+
 @app.post(
     "/complaints/",
     response_model=ComplaintResponse,
@@ -316,7 +340,11 @@ async def submit_complaint(payload: ComplaintRequest):
         # Use Day 7A service instead of Day 6
         service = get_issue_service_day7a()
         
-        result = service.process_complaint(
+        # Classification, embedding and the DB transaction all block; run
+        # them on the threadpool so the event loop keeps serving requests
+        # (trace is thread-local, request context is copied to the worker)
+        result = await run_in_threadpool(
+            service.process_complaint,
             text=payload.text,
             hostel=payload.hostel,  
             complaint_id=payload.complaint_id,
@@ -330,7 +358,14 @@ async def submit_complaint(payload: ComplaintRequest):
             )
         
         logger.info(f"Complaint submitted successfully: {result['complaint_id']}")
-        return result
+        
+        # The service result is already JSON-ready: project it onto the
+        # declared schema and render it once, skipping FastAPI's response
+        # validation and jsonable_encoder copies
+        return FastJSONResponse(
+            status_code=201,
+            content={field: result.get(field) for field in _COMPLAINT_RESPONSE_FIELDS}
+        )
         
     except ValueError as e:
         logger.warning(f"Validation error: {str(e)}")
@@ -568,7 +603,7 @@ async def embed_text(request: Dict[str, Any]):
         
         return {
             "text": text,
-            "embedding": embedding,
+            "embedding": embedding.tolist(),
             "dimension": len(embedding),
             "valid": is_valid,
             "model": embedding_service.embedder.model_name,
@@ -613,7 +648,7 @@ async def embed_batch(request: Dict[str, Any]):
         
         return {
             "count": len(embeddings),
-            "embeddings": embeddings,
+            "embeddings": [embedding.tolist() for embedding in embeddings],
             "dimension": len(embeddings[0]) if embeddings else 0,
             "validations": validations,
             "all_valid": all(validations),
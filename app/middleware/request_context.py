@@ -11,6 +11,7 @@ import time
 from app.observability.context import (
     generate_request_id,
     set_request_id,
+    stamp_request_time,
     clear_context
 )
 from app.observability.logger import get_logger
@@ -33,9 +34,10 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
         # Generate or extract request ID
         request_id = request.headers.get("X-Request-ID") or generate_request_id()
         set_request_id(request_id)
+        stamp_request_time()
         
         # Track request
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         metrics.counter("http_requests_total").inc()
         
         # Log request
@@ -51,8 +53,8 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
             
             # Calculate latency
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            metrics.histogram("http_request_latency_ms").observe(latency_ms)
+            latency_ns = time.perf_counter_ns() - start_ns
+            metrics.histogram("http_request_latency_ms").observe_ns(latency_ns)
             
             # Log response
             logger.info(
@@ -60,7 +62,7 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
                 method=request.method,
                 path=request.url.path,
                 status_code=response.status_code,
-                latency_ms=round(latency_ms, 2)
+                latency_ms=round(latency_ns / 1_000_000, 2)
             )
             
             # Add request ID to response headers
@@ -9,7 +9,8 @@ from app.observability.metrics import get_metrics
 from app.observability.context import (
     get_request_id,
     set_request_id,
-    generate_request_id
+    generate_request_id,
+    request_now
 )
 from app.observability.trace import get_trace, reset_trace
 
@@ -20,6 +21,7 @@ __all__ = [
     "get_request_id",
     "set_request_id",
     "generate_request_id",
+    "request_now",
     "get_trace",
     "reset_trace"
 ]
\ No newline at end of file
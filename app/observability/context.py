@@ -6,11 +6,13 @@ Day 7B.3 - Thread-safe request ID propagation
 
 import contextvars
 import uuid
+from datetime import datetime
 from typing import Optional
 
 # Context variable for request ID (async-safe)
 _request_id = contextvars.ContextVar("request_id", default=None)
 _user_context = contextvars.ContextVar("user_context", default=None)
+_request_time = contextvars.ContextVar("request_time", default=None)
 
 
 def generate_request_id() -> str:
@@ -28,6 +30,27 @@ def get_request_id() -> Optional[str]:
     return _request_id.get()
 
 
+def stamp_request_time() -> datetime:
+    """Record the request's wall-clock time once (call at request entry)"""
+    now = datetime.utcnow()
+    _request_time.set(now)
+    return now
+
+
+def request_now() -> datetime:
+    """
+    Get the current request's UTC timestamp.
+    
+    Returns the value stamped at request entry so every write in the
+    request shares one consistent "now". Outside a request (scripts,
+    background work) falls back to datetime.utcnow().
+    """
+    now = _request_time.get()
+    if now is None:
+        return datetime.utcnow()
+    return now
+
+
 def set_user_context(context: dict):
     """Set user context (session_id, etc.)"""
     _user_context.set(context)
@@ -41,4 +64,5 @@ def get_user_context() -> Optional[dict]:
 def clear_context():
     """Clear all context (useful for testing)"""
     _request_id.set(None)
-    _user_context.set(None)
\ No newline at end of file
+    _user_context.set(None)
+    _request_time.set(None)
\ No newline at end of file
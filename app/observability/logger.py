@@ -5,11 +5,50 @@ Day 7B.1 - Machine-readable, correlatable logs
 """
 
 import logging
+import functools
+import itertools
 import json
-from datetime import datetime
+import sys
+import time
 from typing import Any, Optional
+from app.config import LOG_SAMPLE_N
 from app.observability.context import get_request_id
 
+try:
+    # Optional C serializer (3-5x faster than json.dumps for log payloads)
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+if orjson is not None:
+    def _dumps(payload: dict) -> str:
+        return orjson.dumps(payload, default=str).decode()
+else:
+    def _dumps(payload: dict) -> str:
+        return json.dumps(payload, default=str)
+
+
+# (epoch_second, "YYYY-MM-DDTHH:MM:SS") - replaced atomically as a tuple
+_ts_cache = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """
+    ISO-8601 UTC timestamp with millisecond resolution.
+    
+    The second-level prefix is formatted once per second and reused;
+    only the millisecond suffix is built per call.
+    """
+    global _ts_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _ts_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _ts_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1000):03d}Z"
+
 
 class StructuredLogger:
     """
@@ -20,18 +59,78 @@ class StructuredLogger:
     - Includes request_id automatically
     - Event-oriented naming
     - Low-cardinality fields
+    
+    Level methods (debug/info/warning/error/critical) are bound per
+    instance in __init__ as partials over _log_fast. info_sampled keeps
+    1 in LOG_SAMPLE_N calls, for routine steps logged on every request.
     """
     
+    # Level name -> stdlib level int (avoids getattr(logging, level) per call)
+    _LEVELS = {
+        "DEBUG": logging.DEBUG,
+        "INFO": logging.INFO,
+        "WARNING": logging.WARNING,
+        "ERROR": logging.ERROR,
+        "CRITICAL": logging.CRITICAL,
+    }
+    
     def __init__(self, name: str):
         self.logger = logging.getLogger(name)
         self.name = name
+        
+        # Bind level-specific entry points once: logger.info(...) goes
+        # straight to _log_fast with the int level already resolved
+        for level_name, level in self._LEVELS.items():
+            setattr(
+                self,
+                level_name.lower(),
+                functools.partial(self._log_fast, level, level_name)
+            )
+        
+        # next() on itertools.count is atomic under the GIL
+        self._sample_counter = itertools.count()
+    
+    def info_sampled(self, event: str, **fields):
+        """INFO event emitted for 1 in LOG_SAMPLE_N calls on this logger"""
+        if next(self._sample_counter) % LOG_SAMPLE_N:
+            return
+        fields["sampled_1_in"] = LOG_SAMPLE_N
+        self._emit(logging.INFO, "INFO", event, fields)
     
     def _log(self, level: str, event: str, **fields):
         """Internal log method with structured format"""
+        self._emit(self._LEVELS[level], level, event, fields)
+    
+    def _log_fast(self, log_level: int, level: str, event: str, **fields):
+        """
+        Emit a structured log record.
+        
+        Args:
+            log_level: Pre-resolved stdlib level int
+            level: Level name written into the payload
+            event: Event name
+            **fields: Additional payload fields
+        """
+        self._emit(log_level, level, event, fields)
+    
+    def _emit(self, log_level: int, level: str, event: str, fields: dict):
+        """
+        Build and handle the record for one event.
+        
+        Must be called directly from the public entry point (level
+        partial, info_sampled, _log): the caller's caller is recorded
+        as the log site.
+        """
+        logger = self.logger
+        
+        # Skip payload construction entirely when the level is filtered out
+        if not logger.isEnabledFor(log_level):
+            return
+        
         request_id = get_request_id()
         
         payload = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
             "level": level,
             "event": event,
             "source": self.name,
@@ -42,25 +141,16 @@ class StructuredLogger:
         if request_id:
             payload["request_id"] = request_id
         
-        # Use standard logging with JSON payload
-        log_level = getattr(logging, level)
-        self.logger.log(log_level, json.dumps(payload))
-    
-    def info(self, event: str, **fields):
-        """Log INFO level event"""
-        self._log("INFO", event, **fields)
-    
-    def warning(self, event: str, **fields):
-        """Log WARNING level event"""
-        self._log("WARNING", event, **fields)
-    
-    def error(self, event: str, **fields):
-        """Log ERROR level event"""
-        self._log("ERROR", event, **fields)
-    
-    def critical(self, event: str, **fields):
-        """Log CRITICAL level event"""
-        self._log("CRITICAL", event, **fields)
+        # Build the record directly and hand it to handlers (skips
+        # Logger.log's re-check of the level and its findCaller stack walk;
+        # the log site is a fixed two frames up)
+        caller = sys._getframe(2)
+        code = caller.f_code
+        record = logger.makeRecord(
+            logger.name, log_level, code.co_filename, caller.f_lineno,
+            _dumps(payload), None, None, code.co_name
+        )
+        logger.handle(record)
 
 
 def get_structured_logger(name: str) -> StructuredLogger:
@@ -5,7 +5,7 @@ Day 7B.2 - System behavior quantification
 """
 
 from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Dict, List
 import time
 import threading
 from datetime import datetime
@@ -76,6 +76,12 @@ class Histogram:
         with self._lock:
             self._values.append(value)
     
+    def observe_ns(self, elapsed_ns: int):
+        """Record a duration measured with time.perf_counter_ns() (stored as ms)"""
+        value = elapsed_ns / 1_000_000
+        with self._lock:
+            self._values.append(value)
+    
     def get_stats(self) -> Dict[str, float]:
         """Calculate statistics"""
         with self._lock:
@@ -139,20 +145,21 @@ class MetricsRegistry:
         self._lock = threading.Lock()
         self._created_at = datetime.utcnow()
     
+    # Lookups are lock-free: a defaultdict get-or-create on a str key is a
+    # single C-level operation under the GIL. Readers iterate over list()
+    # copies so concurrent creation never mutates a dict mid-iteration.
+    
     def counter(self, name: str) -> Counter:
         """Get or create counter"""
-        with self._lock:
-            return self._counters[name]
+        return self._counters[name]
     
     def gauge(self, name: str) -> Gauge:
         """Get or create gauge"""
-        with self._lock:
-            return self._gauges[name]
+        return self._gauges[name]
     
     def histogram(self, name: str) -> Histogram:
         """Get or create histogram"""
-        with self._lock:
-            return self._histograms[name]
+        return self._histograms[name]
     
     def get_snapshot(self) -> Dict:
         """Get all metrics snapshot"""
@@ -160,15 +167,15 @@ class MetricsRegistry:
             return {
                 "counters": {
                     name: counter.value
-                    for name, counter in self._counters.items()
+                    for name, counter in list(self._counters.items())
                 },
                 "gauges": {
                     name: gauge.value
-                    for name, gauge in self._gauges.items()
+                    for name, gauge in list(self._gauges.items())
                 },
                 "histograms": {
                     name: histogram.get_stats()
-                    for name, histogram in self._histograms.items()
+                    for name, histogram in list(self._histograms.items())
                 },
                 "meta": {
                     "created_at": self._created_at.isoformat(),
@@ -179,20 +186,17 @@ class MetricsRegistry:
     def reset_all(self):
         """Reset all metrics (testing only)"""
         with self._lock:
-            for counter in self._counters.values():
+            for counter in list(self._counters.values()):
                 counter.reset()
-            for histogram in self._histograms.values():
+            for histogram in list(self._histograms.values()):
                 histogram.reset()
             self._created_at = datetime.utcnow()
 
 
-# Singleton instance
-_metrics: Optional[MetricsRegistry] = None
+# Singleton instance (created at import time - no check-then-set race)
+_metrics: MetricsRegistry = MetricsRegistry()
 
 
 def get_metrics() -> MetricsRegistry:
     """Get singleton metrics registry"""
-    global _metrics
-    if _metrics is None:
-        _metrics = MetricsRegistry()
     return _metrics
\ No newline at end of file
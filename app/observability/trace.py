@@ -5,7 +5,9 @@ Day 7B.3 - Timeline reconstruction for debugging
 """
 
 import time
-from typing import List, Tuple, Optional
+from array import array
+from typing import Dict, List, Tuple, Optional
+from app.config import ENABLE_TRACING
 from app.observability.context import get_request_id
 
 
@@ -18,16 +20,52 @@ class Trace:
         trace.mark("duplicate_check_end")
     
     Only enabled in debug mode.
+    
+    Storage is a preallocated ring buffer: event ids (interned names)
+    and elapsed integer nanoseconds live in two fixed-size arrays, so
+    mark() does no per-call allocation or float math. Once CAPACITY
+    marks are exceeded the oldest events are overwritten.
     """
     
+    CAPACITY = 128
+    
     def __init__(self):
-        self.events: List[Tuple[str, float]] = []
-        self.start_time = time.perf_counter()
+        self._ids = array("H", [0]) * self.CAPACITY
+        self._times = array("q", [0]) * self.CAPACITY
+        self._n = 0
+        
+        # Event name interning (shared across resets of this trace)
+        self._names: List[str] = []
+        self._event_ids: Dict[str, int] = {}
+        
+        self.start_ns = time.perf_counter_ns()
     
     def mark(self, event_name: str):
         """Mark event in trace"""
-        elapsed = (time.perf_counter() - self.start_time) * 1000  # ms
-        self.events.append((event_name, elapsed))
+        elapsed = time.perf_counter_ns() - self.start_ns
+        
+        idx = self._event_ids.get(event_name)
+        if idx is None:
+            idx = len(self._names)
+            self._names.append(event_name)
+            self._event_ids[event_name] = idx
+        
+        slot = self._n % self.CAPACITY
+        self._ids[slot] = idx
+        self._times[slot] = elapsed
+        self._n += 1
+    
+    @property
+    def events(self) -> List[Tuple[str, float]]:
+        """Recorded (event_name, elapsed_ms) pairs, oldest first"""
+        n = self._n
+        capacity = self.CAPACITY
+        first = max(0, n - capacity)
+        names = self._names
+        return [
+            (names[self._ids[i % capacity]], self._times[i % capacity] / 1_000_000)
+            for i in range(first, n)
+        ]
     
     def get_timeline(self) -> List[dict]:
         """Get formatted timeline"""
@@ -41,17 +79,29 @@ class Trace:
     
     def reset(self):
         """Reset trace"""
-        self.events = []
-        self.start_time = time.perf_counter()
+        self._n = 0
+        self.start_ns = time.perf_counter_ns()
+
+
+class NullTrace(Trace):
+    """Trace that records nothing (ENABLE_TRACING=false)"""
+    
+    def mark(self, event_name: str):
+        pass
 
 
 # Thread-local trace instance
 import threading
 _local = threading.local()
 
+# Shared by every thread when tracing is off - it holds no events
+_null_trace = NullTrace()
+
 
 def get_trace() -> Trace:
-    """Get thread-local trace instance"""
+    """Get thread-local trace instance (a shared no-op one when disabled)"""
+    if not ENABLE_TRACING:
+        return _null_trace
     if not hasattr(_local, 'trace'):
         _local.trace = Trace()
     return _local.trace
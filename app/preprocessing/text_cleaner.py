@@ -1,6 +1,12 @@
 import re
 from typing import List, Optional
 
+try:
+    # Optional C extension: single linear scan for all dictionary keys
+    import ahocorasick
+except ImportError:  # pragma: no cover - falls back to a compiled regex
+    ahocorasick = None
+
 class HinglishNormalizer:
     """Normalizer for Hinglish text (Hindi+English mix)"""
     
@@ -39,7 +45,13 @@ class HinglishNormalizer:
     
     @staticmethod
     def normalize_hinglish(text: str) -> str:
-        """Apply Hinglish normalization rules[citation:10]"""
+        """
+        Apply Hinglish normalization rules[citation:10]
+        
+        Dictionary keys are replaced in one left-to-right scan: where keys
+        overlap, the one starting first wins, then the longest ("thikyu"
+        -> "theekyu"). Replacements are never rescanned.
+        """
         if not text:
             return ""
             
@@ -49,11 +61,8 @@ class HinglishNormalizer:
         for pattern, replacement in HinglishNormalizer.CONTEXT_PATTERNS:
             text = re.sub(pattern, replacement, text)
         
-        # Apply dictionary replacements (in order)
-        for k, v in HinglishNormalizer.HINGLISH_MAP.items():
-            text = text.replace(k, v)
-        
-        return text
+        # Apply dictionary replacements (single pass over the text)
+        return _replace_hinglish_keys(text)
     
     @staticmethod
     def clean_whitespace(text: str) -> str:
@@ -64,6 +73,76 @@ class HinglishNormalizer:
         text = text.strip()
         return text
 
+# Identity entries (e.g. "hostel": "hostel") are no-ops for sequential
+# str.replace, so they must not consume text in a single-pass scan either.
+_HINGLISH_REPLACEMENTS = {
+    key: value
+    for key, value in HinglishNormalizer.HINGLISH_MAP.items()
+    if key != value
+}
+
+
+def _build_hinglish_automaton():
+    """Build the Aho-Corasick automaton for HINGLISH_MAP (None if unavailable)"""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for key, value in _HINGLISH_REPLACEMENTS.items():
+        automaton.add_word(key, (len(key), value))
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import time and shared by preprocess_text / batch_preprocess
+_HINGLISH_AUTOMATON = _build_hinglish_automaton()
+
+def _build_hinglish_pattern():
+    """
+    Compile HINGLISH_MAP keys into one alternation, longest key first.
+    
+    At each position the regex engine takes the first alternative that
+    matches, so ordering by length gives the same leftmost-longest,
+    non-overlapping matches as the automaton's iter_long. Used when
+    pyahocorasick is not installed.
+    """
+    keys = sorted(_HINGLISH_REPLACEMENTS, key=len, reverse=True)
+    return re.compile("|".join(re.escape(key) for key in keys))
+
+
+_HINGLISH_PATTERN = _build_hinglish_pattern()
+
+
+def _replace_with_pattern(text: str) -> str:
+    """Fallback scan: one regex pass over the text"""
+    return _HINGLISH_PATTERN.sub(
+        lambda match: _HINGLISH_REPLACEMENTS[match.group()], text
+    )
+
+
+def _replace_with_automaton(text: str) -> str:
+    """Aho-Corasick scan: leftmost-longest, non-overlapping matches"""
+    parts = []
+    last = 0
+    for end, (length, value) in _HINGLISH_AUTOMATON.iter_long(text):
+        start = end - length + 1
+        parts.append(text[last:start])
+        parts.append(value)
+        last = end + 1
+    
+    if not parts:
+        return text
+    
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+def _replace_hinglish_keys(text: str) -> str:
+    """Replace all HINGLISH_MAP keys in one scan (automaton or regex)"""
+    if _HINGLISH_AUTOMATON is None:
+        return _replace_with_pattern(text)
+    return _replace_with_automaton(text)
+
 def preprocess_text(text: str, normalize_hinglish: bool = True) -> str:
     """
     Main preprocessing function for complaint text.
@@ -89,8 +168,25 @@ def preprocess_text(text: str, normalize_hinglish: bool = True) -> str:
     return cleaned_text
 
 def batch_preprocess(texts: List[str], normalize_hinglish: bool = True) -> List[str]:
-    """Preprocess multiple texts efficiently"""
-    return [preprocess_text(text, normalize_hinglish) for text in texts]
+    """
+    Preprocess multiple texts efficiently.
+    
+    Dictionary substitution runs through the shared automaton built at
+    import time, so each text is scanned once regardless of map size.
+    """
+    clean = HinglishNormalizer.clean_whitespace
+    
+    if not normalize_hinglish:
+        return [
+            clean(text) if text and isinstance(text, str) else ""
+            for text in texts
+        ]
+    
+    normalize = HinglishNormalizer.normalize_hinglish
+    return [
+        normalize(clean(text)) if text and isinstance(text, str) else ""
+        for text in texts
+    ]
 
 # Example usage
 if __name__ == "__main__":
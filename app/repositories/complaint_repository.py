@@ -4,16 +4,41 @@ Complaint Repository
 Day 6.2 - Database operations for complaints
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import case, func, insert, update
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from app.db.models.complaint import ComplaintModel
+from app.issues.urgency_rules import URGENCY_SCORES
+from app.observability.context import request_now
+from app.repositories.issue_read_cache import mark_issues_written
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def pack_embedding_i8(embedding: np.ndarray) -> bytes:
+    """
+    embedding_i8 column value: float32 scale + symmetric int8 components
+    
+    A quarter of the float32 size; for unit-norm vectors the decoded
+    cosine is within ~0.5% of the original.
+    """
+    embedding = np.asarray(embedding, dtype=np.float32)
+    scale = np.float32(max(float(np.abs(embedding).max()), 1e-12) / 127.0)
+    quantized = np.round(embedding / scale).astype(np.int8)
+    return scale.tobytes() + quantized.tobytes()
+
+
+def unpack_embedding(packed_i8: bytes) -> np.ndarray:
+    """float32 vector from an embedding_i8 column value"""
+    scale = np.frombuffer(packed_i8, dtype=np.float32, count=1)[0]
+    return np.frombuffer(packed_i8, dtype=np.int8, offset=4).astype(np.float32) * scale
+
+
 class ComplaintRepository:
     """Repository for complaint database operations"""
     
@@ -28,6 +53,32 @@ class ComplaintRepository:
         logger.info(f"Complaint created: {complaint.id}")
         return complaint
     
+    def insert(self, complaint_data: dict):
+        """
+        Insert one complaint with a Core INSERT
+        
+        For write paths that never touch the complaint as an object: skips
+        ORM instance construction, identity-map and unit-of-work tracking.
+        Use create() when the ORM object is needed.
+        """
+        self.db.execute(insert(ComplaintModel), complaint_data)
+        mark_issues_written(self.db, (complaint_data["issue_id"],))
+        logger.info(f"Complaint created: {complaint_data['id']}")
+    
+    def bulk_create(self, rows: List[dict]) -> int:
+        """
+        Insert many complaints with one executemany INSERT
+        
+        Core insert (insertmanyvalues), so no ORM objects are built or
+        tracked; column defaults still apply. Returns the row count.
+        """
+        if not rows:
+            return 0
+        self.db.execute(insert(ComplaintModel), rows)
+        mark_issues_written(self.db, {row["issue_id"] for row in rows})
+        logger.info(f"Complaints bulk created: {len(rows)}")
+        return len(rows)
+    
     def get_by_id(self, complaint_id: str) -> Optional[ComplaintModel]:
         """Get complaint by ID"""
         return self.db.query(ComplaintModel).filter(
@@ -40,6 +91,57 @@ class ComplaintRepository:
             ComplaintModel.issue_id == issue_id
         ).order_by(ComplaintModel.created_at.desc()).limit(limit).all()
     
+    def get_embeddings_by_issue(
+        self, issue_id: str, limit: int = 100
+    ) -> List[Tuple[str, np.ndarray]]:
+        """(complaint id, float32 embedding) for an issue, newest first"""
+        rows = self.db.query(
+            ComplaintModel.id,
+            ComplaintModel.embedding_i8
+        ).filter(
+            ComplaintModel.issue_id == issue_id,
+            ComplaintModel.embedding_i8.isnot(None)
+        ).order_by(ComplaintModel.created_at.desc()).limit(limit).all()
+        return [
+            (complaint_id, unpack_embedding(packed_i8))
+            for complaint_id, packed_i8 in rows
+        ]
+    
+    def get_unembedded_by_issue(
+        self, issue_id: str, min_text_length: int, limit: int = 16
+    ) -> List[Tuple[str, str]]:
+        """(complaint id, text) of an issue's complaints stored without an embedding"""
+        return [
+            tuple(row) for row in self.db.query(
+                ComplaintModel.id,
+                ComplaintModel.text
+            ).filter(
+                ComplaintModel.issue_id == issue_id,
+                ComplaintModel.embedding_i8.is_(None),
+                func.length(ComplaintModel.text) >= min_text_length
+            ).order_by(ComplaintModel.created_at.desc()).limit(limit).all()
+        ]
+    
+    def set_embeddings_i8(self, embeddings: List[Tuple[str, np.ndarray]]):
+        """Store embedding_i8 for existing complaints (one executemany UPDATE)"""
+        if not embeddings:
+            return
+        self.db.execute(update(ComplaintModel), [
+            {"id": complaint_id, "embedding_i8": pack_embedding_i8(embedding)}
+            for complaint_id, embedding in embeddings
+        ])
+    
+    def find_same_text(self, issue_id: str, text: str) -> Optional[str]:
+        """
+        Id of the earliest complaint of an issue with the same text
+        (case-insensitive, ignoring surrounding whitespace), or None
+        """
+        row = self.db.query(ComplaintModel.id).filter(
+            ComplaintModel.issue_id == issue_id,
+            func.lower(func.trim(ComplaintModel.text)) == text.strip().lower()
+        ).order_by(ComplaintModel.created_at).first()
+        return row[0] if row else None
+    
     def get_by_session(self, session_id: str) -> List[ComplaintModel]:
         """Get all complaints for a session"""
         return self.db.query(ComplaintModel).filter(
@@ -48,7 +150,7 @@ class ComplaintRepository:
     
     def get_recent(self, hours: int = 24, limit: int = 100) -> List[ComplaintModel]:
         """Get recent complaints"""
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
+        cutoff = request_now() - timedelta(hours=hours)
         return self.db.query(ComplaintModel).filter(
             ComplaintModel.created_at >= cutoff
         ).order_by(ComplaintModel.created_at.desc()).limit(limit).all()
@@ -60,18 +162,40 @@ class ComplaintRepository:
         ).count()
     
     def count_duplicates_by_issue(self, issue_id: str) -> int:
-        """Count duplicate complaints for an issue"""
+        """Count duplicate complaints for an issue (served by ix_complaint_issue_dup)"""
         return self.db.query(ComplaintModel).filter(
             ComplaintModel.issue_id == issue_id,
             ComplaintModel.is_duplicate == True
         ).count()
     
+    def urgency_stats_by_issue_exact(self, issue_id: str) -> Tuple[int, float]:
+        """
+        Recount (max urgency score, average urgency score) for an issue
+        
+        Aggregated in SQL so no complaint rows reach Python; unknown labels
+        score 1 like get_urgency_score. Returns (1, 1.0) for an empty issue.
+        """
+        score = case(URGENCY_SCORES, value=func.upper(ComplaintModel.urgency), else_=1)
+        max_score, avg_score = self.db.query(
+            func.max(score), func.avg(score)
+        ).filter(
+            ComplaintModel.issue_id == issue_id
+        ).one()
+        if max_score is None:
+            return 1, 1.0
+        return int(max_score), float(avg_score)
+    
     def get_statistics(self) -> dict:
         """Get overall complaint statistics"""
-        total_complaints = self.db.query(ComplaintModel).count()
-        duplicates = self.db.query(ComplaintModel).filter(
-            ComplaintModel.is_duplicate == True
-        ).count()
+        # One scan: total and duplicate counts together
+        total_complaints, duplicates = self.db.query(
+            func.count(ComplaintModel.id),
+            func.coalesce(
+                func.sum(case((ComplaintModel.is_duplicate == True, 1), else_=0)),
+                0
+            )
+        ).one()
+        duplicates = int(duplicates)
         
         return {
             "total_complaints": total_complaints,
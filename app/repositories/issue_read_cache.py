@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Issue Read Cache
+Short-lived, process-wide cache of get_issue/get_issues results
+
+Invalidation follows the database, not the service: every Session that
+flushes issue or complaint rows (or marks them with mark_issues_written
+for Core writes) drops the affected entries once its transaction commits,
+so writes through any service version - including the Day 6 admin status
+endpoint - are seen by the next read in this process. Other workers'
+writes show up within ISSUE_READ_CACHE_TTL_SECONDS.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.db.models.complaint import ComplaintModel
+from app.db.models.issue import IssueModel
+
+__all__ = [
+    "ISSUE_READ_CACHE_SIZE",
+    "ISSUE_READ_CACHE_TTL_SECONDS",
+    "IssueReadCache",
+    "issue_read_cache",
+    "mark_issues_written",
+]
+
+ISSUE_READ_CACHE_TTL_SECONDS = 5.0
+ISSUE_READ_CACHE_SIZE = 256
+
+# session.info key holding the issue ids written in the current transaction
+_WRITTEN_KEY = "issue_read_cache_written"
+
+
+class IssueReadCache:
+    """
+    ("issue", id) / ("issues", *filters) -> result, with TTL and LRU bounds
+    
+    Results are deep-copied in and out, so callers may mutate what they
+    get. Every invalidation bumps a generation counter; a read takes the
+    generation before querying and its put is dropped if an invalidation
+    happened meanwhile, so a slow read cannot re-insert a stale row.
+    """
+    
+    def __init__(
+        self,
+        ttl_seconds: float = ISSUE_READ_CACHE_TTL_SECONDS,
+        max_size: int = ISSUE_READ_CACHE_SIZE
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def generation(self) -> int:
+        """Take before querying; pass to put()"""
+        return self._generation
+    
+    def get(self, key: tuple) -> Optional[Any]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            if time.monotonic() - cached[0] >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            value = cached[1]
+        return copy.deepcopy(value)
+    
+    def put(self, key: tuple, value: Any, generation: int):
+        value = copy.deepcopy(value)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, issue_ids: Iterable[str]):
+        """Drop cached reads of these issues and every cached listing"""
+        with self._lock:
+            self._generation += 1
+            for issue_id in issue_ids:
+                self._entries.pop(("issue", issue_id), None)
+            for key in [key for key in self._entries if key[0] == "issues"]:
+                del self._entries[key]
+    
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+issue_read_cache = IssueReadCache()
+
+
+def mark_issues_written(session: Session, issue_ids: Iterable[str]):
+    """Record issues changed by Core statements the flush hook cannot see"""
+    session.info.setdefault(_WRITTEN_KEY, set()).update(issue_ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_written_issues(session: Session, flush_context):
+    written = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, IssueModel):
+            written.add(obj.id)
+        elif isinstance(obj, ComplaintModel):
+            written.add(obj.issue_id)
+    if written:
+        mark_issues_written(session, written)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_written_issues(session: Session):
+    written = session.info.pop(_WRITTEN_KEY, None)
+    if written:
+        issue_read_cache.invalidate(written)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_written_issues(session: Session, previous_transaction):
+    # Savepoint rollbacks keep the marks: invalidating too much is harmless
+    if previous_transaction.parent is None:
+        session.info.pop(_WRITTEN_KEY, None)
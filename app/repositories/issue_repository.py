@@ -4,16 +4,30 @@ Enhanced Issue Repository
 Day 7A.3 - Row-level locking for concurrency safety
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
+from typing import List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError
-from datetime import datetime
 
 from app.db.models.issue import IssueModel, IssueStatus
+from app.issues.urgency_rules import get_urgency_display_label, get_urgency_score
+from app.observability.context import request_now
+from app.repositories.issue_read_cache import mark_issues_written
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+__all__ = ["IssueRepository"]
+
+# Dialects with INSERT ... ON CONFLICT DO NOTHING ... RETURNING
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+# Status strings resolved once (skips enum attribute access per call)
+_ALL_STATUS_VALUES = tuple(status.value for status in IssueStatus)
+
 
 class IssueRepository:
     """
@@ -95,6 +109,43 @@ class IssueRepository:
         
         return query.first()
     
+    def get_or_create_for_update(self, issue_data: dict) -> Tuple[IssueModel, bool]:
+        """
+        Locked issue for (hostel, category), created from issue_data if missing
+        
+        Existing issues cost one SELECT ... FOR UPDATE. A miss inserts with
+        ON CONFLICT DO NOTHING RETURNING, so losing a creation race re-reads
+        the winner's row instead of raising IntegrityError and rolling back
+        the caller's transaction. Other dialects fall back to create().
+        
+        Returns: (issue, created)
+        """
+        hostel = issue_data["hostel"]
+        category = issue_data["category"]
+        
+        issue = self.get_by_hostel_category(hostel, category, for_update=True)
+        if issue is not None:
+            return issue, False
+        
+        make_insert = _UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if make_insert is None:
+            return self.create(issue_data), True
+        
+        stmt = (
+            make_insert(IssueModel)
+            .values(**issue_data)
+            .on_conflict_do_nothing(index_elements=["hostel", "category"])
+            .returning(IssueModel)
+        )
+        issue = self.db.scalars(stmt).first()
+        if issue is not None:
+            mark_issues_written(self.db, (issue.id,))
+            logger.info(f"Issue created: {issue.id}")
+            return issue, True
+        
+        # Another transaction created it first; wait for and lock its row
+        return self.get_by_hostel_category(hostel, category, for_update=True), False
+    
     def get_all(
         self,
         status: Optional[IssueStatus] = None,
@@ -124,16 +175,66 @@ class IssueRepository:
         query = query.order_by(IssueModel.last_updated.desc())
         
         # Day 7A.2: Eager load to avoid N+1 queries
+        # selectinload: one extra "WHERE issue_id IN (...)" query instead of
+        # a JOIN that repeats every issue column once per complaint row
         if eager_load_complaints:
-            query = query.options(joinedload(IssueModel.complaints))
+            query = query.options(selectinload(IssueModel.complaints))
         
         return query.limit(limit).all()
     
+    # Columns read by the intelligence engines and dashboard formatters
+    LITE_COLUMNS = (
+        IssueModel.id,
+        IssueModel.hostel,
+        IssueModel.category,
+        IssueModel.status,
+        IssueModel.urgency_max,
+        IssueModel.urgency_avg,
+        IssueModel.complaint_count,
+        IssueModel.unique_complaint_count,
+        IssueModel.duplicate_count,
+        IssueModel.created_at,
+        IssueModel.last_updated,
+        IssueModel.resolved_at,
+    )
+    
+    def get_all_lite(
+        self,
+        status: Optional[IssueStatus] = None,
+        hostel: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: Optional[int] = 100
+    ) -> List[Row]:
+        """
+        Read-only variant of get_all returning column rows, not ORM objects
+        (limit=None returns every matching issue)
+        
+        Rows expose the same attribute names as IssueModel (issue.id,
+        issue.status, ...) so they can be passed to the intelligence
+        engines unchanged, but skip identity-map insertion and
+        relationship instrumentation. Do not use for writes.
+        """
+        query = self.db.query(*self.LITE_COLUMNS)
+        
+        if status:
+            query = query.filter(IssueModel.status == status.value)
+        if hostel:
+            query = query.filter(IssueModel.hostel == hostel)
+        if category:
+            query = query.filter(IssueModel.category == category)
+        
+        query = query.order_by(IssueModel.last_updated.desc())
+        
+        if limit is not None:
+            query = query.limit(limit)
+        
+        return query.all()
+    
     def update(self, issue: IssueModel) -> IssueModel:
         """Update issue (timestamp auto-updated)"""
-        issue.last_updated = datetime.utcnow()
+        issue.last_updated = request_now()
         self.db.flush()
-        logger.debug(f"Issue updated: {issue.id}")
+        logger.debug("Issue updated: %s", issue.id)
         return issue
     
     def update_status(
@@ -151,16 +252,18 @@ class IssueRepository:
         if not issue:
             return None
         
-        issue.status = status.value
-        issue.last_updated = datetime.utcnow()
+        status_value = status.value
+        issue.status = status_value
+        issue.last_updated = request_now()
         
-        if status == IssueStatus.RESOLVED:
-            issue.resolved_at = datetime.utcnow()
-        elif status == IssueStatus.REOPENED:
+        # Identity compare on the enum member
+        if status is IssueStatus.RESOLVED:
+            issue.resolved_at = issue.last_updated
+        elif status is IssueStatus.REOPENED:
             issue.resolved_at = None
         
         self.db.flush()
-        logger.info(f"Issue {issue_id} status changed to {status.value}")
+        logger.info(f"Issue {issue_id} status changed to {status_value}")
         return issue
     
     def increment_counts(
@@ -184,7 +287,55 @@ class IssueRepository:
         
         issue.urgency_max = urgency
         issue.urgency_avg = urgency_avg
-        issue.last_updated = datetime.utcnow()
+        issue.last_updated = request_now()
+        
+        self.db.flush()
+    
+    def increment_counts_incremental(
+        self,
+        issue: IssueModel,
+        is_duplicate: bool,
+        urgency_score: int
+    ):
+        """
+        Increment issue complaint counts with a running urgency update
+        
+        urgency_max/urgency_avg are advanced from the stored counters, so
+        no complaint rows are read. Same locking contract as increment_counts.
+        """
+        self.increment_counts_batch(issue, [is_duplicate], [urgency_score])
+    
+    def increment_counts_batch(
+        self,
+        issue: IssueModel,
+        duplicate_flags: List[bool],
+        urgency_scores: List[int]
+    ):
+        """
+        Add several complaints to an issue's counters in one update
+        
+        Running urgency update as in increment_counts_incremental; should
+        be called within transaction with row lock.
+        """
+        added = len(urgency_scores)
+        if not added:
+            return
+        
+        count = issue.complaint_count
+        duplicates = sum(duplicate_flags)
+        max_score = max(urgency_scores)
+        if count:
+            max_score = max(get_urgency_score(issue.urgency_max), max_score)
+            avg_score = (issue.urgency_avg * count + sum(urgency_scores)) / (count + added)
+        else:
+            avg_score = sum(urgency_scores) / added
+        
+        issue.complaint_count = count + added
+        issue.unique_complaint_count += added - duplicates
+        issue.duplicate_count += duplicates
+        issue.urgency_max = get_urgency_display_label(max_score)
+        issue.urgency_avg = avg_score
+        issue.last_updated = request_now()
         
         self.db.flush()
     
@@ -194,15 +345,16 @@ class IssueRepository:
         
         Day 7A.2: Optimized with status index
         """
-        total_issues = self.db.query(IssueModel).count()
+        # Single GROUP BY over ix_issue_status instead of one COUNT per status
+        rows = self.db.query(
+            IssueModel.status, func.count(IssueModel.id)
+        ).group_by(IssueModel.status).all()
         
-        status_counts = {}
-        for status in IssueStatus:
-            # Day 7A.2: Uses ix_issue_status index
-            count = self.db.query(IssueModel).filter(
-                IssueModel.status == status.value
-            ).count()
-            status_counts[status.value] = count
+        status_counts = dict.fromkeys(_ALL_STATUS_VALUES, 0)
+        total_issues = 0
+        for status, count in rows:
+            status_counts[status] = count
+            total_issues += count
         
         return {
             "total_issues": total_issues,
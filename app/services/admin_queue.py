@@ -4,8 +4,16 @@ Admin Queue Service
 Day 8.3 - Builds prioritized issue queue for admins
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
+from heapq import nlargest
+import json
+
+try:
+    # Optional C serializer for the dashboard payload
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 from app.intelligence.issue_health import IssueHealthScorer
 from app.intelligence.severity import IssueSeverityEngine
@@ -16,6 +24,11 @@ from app.observability.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _priority_key(record: Dict) -> float:
+    """Sort key for enriched records"""
+    return record["priority"]["priority_score"]
+
+
 class AdminQueueService:
     """
     Builds and sorts the admin priority queue.
@@ -28,32 +41,41 @@ class AdminQueueService:
     """
 
     @classmethod
-    def build(cls, issues: List) -> List[Dict]:
+    def build(cls, issues: List, top_k: Optional[int] = None) -> List[Dict]:
         """
         Build priority queue from issues.
         
         Args:
-            issues: List of IssueModel instances
+            issues: IssueModel instances or IssueRepository.get_all_lite rows
+            top_k: If set, only the top_k highest-priority issues are kept
+                (heap selection, O(N log K) instead of a full sort)
             
         Returns:
             List of enriched issues sorted by priority (descending)
         """
+        compute_health = IssueHealthScorer.compute
+        compute_severity = IssueSeverityEngine.compute
+        evaluate_sla = SLARiskEngine.evaluate
+        compute_priority = IssuePriorityEngine.compute
+        
         enriched = []
+        append = enriched.append
 
         for issue in issues:
-            # Compute intelligence signals
-            health = IssueHealthScorer.compute(issue)
-            severity = IssueSeverityEngine.compute(issue)
-            sla = SLARiskEngine.evaluate(issue, severity["numeric"])
-            priority = IssuePriorityEngine.compute(
+            # Compute intelligence signals (severity feeds SLA + priority)
+            health = compute_health(issue)
+            severity = compute_severity(issue)
+            severity_numeric = severity["numeric"]
+            sla = evaluate_sla(issue, severity_numeric)
+            priority = compute_priority(
                 issue,
-                severity_numeric=severity["numeric"],
-                health_score=health["score"],
-                sla_risk=sla["risk"]
+                severity_numeric,
+                health["score"],
+                sla["risk"]
             )
 
             # Build enriched record
-            enriched.append({
+            append({
                 "issue": issue,
                 "health": health,
                 "severity": severity,
@@ -62,11 +84,10 @@ class AdminQueueService:
             })
 
         # Sort by priority score (descending)
-        sorted_queue = sorted(
-            enriched,
-            key=lambda x: x["priority"]["priority_score"],
-            reverse=True
-        )
+        if top_k is not None and top_k < len(enriched):
+            sorted_queue = nlargest(top_k, enriched, key=_priority_key)
+        else:
+            sorted_queue = sorted(enriched, key=_priority_key, reverse=True)
 
         logger.info(
             "admin_queue_built",
@@ -136,4 +157,30 @@ class AdminQueueService:
                 }
             })
 
-        return formatted
\ No newline at end of file
+        return formatted
+    
+    @classmethod
+    def to_api_json(cls, enriched_issues: List[Dict], generated_at: datetime) -> bytes:
+        """
+        Serialize the priority queue response straight to JSON bytes.
+        
+        Lets the endpoint return a raw Response and skip FastAPI's
+        recursive jsonable_encoder pass over every nested issue dict.
+        
+        Args:
+            enriched_issues: List of enriched issue records
+            generated_at: Response generation timestamp
+            
+        Returns:
+            UTF-8 JSON body: {generated_at, count, issues}
+        """
+        formatted = cls.to_api_format(enriched_issues)
+        body = {
+            "generated_at": generated_at.isoformat(),
+            "count": len(formatted),
+            "issues": formatted
+        }
+        
+        if orjson is not None:
+            return orjson.dumps(body)
+        return json.dumps(body).encode()
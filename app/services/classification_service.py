@@ -3,10 +3,21 @@
 Enhanced Classification Service with Day 4.3/4.4 integration.
 Provides complete complaint analysis: Category + Urgency.
 """
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
-from app.classification.similarity_classifier import get_classifier
+import numpy as np
+
+from app.classification.result import ClassificationResult
+from app.classification.similarity_classifier import get_classifier, unit_query
 from app.classification.urgency_classifier import get_urgency_classifier
 from app.classification.category_anchors import (
     CATEGORY_ANCHORS, 
@@ -22,9 +33,59 @@ from app.classification.urgency_anchors import (
     get_response_time_hours,
     get_urgency_weight
 )
+from app.observability.metrics import get_metrics
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
+metrics = get_metrics()
+
+# Fallback used by the *_description() helpers for unknown labels
+_NO_DESCRIPTION = "No description available"
+
+_NONASCII = re.compile(r'[^\x00-\x7f]')
+
+# Combined results kept by the exact-text LRU in ClassificationService
+RESULT_CACHE_SIZE = 4096
+
+# (epoch_second, "YYYY-MM-DDTHH:MM:SS" local time) - replaced atomically
+_ts_cache = (-1, "")
+
+def _now_iso() -> str:
+    """
+    Local ISO-8601 timestamp with microseconds, like datetime.now().isoformat().
+    
+    The second-level prefix is formatted once per second; only the
+    microsecond suffix is built per call.
+    """
+    global _ts_cache
+    now_ns = time.time_ns()
+    second, micros = divmod(now_ns // 1000, 1_000_000)
+    cached_second, prefix = _ts_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second).isoformat()
+        _ts_cache = (second, prefix)
+    return f"{prefix}.{micros:06d}"
+
+def _is_blank(text: Optional[str]) -> bool:
+    """Empty or whitespace-only; isspace() runs in C without allocating"""
+    return not text or text.isspace()
+
+def _is_trivial(text: Optional[str]) -> bool:
+    """Fewer than 3 characters once stripped; only strips padded text"""
+    if not text or len(text) < 3:
+        return True
+    if text[0].isspace() or text[-1].isspace():
+        return len(text.strip()) < 3
+    return False
+
+# Large batches are encoded in chunks on a shared pool; torch releases the
+# GIL inside the forward pass, so chunks run concurrently on CPU
+PARALLEL_BATCH_THRESHOLD = 64
+ENCODE_CHUNK_SIZE = 32
+_encode_pool = ThreadPoolExecutor(
+    max_workers=max(1, (os.cpu_count() or 2) // 2),
+    thread_name_prefix="classify-encode"
+)
 
 class ClassificationService:
     """
@@ -47,51 +108,102 @@ class ClassificationService:
         self.category_classifier = get_classifier()
         self.urgency_classifier = get_urgency_classifier()
         self.categories = get_all_categories()
+        
+        # Anchors are static: decide once whether each category has
+        # non-ASCII letters (Devanagari etc.) instead of scanning per call
+        self._multilingual = {
+            cat: any(char.isalpha() for char in _NONASCII.findall("".join(anchors)))
+            for cat, anchors in CATEGORY_ANCHORS.items()
+        }
+        
+        # Static metadata, built once. _service_info is attached to every
+        # result by reference - callers must treat it as read-only; the
+        # anchor counts are frozen (MappingProxyType) so they cannot drift.
+        self._anchors_per_category = MappingProxyType({
+            cat: len(anchors) for cat, anchors in CATEGORY_ANCHORS.items()
+        })
+        self._anchors_per_level = MappingProxyType({
+            level: len(anchors) for level, anchors in URGENCY_ANCHORS.items()
+        })
+        self._service_info = {
+            "classifier_type": "similarity_based",
+            "categories_available": self.categories,
+            "anchors_per_category": self._anchors_per_category
+        }
+        self._stats_template = self._build_stats()
+        
+        # Per-label lookups snapshotted once for the response hot path
+        self._category_descriptions = {
+            cat: get_category_description(cat) for cat in self.categories
+        }
+        self._urgency_descriptions = {
+            level: get_urgency_description(level) for level in URGENCY_LEVELS
+        }
+        self._response_times = {
+            level: get_response_time_hours(level) for level in URGENCY_LEVELS
+        }
+        self._urgency_weights = {
+            level: get_urgency_weight(level) for level in URGENCY_LEVELS
+        }
+        
+        # Category + urgency anchors stacked for a single GEMV per combined
+        # classification; rows [:_cat_end] are category anchors. Skipped
+        # when the classifiers score against int8 copies instead.
+        self.combined_mat: Optional[np.ndarray] = None
+        self._cat_end = len(self.category_classifier.anchor_matrix)
+        if (self.category_classifier.anchor_matrix_i8 is None
+                and self.urgency_classifier.anchor_matrix_i8 is None):
+            self.combined_mat = np.ascontiguousarray(np.vstack([
+                self.category_classifier.anchor_matrix,
+                self.urgency_classifier.anchor_matrix
+            ]))
+        
+        # Exact-text LRU of combined results: verbatim repeats ("wifi not
+        # working") skip scoring entirely. Entries are never handed out
+        # directly - callers get a copy with a fresh timestamp.
+        self._result_cache: "OrderedDict[bytes, ClassificationResult]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self._result_cache_hits = 0
+        self._result_cache_misses = 0
+        
+        self.warmup()
         logger.info(f"ClassificationService initialized with {len(self.categories)} categories + urgency detection")
     
     # ==================== CORE CLASSIFICATION (Day 3 - UNTOUCHED) ====================
     
-    def classify_complaint(self, text: str, detailed: bool = False) -> Dict[str, Any]:
+    def classify_complaint(self, text: str, detailed: bool = False,
+                           include_embedding: bool = False) -> Dict[str, Any]:
         """
         Classify a single complaint (Category only - Day 3 logic).
         
         Args:
             text: Complaint text
             detailed: If True, return detailed scores
+            include_embedding: If True, attach the query embedding under the
+                internal "_embedding" key (pop it before returning to clients)
             
         Returns:
             Classification result with metadata
         """
         try:
             # Guardrail: Empty input (Day 4.4 edge case hardening)
-            if not text or not text.strip():
+            if _is_blank(text):
                 return self._create_empty_response(text)
             
             # Perform classification (Day 3 logic - UNTOUCHED)
-            classification_result = self.category_classifier.classify(
-                text, 
-                return_scores=detailed
-            )
-            
-            # Add service metadata
-            result = {
-                **classification_result,
-                "service_info": {
-                    "classifier_type": "similarity_based",
-                    "categories_available": self.categories,
-                    "anchors_per_category": {
-                        cat: len(anchors) 
-                        for cat, anchors in CATEGORY_ANCHORS.items()
-                    }
-                }
-            }
+            if include_embedding:
+                text_embedding = self.category_classifier.embed(text)
+                classification_result = self.category_classifier.classify_from_embedding(
+                    text_embedding, text, return_scores=detailed
+                )
+                classification_result["_embedding"] = text_embedding
+            else:
+                classification_result = self.category_classifier.classify(
+                    text, 
+                    return_scores=detailed
+                )
             
-            # Add category description
-            result["category_description"] = get_category_description(
-                result["category"]
-            )
-            
-            return result
+            return self._attach_service_info(classification_result)
             
         except Exception as e:
             logger.error(f"Classification service error: {str(e)}")
@@ -102,10 +214,28 @@ class ClassificationService:
                 "text": text
             }
     
+    def _attach_service_info(self, classification_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Add service metadata and category description to a classifier result (in place)"""
+        # Classifier results are caller-owned, so annotate in place
+        result = classification_result
+        result["service_info"] = self._service_info
+        
+        # Add category description
+        result["category_description"] = self._category_descriptions.get(
+            result["category"], _NO_DESCRIPTION
+        )
+        
+        return result
+    
     def classify_complaints_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
         """
         Classify multiple complaints.
         
+        Non-empty texts are embedded in one encoder pass and scored with a
+        single matmul against the stacked anchor matrix; empty inputs get
+        the usual empty response in place. Batches above
+        PARALLEL_BATCH_THRESHOLD are encoded in chunks on a thread pool.
+        
         Args:
             texts: List of complaint texts
             
@@ -115,13 +245,42 @@ class ClassificationService:
         if not texts:
             return []
         
-        results = []
-        for text in texts:
-            result = self.classify_complaint(text)
-            results.append(result)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        valid_indices = []
+        for i, text in enumerate(texts):
+            if _is_blank(text):
+                results[i] = self._create_empty_response(text)
+            else:
+                valid_indices.append(i)
+        
+        if valid_indices:
+            try:
+                valid_texts = [texts[i] for i in valid_indices]
+                embeddings = None
+                if len(valid_texts) > PARALLEL_BATCH_THRESHOLD:
+                    embeddings = self._embed_parallel(valid_texts)
+                
+                batch_results = self.category_classifier.classify_batch(
+                    valid_texts, embeddings=embeddings
+                )
+                for i, classification_result in zip(valid_indices, batch_results):
+                    results[i] = self._attach_service_info(classification_result)
+            except Exception as e:
+                logger.error(f"Batch classification service error: {str(e)}")
+                for i in valid_indices:
+                    results[i] = self.classify_complaint(texts[i])
         
         return results
     
+    def _embed_parallel(self, texts: List[str]) -> np.ndarray:
+        """Encode texts in fixed-size chunks concurrently, then stack"""
+        chunks = [
+            texts[i:i + ENCODE_CHUNK_SIZE]
+            for i in range(0, len(texts), ENCODE_CHUNK_SIZE)
+        ]
+        parts = list(_encode_pool.map(self.category_classifier.embed_batch, chunks))
+        return np.vstack(parts)
+    
     # ==================== DAY 4.3 INTEGRATION ====================
     
     def classify_with_urgency(self, text: str, detailed: bool = False) -> Dict[str, Any]:
@@ -138,33 +297,236 @@ class ClassificationService:
         """
         try:
             # Guardrail: Empty input (Day 4.4 edge case hardening)
-            if not text or not text.strip():
+            if _is_blank(text):
                 return self._create_empty_combined_response(text)
             
-            # Step 1: Classify category (Day 3 logic - UNTOUCHED)
-            category_result = self.classify_complaint(text, detailed)
+            return self._classify_with_urgency_cached(text, detailed).to_dict()
             
-            # Step 2: Classify urgency (Day 4 logic - INDEPENDENT)
-            urgency_result = self._classify_urgency_safe(text, detailed)
-            
-            # Step 3: Combine results (Day 4.3 integration)
-            combined_result = self._combine_results(
-                text, category_result, urgency_result, detailed
-            )
+        except Exception as e:
+            logger.error(f"Combined classification failed: {str(e)}")
+            return self._error_combined_response(text, str(e))
+    
+    def classify_with_urgency_result(self, text: str, 
+                                     detailed: bool = False) -> ClassificationResult:
+        """
+        Typed variant of classify_with_urgency for in-process callers.
+        
+        Skips building the response dict; failures (empty input, errors)
+        come back as a result with .error set.
+        """
+        try:
+            if _is_blank(text):
+                return ClassificationResult(text=text, error="Empty or whitespace-only input")
             
-            return combined_result
+            return self._classify_with_urgency_cached(text, detailed)
             
         except Exception as e:
             logger.error(f"Combined classification failed: {str(e)}")
-            return self._error_combined_response(text, str(e))
+            return ClassificationResult(text=text, error=str(e))
+    
+    def classify_with_urgency_batch(self, texts: List[str], 
+                                    detailed: bool = False) -> List[Dict[str, Any]]:
+        """
+        Category + urgency for several texts with a single encoder pass.
+        
+        Returns one result per text, in order, each identical in shape to
+        classify_with_urgency().
+        """
+        if not texts:
+            return []
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        valid_indices = []
+        for i, text in enumerate(texts):
+            if _is_blank(text):
+                results[i] = self._create_empty_combined_response(text)
+                continue
+            cached = self._result_cache_get(text, detailed)
+            if cached is not None:
+                results[i] = cached.to_dict()
+            else:
+                valid_indices.append(i)
+        
+        if valid_indices:
+            try:
+                embeddings = self.category_classifier.embed_batch(
+                    [texts[i] for i in valid_indices]
+                )
+                for i, text_embedding in zip(valid_indices, embeddings):
+                    result = self._classify_with_urgency_from_embedding(
+                        texts[i], text_embedding, detailed
+                    )
+                    self._result_cache_put(texts[i], detailed, result)
+                    results[i] = result.to_dict()
+            except Exception as e:
+                logger.error(f"Batch combined classification failed: {str(e)}")
+                for i in valid_indices:
+                    results[i] = self.classify_with_urgency(texts[i], detailed)
+        
+        return results
+    
+    def classify_with_urgency_result_batch(self, texts: List[str], 
+                                           detailed: bool = False) -> List[ClassificationResult]:
+        """
+        Typed batch variant: one encoder pass for every non-empty text.
+        
+        Failures come back per text as results with .error set.
+        """
+        if not texts:
+            return []
+        
+        results: List[Optional[ClassificationResult]] = [None] * len(texts)
+        valid_indices = []
+        for i, text in enumerate(texts):
+            if _is_blank(text):
+                results[i] = ClassificationResult(text=text, error="Empty or whitespace-only input")
+                continue
+            results[i] = self._result_cache_get(text, detailed)
+            if results[i] is None:
+                valid_indices.append(i)
+        
+        if valid_indices:
+            try:
+                embeddings = self.category_classifier.embed_batch(
+                    [texts[i] for i in valid_indices]
+                )
+                for i, text_embedding in zip(valid_indices, embeddings):
+                    result = self._classify_with_urgency_from_embedding(
+                        texts[i], text_embedding, detailed
+                    )
+                    self._result_cache_put(texts[i], detailed, result)
+                    results[i] = result
+            except Exception as e:
+                logger.error(f"Batch combined classification failed: {str(e)}")
+                for i in valid_indices:
+                    results[i] = self.classify_with_urgency_result(texts[i], detailed)
+        
+        return results
     
-    def _classify_urgency_safe(self, text: str, detailed: bool = False) -> Dict[str, Any]:
+    def warmup(self):
+        """
+        One full combined classification so the first real complaint does
+        not pay first-call costs (encoder, BLAS, NumPy paths). Bypasses the
+        result cache.
+        """
+        try:
+            text = "warmup: water leaking in washroom"
+            self._classify_with_urgency_from_embedding(
+                text, self.category_classifier.embed(text), detailed=True
+            )
+        except Exception as e:
+            logger.warning(f"Classification warmup failed: {str(e)}")
+    
+    # ==================== RESULT CACHE ====================
+    
+    @staticmethod
+    def _result_key(text: str, detailed: bool) -> bytes:
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16)
+        digest.update(b"\x01" if detailed else b"\x00")
+        return digest.digest()
+    
+    def _result_cache_get(self, text: str, detailed: bool) -> Optional[ClassificationResult]:
+        """Caller-owned copy of a cached result (fresh timestamp), or None"""
+        key = self._result_key(text, detailed)
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is None:
+                self._result_cache_misses += 1
+                metrics.counter("classifier_cache_misses_total").inc()
+                return None
+            self._result_cache.move_to_end(key)
+            self._result_cache_hits += 1
+        metrics.counter("classifier_cache_hits_total").inc()
+        
+        result = cached.copy()
+        result.processing_info["timestamp"] = _now_iso()
+        return result
+    
+    def _result_cache_put(self, text: str, detailed: bool, result: ClassificationResult):
+        # Partial failures may be transient - only cache clean results
+        if result.error or result.category_error or result.urgency_error:
+            return
+        key = self._result_key(text, detailed)
+        entry = result.copy()
+        with self._result_cache_lock:
+            self._result_cache[key] = entry
+            self._result_cache.move_to_end(key)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
+    def _classify_with_urgency_cached(self, text: str, detailed: bool) -> ClassificationResult:
+        """Combined analysis of non-blank text, served from the LRU on a repeat"""
+        cached = self._result_cache_get(text, detailed)
+        if cached is not None:
+            return cached
+        
+        # Embed once; both classifiers score the same vector
+        text_embedding = self.category_classifier.embed(text)
+        result = self._classify_with_urgency_from_embedding(text, text_embedding, detailed)
+        self._result_cache_put(text, detailed, result)
+        return result
+    
+    def clear_cache(self):
+        """Drop cached classification results (e.g. after anchors/model change)"""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+            self._result_cache_hits = 0
+            self._result_cache_misses = 0
+        logger.info("Classification result cache cleared")
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Result cache size and hit rate"""
+        total = self._result_cache_hits + self._result_cache_misses
+        return {
+            "size": len(self._result_cache),
+            "max_size": RESULT_CACHE_SIZE,
+            "hits": self._result_cache_hits,
+            "misses": self._result_cache_misses,
+            "hit_rate": round(self._result_cache_hits / total, 4) if total else 0.0
+        }
+    
+    def _classify_with_urgency_from_embedding(self, text: str, text_embedding: np.ndarray,
+                                              detailed: bool) -> ClassificationResult:
+        """Category + urgency + combination for an already-embedded text"""
+        # Step 1: Classify category (Day 3 logic - UNTOUCHED)
+        anchor_similarities = None
+        if self.combined_mat is not None:
+            # One GEMV against both anchor sets, then slice per classifier
+            similarities = self.combined_mat @ unit_query(text_embedding)
+            anchor_similarities = similarities[self._cat_end:]
+            category_result = self.category_classifier.classify_from_anchor_scores(
+                similarities[:self._cat_end], text, return_scores=detailed
+            )
+        else:
+            category_result = self.category_classifier.classify_from_embedding(
+                text_embedding, text, return_scores=detailed
+            )
+        category_result = self._attach_service_info(category_result)
+        
+        # Step 2: Classify urgency (Day 4 logic - INDEPENDENT)
+        urgency_result = self._classify_urgency_safe(
+            text, detailed, text_embedding, anchor_similarities
+        )
+        
+        # Step 3: Combine results (Day 4.3 integration)
+        return self._combine_results(
+            text, category_result, urgency_result, detailed
+        )
+    
+    def _classify_urgency_safe(self, text: str, detailed: bool = False,
+                               text_embedding: Optional[Any] = None,
+                               anchor_similarities: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Safe urgency classification with Day 4.4 edge case hardening.
+        
+        If text_embedding is given (already computed for the category pass),
+        the urgency classifier scores it directly instead of re-encoding;
+        if anchor_similarities (the urgency slice of the combined GEMV) is
+        given, it skips the dot product too.
         """
         try:
             # Day 4.4: Handle very short texts
-            if len(text.strip()) < 3:
+            if _is_trivial(text):
                 return {
                     "urgency": "Medium",  # Safe default for very short
                     "confidence": 0.0,
@@ -173,7 +535,16 @@ class ClassificationService:
                 }
             
             # Call urgency classifier
-            urgency_result = self.urgency_classifier.classify(text, return_scores=detailed)
+            if anchor_similarities is not None:
+                urgency_result = self.urgency_classifier.classify_from_anchor_scores(
+                    anchor_similarities, text, return_scores=detailed
+                )
+            elif text_embedding is not None:
+                urgency_result = self.urgency_classifier.classify_from_embedding(
+                    text_embedding, text, return_scores=detailed
+                )
+            else:
+                urgency_result = self.urgency_classifier.classify(text, return_scores=detailed)
             
             # Day 4.4: Confidence sanity check
             conf = urgency_result.get("confidence", 0.0)
@@ -193,7 +564,7 @@ class ClassificationService:
             }
     
     def _combine_results(self, text: str, category_result: Dict, 
-                        urgency_result: Dict, detailed: bool) -> Dict[str, Any]:
+                        urgency_result: Dict, detailed: bool) -> ClassificationResult:
         """
         Combine category and urgency results (Day 4.3 integration).
         
@@ -210,24 +581,24 @@ class ClassificationService:
         urgency_score = urgency_result.get("similarity_score", 0.0)
         
         # Day 4.3: Build clean response object
-        result = {
-            "text": text,
+        result = ClassificationResult(
+            text=text,
             # Category section (Day 3)
-            "category": category,
-            "category_confidence": round(category_confidence, 4),
-            "category_similarity": round(category_score, 4),
-            "category_description": get_category_description(category),
+            category=category,
+            category_confidence=round(category_confidence, 4),
+            category_similarity=round(category_score, 4),
+            category_description=self._category_descriptions.get(category, _NO_DESCRIPTION),
             
             # Urgency section (Day 4)
-            "urgency": urgency,
-            "urgency_confidence": round(urgency_confidence, 4),
-            "urgency_similarity": round(urgency_score, 4),
-            "urgency_description": get_urgency_description(urgency),
-            "response_time_hours": get_response_time_hours(urgency),
+            urgency=urgency,
+            urgency_confidence=round(urgency_confidence, 4),
+            urgency_similarity=round(urgency_score, 4),
+            urgency_description=self._urgency_descriptions.get(urgency, _NO_DESCRIPTION),
+            response_time_hours=self._response_times.get(urgency, 24),
             
             # Processing info
-            "processing_info": {
-                "timestamp": datetime.now().isoformat(),
+            processing_info={
+                "timestamp": _now_iso(),
                 "has_category": "category" in category_result,
                 "has_urgency": "urgency" in urgency_result,
                 "independent_analysis": True,  # Key Day 4.3 principle
@@ -235,45 +606,39 @@ class ClassificationService:
                 "urgency_algorithm": "similarity_based",
                 "day_4_3_integrated": True,
                 "day_4_4_validated": True,
-            }
-        }
+            },
+            
+            # Service info
+            service_info=category_result.get("service_info", {})
+        )
         
         # Add combined priority score (for sorting, not coupling)
         if "error" not in category_result and "error" not in urgency_result:
-            result["combined_priority"] = self._calculate_combined_priority(
+            result.combined_priority = self._calculate_combined_priority(
                 category_result, urgency_result
             )
         
         # Add detailed information if requested
         if detailed:
-            # Category scores
+            # Category scores (classifiers already round to 4 places)
             if "all_scores" in category_result:
-                result["category_scores"] = {
-                    cat: round(score, 4) 
-                    for cat, score in category_result["all_scores"].items()
-                }
+                result.category_scores = dict(category_result["all_scores"])
             
             # Urgency scores
             if "all_scores" in urgency_result:
-                result["urgency_scores"] = {
-                    level: round(score, 4) 
-                    for level, score in urgency_result["all_scores"].items()
-                }
+                result.urgency_scores = dict(urgency_result["all_scores"])
         
         # Add top categories/urgencies
         if "top_categories" in category_result:
-            result["top_categories"] = category_result["top_categories"][:3]
+            result.top_categories = category_result["top_categories"][:3]
         if "top_urgencies" in urgency_result:
-            result["top_urgencies"] = urgency_result["top_urgencies"][:3]
+            result.top_urgencies = urgency_result["top_urgencies"][:3]
         
         # Include any errors
         if "error" in category_result:
-            result["category_error"] = category_result["error"]
+            result.category_error = category_result["error"]
         if "error" in urgency_result:
-            result["urgency_error"] = urgency_result["error"]
-        
-        # Service info
-        result["service_info"] = category_result.get("service_info", {})
+            result.urgency_error = urgency_result["error"]
         
         return result
     
@@ -290,7 +655,7 @@ class ClassificationService:
         urgency_level = urgency_result.get("urgency", "Medium")
         
         # Urgency weight (for priority, not for urgency calculation)
-        urgency_weight = get_urgency_weight(urgency_level)
+        urgency_weight = self._urgency_weights.get(urgency_level, 1)
         
         # Priority score (UI/sorting only)
         # Weighted: 70% urgency similarity, 30% category similarity
@@ -328,8 +693,10 @@ class ClassificationService:
         Day 4.4: Validate cross-language consistency.
         Same meaning → same urgency, regardless of language.
         """
-        eng_result = self.classify_with_urgency(english_text)
-        hindi_result = self.classify_with_urgency(hindi_text)
+        # One encoder pass for both texts
+        eng_result, hindi_result = self.classify_with_urgency_batch(
+            [english_text, hindi_text]
+        )
         
         same_urgency = eng_result["urgency"] == hindi_result["urgency"]
         urgency_diff = abs(eng_result["urgency_confidence"] - hindi_result["urgency_confidence"])
@@ -381,38 +748,22 @@ class ClassificationService:
     
     # ==================== UTILITY METHODS ====================
     
-    def get_classification_stats(self) -> Dict[str, Any]:
-        """
-        Get statistics about the classification system.
-        
-        Returns:
-            System statistics and configuration
-        """
-        total_anchors = sum(
-            len(anchors) for anchors in CATEGORY_ANCHORS.values()
-        )
-        
-        total_urgency_anchors = sum(
-            len(anchors) for anchors in URGENCY_ANCHORS.values()
-        )
+    def _build_stats(self) -> Dict[str, Any]:
+        """Build the (static) classification system statistics"""
+        total_anchors = sum(self._anchors_per_category.values())
+        total_urgency_anchors = sum(self._anchors_per_level.values())
         
         return {
             "categories": {
                 "total": len(self.categories),
                 "list": self.categories,
-                "anchors_per_category": {
-                    cat: len(anchors) 
-                    for cat, anchors in CATEGORY_ANCHORS.items()
-                }
+                "anchors_per_category": self._anchors_per_category
             },
             "urgency": {
                 "levels": URGENCY_LEVELS,
                 "descriptions": URGENCY_DESCRIPTIONS,
                 "response_times": URGENCY_RESPONSE_TIMES,
-                "anchors_per_level": {
-                    level: len(anchors) 
-                    for level, anchors in URGENCY_ANCHORS.items()
-                }
+                "anchors_per_level": self._anchors_per_level
             },
             "classifier": {
                 "type": "SimilarityClassifier",
@@ -430,6 +781,16 @@ class ClassificationService:
             "requires_training": False
         }
     
+    def get_classification_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the classification system.
+        
+        Returns:
+            System statistics and configuration (shallow copy of the
+            template built at init)
+        """
+        return dict(self._stats_template)
+    
     def explain_classification(self, text: str) -> Dict[str, Any]:
         """
         Provide detailed explanation for a classification.
@@ -441,20 +802,23 @@ class ClassificationService:
             Explanation with matching anchors
         """
         try:
-            # First classify
-            classification = self.classify_complaint(text)
+            # First classify, keeping the query embedding for the explanation
+            classification = self.classify_complaint(text, include_embedding=True)
             category = classification["category"]
+            text_embedding = classification.pop("_embedding", None)
             
-            # Get explanation from classifier
-            explanation = self.category_classifier.explain_classification(text, category)
+            # Get explanation from classifier (no re-encode when we have the vector)
+            if text_embedding is not None:
+                explanation = self.category_classifier.explain_from_embedding(
+                    text_embedding, text, category
+                )
+            else:
+                explanation = self.category_classifier.explain_classification(text, category)
             
-            # Combine with classification result
-            result = {
-                **classification,
-                "explanation": explanation
-            }
+            # Combine with classification result (ours to mutate)
+            classification["explanation"] = explanation
             
-            return result
+            return classification
             
         except Exception as e:
             logger.error(f"Explanation service error: {str(e)}")
@@ -474,13 +838,10 @@ class ClassificationService:
         
         return {
             "name": category,
-            "description": get_category_description(category),
+            "description": self._category_descriptions.get(category, _NO_DESCRIPTION),
             "anchor_count": len(CATEGORY_ANCHORS.get(category, [])),
             "anchors": CATEGORY_ANCHORS.get(category, []),
-            "multilingual": any(
-                any(char.isalpha() for char in anchor if ord(char) > 127)
-                for anchor in CATEGORY_ANCHORS.get(category, [])
-            )
+            "multilingual": self._multilingual.get(category, False)
         }
     
     def get_urgency_info(self) -> Dict[str, Any]:
@@ -489,10 +850,7 @@ class ClassificationService:
             "levels": URGENCY_LEVELS,
             "descriptions": URGENCY_DESCRIPTIONS,
             "response_times": URGENCY_RESPONSE_TIMES,
-            "anchors_per_level": {
-                level: len(anchors) 
-                for level, anchors in URGENCY_ANCHORS.items()
-            }
+            "anchors_per_level": self._anchors_per_level
         }
     
     # ==================== ERROR HANDLING (Day 4.4) ====================
@@ -523,7 +881,7 @@ class ClassificationService:
             "response_time_hours": 24,
             "error": "Empty or whitespace-only input",
             "processing_info": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "has_category": False,
                 "has_urgency": False,
                 "empty_input": True
@@ -542,14 +900,17 @@ class ClassificationService:
             "response_time_hours": 24,
         }
 
-# Singleton instance
 _service_instance = None
+_service_lock = threading.Lock()
 
 def get_classification_service() -> ClassificationService:
-    """Get singleton classification service instance"""
+    """Get singleton classification service instance (built on first call)"""
     global _service_instance
     if _service_instance is None:
-        _service_instance = ClassificationService()
+        # Double-checked so concurrent first callers load the models once
+        with _service_lock:
+            if _service_instance is None:
+                _service_instance = ClassificationService()
     return _service_instance
 
 if __name__ == "__main__":
@@ -1,30 +1,132 @@
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, List, Dict, Any, Optional, Union
+
+import numpy as np
+
 from app.preprocessing.text_cleaner import preprocess_text, batch_preprocess
+from app.config import EMBEDDING_MICRO_BATCH_SIZE, EMBEDDING_MICRO_BATCH_WAIT_MS
 from app.embeddings.embedder import get_embedder
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+class MicroBatcher:
+    """
+    Coalesces concurrent single-text embeds into batched encoder calls.
+    
+    A daemon worker blocks for the first queued text, gathers whatever else
+    arrives within max_wait (up to max_batch texts) and encodes them in one
+    forward pass. Callers wait on the Future returned by submit; futures
+    cancelled before their batch starts are dropped from it.
+    """
+    
+    def __init__(self, embed_batch: Callable[[List[str]], np.ndarray],
+                 max_batch: int = 32, max_wait: float = 0.01):
+        self.embed_batch = embed_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._run, name="embedding-microbatch", daemon=True
+        )
+        self._worker.start()
+    
+    def submit(self, text: str) -> Future:
+        """Queue text for the next batch; the Future resolves to its embedding"""
+        future = Future()
+        self._queue.put((text, future))
+        return future
+    
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._encode(batch)
+    
+    def _encode(self, batch: List[tuple]):
+        batch = [
+            (text, future) for text, future in batch
+            if future.set_running_or_notify_cancel()
+        ]
+        if not batch:
+            return
+        
+        texts = [text for text, _ in batch]
+        try:
+            embeddings = self.embed_batch(texts)
+            if len(embeddings) != len(texts):
+                raise RuntimeError("Batch embedding returned incomplete results")
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        
+        for (_, future), embedding in zip(batch, embeddings):
+            future.set_result(embedding)
+
+
 class EmbeddingService:
     """
     Orchestration layer for text preprocessing and embedding generation.
     This is your AI SDK for the grievance system.
     """
     
-    def __init__(self, embedder=None):
+    def __init__(self, embedder=None, cache_size: int = 4096):
         """
         Initialize the embedding service.
         
         Args:
             embedder: Optional custom embedder instance
+            cache_size: Max embeddings kept in the exact-match LRU cache
         """
         self.embedder = embedder or get_embedder()
         self.embedding_dim = self.embedder.get_dimension()
+        
+        # Exact-match LRU keyed on a digest of model name + cleaned text:
+        # verbatim repeats ("no water", "wifi down") skip the transformer
+        # entirely, and a swapped model never serves another model's vectors
+        self.cache_size = cache_size
+        self._cache_key_prefix = f"{self.embedder.model_name}\0".encode("utf-8")
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # Started on first submit_preprocessed call
+        self._batcher: Optional[MicroBatcher] = None
+        self._batcher_lock = threading.Lock()
+        
+        self._warmup()
         logger.info(f"Embedding service initialized with dimension: {self.embedding_dim}")
     
+    def _warmup(self):
+        """
+        Run the batched encode path once at startup.
+        
+        Model load already runs a single-text forward pass; the padded
+        multi-text path has its own first-call costs. Bypasses the cache.
+        """
+        try:
+            self.embedder.embed_batch(["warmup", "warm up the encoder"], batch_size=2)
+        except Exception as e:
+            logger.warning(f"Embedding warmup failed: {str(e)}")
+    
     def generate_embedding(self, raw_text: str, 
-                          normalize_hinglish: bool = True) -> List[float]:
+                          normalize_hinglish: bool = True) -> np.ndarray:
         """
         Complete pipeline: Preprocess → Embed
         
@@ -33,20 +135,87 @@ class EmbeddingService:
             normalize_hinglish: Apply Hinglish normalization
             
         Returns:
-            Embedding vector (list of floats)
+            Unit-norm float32 embedding (read-only; copy before mutating)
         """
         # Step 1: Preprocess
         cleaned_text = preprocess_text(raw_text, normalize_hinglish)
         
-        # Step 2: Generate embedding
+        # Step 2: Generate embedding (cached)
+        return self.embed_preprocessed(cleaned_text)
+    
+    def embed_preprocessed(self, cleaned_text: str) -> np.ndarray:
+        """
+        Embed text that has already been through preprocess_text.
+        
+        Skips the second cleaning pass callers would otherwise pay when they
+        preprocess once themselves. Shares the LRU cache with
+        generate_embedding. The returned array is read-only and may be
+        shared with other callers.
+        """
+        key = self._cache_key(cleaned_text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         embedding = self.embedder.embed(cleaned_text)
+        embedding.setflags(write=False)
+        self._cache_put(key, embedding)
         
-        logger.debug(f"Generated embedding for text (length: {len(raw_text)})")
+        logger.debug("Generated embedding for text (length: %d)", len(cleaned_text))
         return embedding
     
+    def submit_preprocessed(self, cleaned_text: str) -> Future:
+        """
+        Non-blocking embed_preprocessed for concurrent request handlers.
+        
+        Cache hits come back as an already-completed Future. Misses go to
+        the shared MicroBatcher, so requests that arrive together share one
+        batched forward pass; they are cached before their Future resolves.
+        result() raises if the batch failed. A cancelled Future is dropped
+        from its batch if the batch has not started yet.
+        """
+        cached = self._cache_get(self._cache_key(cleaned_text))
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+        
+        return self._get_batcher().submit(cleaned_text)
+    
+    def embed_preprocessed_coalesced(self, cleaned_text: str) -> np.ndarray:
+        """submit_preprocessed, blocking until the embedding is ready"""
+        return self.submit_preprocessed(cleaned_text).result()
+    
+    def _embed_batch_cached(self, cleaned_texts: List[str]) -> List[np.ndarray]:
+        """MicroBatcher encode step: one forward pass, rows copied and cached"""
+        matrix = self.embedder.embed_batch(cleaned_texts, batch_size=len(cleaned_texts))
+        if len(matrix) != len(cleaned_texts):
+            # MicroBatcher fails the whole batch on incomplete results
+            return matrix
+        
+        rows = []
+        for text, row in zip(cleaned_texts, matrix):
+            # Own copy: a cached row view would pin the whole batch matrix
+            row = row.copy()
+            row.setflags(write=False)
+            self._cache_put(self._cache_key(text), row)
+            rows.append(row)
+        return rows
+    
+    def _get_batcher(self) -> MicroBatcher:
+        if self._batcher is None:
+            with self._batcher_lock:
+                if self._batcher is None:
+                    self._batcher = MicroBatcher(
+                        self._embed_batch_cached,
+                        max_batch=EMBEDDING_MICRO_BATCH_SIZE,
+                        max_wait=EMBEDDING_MICRO_BATCH_WAIT_MS / 1000
+                    )
+        return self._batcher
+    
     def generate_embeddings_batch(self, raw_texts: List[str],
                                  normalize_hinglish: bool = True,
-                                 batch_size: int = 32) -> List[List[float]]:
+                                 batch_size: int = 32) -> List[np.ndarray]:
         """
         Batch processing for efficiency.
         
@@ -56,7 +225,7 @@ class EmbeddingService:
             batch_size: Processing batch size
             
         Returns:
-            List of embedding vectors
+            List of read-only unit-norm float32 vectors ([] on failure)
         """
         if not raw_texts:
             return []
@@ -64,12 +233,75 @@ class EmbeddingService:
         # Step 1: Batch preprocessing
         cleaned_texts = batch_preprocess(raw_texts, normalize_hinglish)
         
-        # Step 2: Batch embedding
-        embeddings = self.embedder.embed_batch(cleaned_texts, batch_size)
+        # Step 2: Serve cached texts, batch-embed only the rest
+        keys = [self._cache_key(text) for text in cleaned_texts]
+        embeddings: List[Optional[np.ndarray]] = [None] * len(cleaned_texts)
+        uncached_indices = []
+        for i, key in enumerate(keys):
+            cached = self._cache_get(key)
+            if cached is not None:
+                embeddings[i] = cached
+            else:
+                uncached_indices.append(i)
+        
+        if uncached_indices:
+            fresh = self.embedder.embed_batch(
+                [cleaned_texts[i] for i in uncached_indices], batch_size
+            )
+            if len(fresh) != len(uncached_indices):
+                # Embedder failed; keep the all-or-nothing contract
+                return []
+            for i, embedding in zip(uncached_indices, fresh):
+                # Own copy: a cached row view would pin the whole batch matrix
+                embedding = embedding.copy()
+                embedding.setflags(write=False)
+                embeddings[i] = embedding
+                self._cache_put(keys[i], embedding)
         
-        logger.info(f"Generated {len(embeddings)} embeddings in batch")
+        logger.info(
+            "Generated %d embeddings in batch (%d from cache)",
+            len(embeddings), len(embeddings) - len(uncached_indices)
+        )
         return embeddings
     
+    # ==================== EMBEDDING CACHE ====================
+    
+    def _cache_key(self, cleaned_text: str) -> bytes:
+        digest = hashlib.blake2b(self._cache_key_prefix, digest_size=16)
+        digest.update(cleaned_text.encode("utf-8"))
+        return digest.digest()
+    
+    def _cache_get(self, key: bytes) -> Optional[np.ndarray]:
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                self._cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._cache_hits += 1
+            return cached
+    
+    def _cache_put(self, key: bytes, embedding: np.ndarray):
+        # Zero vectors mean the embedder failed - don't pin them
+        if embedding.size == 0 or not embedding.any():
+            return
+        with self._cache_lock:
+            self._cache[key] = embedding
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Embedding cache size and hit rate"""
+        total = self._cache_hits + self._cache_misses
+        return {
+            "size": len(self._cache),
+            "max_size": self.cache_size,
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_rate": round(self._cache_hits / total, 4) if total else 0.0
+        }
+    
     def get_embedding_info(self) -> Dict[str, Any]:
         """Get service metadata"""
         return {
@@ -79,9 +311,9 @@ class EmbeddingService:
             "hinglish_support": True
         }
     
-    def validate_embedding(self, embedding: List[float]) -> bool:
-        """Validate if embedding is valid"""
-        if not embedding:
+    def validate_embedding(self, embedding: Union[List[float], np.ndarray]) -> bool:
+        """Validate if embedding is valid (accepts a list or an ndarray)"""
+        if embedding is None or len(embedding) == 0:
             return False
         
         # Check dimension
@@ -89,8 +321,9 @@ class EmbeddingService:
             logger.warning(f"Embedding dimension mismatch: {len(embedding)} != {self.embedding_dim}")
             return False
         
-        # Check for zero vectors (might indicate failure)
-        if all(abs(x) < 1e-10 for x in embedding):
+        # Check for zero vectors (might indicate failure) - one vectorized pass
+        arr = np.asarray(embedding, dtype=np.float32)
+        if not np.any(np.abs(arr) >= 1e-10):
             logger.warning("Embedding appears to be a zero vector")
             return False
         
@@ -98,10 +331,14 @@ class EmbeddingService:
 
 # Global service instance
 _service_instance = None
+_service_lock = threading.Lock()
 
 def get_embedding_service() -> EmbeddingService:
     """Get singleton embedding service instance"""
     global _service_instance
     if _service_instance is None:
-        _service_instance = EmbeddingService()
+        # Double-checked so concurrent first callers load the model once
+        with _service_lock:
+            if _service_instance is None:
+                _service_instance = EmbeddingService()
     return _service_instance
\ No newline at end of file
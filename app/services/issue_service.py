@@ -6,12 +6,17 @@ Day 5.4
 
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-import uuid
+import time
 
-from app.preprocessing.text_cleaner import preprocess_text  # ADDED
+import numpy as np
+
+from app.classification.result import ClassificationResult
+from app.preprocessing.text_cleaner import preprocess_text, batch_preprocess  # ADDED
 from app.services.classification_service import get_classification_service
 from app.services.embedding_service import get_embedding_service
+from app.issues.issue_id import generate_complaint_id
 from app.issues.issue_manager import get_issue_manager
+from app.issues.validators import MAX_TEXT_LENGTH, validate_complaint_text
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -40,34 +45,68 @@ class IssueService:
         """
         Complete pipeline: Classify → Embed → Group → Return result
         """
-        start_time = datetime.utcnow()
+        start_time = datetime.utcnow()  # wall clock, for timestamps only
+        t0 = time.perf_counter()        # monotonic, for durations
+        
+        # Fast-fail garbage before two transformer passes
+        try:
+            validate_complaint_text(text)
+        except ValueError as e:
+            return self._failure_response(e, complaint_id, text or "", t0)
+        
+        text_len = len(text)
+        if text_len > MAX_TEXT_LENGTH:
+            logger.warning(f"Complaint text truncated from {text_len} to {MAX_TEXT_LENGTH} chars")
+            text = text[:MAX_TEXT_LENGTH]
         
         try:
             # Generate complaint ID if not provided
-            complaint_id = complaint_id or f"COMP-{uuid.uuid4().hex[:8]}"
+            complaint_id = complaint_id or generate_complaint_id()
             metadata = metadata or {}
             
-            logger.info(f"Processing complaint: {complaint_id[:20]}...")
+            logger.info("Processing complaint: %.20s...", complaint_id)
             
             # 1️⃣ Classification (Day 3 + Day 4) - Use ORIGINAL text
-            classification = self.classifier.classify_with_urgency(text, detailed=False)
+            classification = self.classifier.classify_with_urgency_result(text, detailed=False)
             
-            if "error" in classification:
-                raise ValueError(f"Classification failed: {classification['error']}")
-            
-            category = classification["category"]
-            urgency = classification["urgency"]
-            response_time = classification.get("response_time_hours", 24)
-            confidence = classification.get("category_confidence", 0.0)
+            if classification.error is not None:
+                raise ValueError(f"Classification failed: {classification.error}")
             
             # 2️⃣ Embedding (Day 2) - Use PREPROCESSED text
             clean_text = preprocess_text(text, normalize_hinglish=True)
             
-            # Generate embedding with preprocessing already applied
-            embedding = self.embedding_service.generate_embedding(
-                clean_text,
-                normalize_hinglish=False  # Already normalized
-            )
+            # Embed directly - preprocessing already applied
+            embedding = self.embedding_service.embed_preprocessed(clean_text)
+            
+        except Exception as e:
+            return self._failure_response(e, complaint_id, text, t0)
+        
+        return self._aggregate_complaint(
+            text, hostel, complaint_id, metadata, classification, embedding, start_time, t0
+        )
+    
+    def _aggregate_complaint(
+        self,
+        text: str,
+        hostel: str,
+        complaint_id: str,
+        metadata: Dict[str, Any],
+        classification: ClassificationResult,
+        embedding: np.ndarray,
+        start_time: datetime,
+        t0: float
+    ) -> Dict[str, Any]:
+        """Steps 3-4: group into an issue and assemble the response"""
+        try:
+            validate_complaint_text(text)
+            
+            if classification.error is not None:
+                raise ValueError(f"Classification failed: {classification.error}")
+            
+            category = classification.category
+            urgency = classification.urgency
+            response_time = classification.response_time_hours
+            confidence = classification.category_confidence
             
             # 3️⃣ Issue Management (Day 5)
             issue_result = self.issue_manager.process_complaint(
@@ -82,23 +121,24 @@ class IssueService:
             )
             
             # 4️⃣ Assemble final response
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            processing_time = time.perf_counter() - t0
+            text_len = len(text)
             
             response = {
                 "success": True,
                 "processing_time_seconds": round(processing_time, 3),
                 "complaint_id": complaint_id,
-                "text_preview": text[:100] + "..." if len(text) > 100 else text,
+                "text_preview": text if text_len <= 100 else text[:100] + "...",
                 "classification": {
                     "category": category,
                     "category_confidence": round(confidence, 4),
                     "urgency": urgency,
-                    "urgency_confidence": classification.get("urgency_confidence", 0.0),
+                    "urgency_confidence": classification.urgency_confidence,
                     "response_time_hours": response_time
                 },
                 "issue_aggregation": issue_result,
                 "metadata": {
-                    "text_length": len(text),
+                    "text_length": text_len,
                     "hostel": hostel,
                     "timestamp": start_time.isoformat(),
                     **metadata
@@ -106,24 +146,28 @@ class IssueService:
             }
             
             logger.info(
-                f"Complaint processed: {complaint_id} → "
-                f"Category: {category}, Urgency: {urgency}, "
-                f"Issue: {issue_result.get('issue_id', 'N/A')}, "
-                f"Duplicate: {issue_result.get('is_duplicate', False)}"
+                "Complaint processed: %s → Category: %s, Urgency: %s, Issue: %s, Duplicate: %s",
+                complaint_id, category, urgency,
+                issue_result.get('issue_id', 'N/A'),
+                issue_result.get('is_duplicate', False)
             )
             
             return response
             
         except Exception as e:
-            logger.error(f"Failed to process complaint: {str(e)}")
-            
-            return {
-                "success": False,
-                "error": str(e),
-                "complaint_id": complaint_id,
-                "text_preview": text[:100] + "..." if len(text) > 100 else text,
-                "processing_time_seconds": round((datetime.utcnow() - start_time).total_seconds(), 3)
-            }
+            return self._failure_response(e, complaint_id, text, t0)
+    
+    def _failure_response(self, error: Exception, complaint_id: str, text: str,
+                          t0: float) -> Dict[str, Any]:
+        logger.error(f"Failed to process complaint: {str(error)}")
+        
+        return {
+            "success": False,
+            "error": str(error),
+            "complaint_id": complaint_id,
+            "text_preview": text if len(text) <= 100 else text[:100] + "...",
+            "processing_time_seconds": round(time.perf_counter() - t0, 3)
+        }
     
     def batch_process_complaints(
         self,
@@ -131,17 +175,52 @@ class IssueService:
     ) -> List[Dict[str, Any]]:
         """
         Process multiple complaints.
+        
+        Bulk preprocess → bulk classify → bulk embed, then one pass of
+        per-item issue aggregation (failures stay per item). Processing
+        times are measured from the start of the batch.
         """
-        results = []
+        if not complaints:
+            return []
+        
+        start_time = datetime.utcnow()
+        t0 = time.perf_counter()
+        texts = [complaint.get("text", "")[:MAX_TEXT_LENGTH] for complaint in complaints]
         
-        for complaint in complaints:
-            result = self.process_complaint(
-                text=complaint.get("text", ""),
-                hostel=complaint.get("hostel", "UNKNOWN"),
-                complaint_id=complaint.get("complaint_id"),
-                metadata=complaint.get("metadata", {})
+        try:
+            classifications = self.classifier.classify_with_urgency_result_batch(texts)
+            cleaned = batch_preprocess(texts, normalize_hinglish=True)
+            embeddings = self.embedding_service.generate_embeddings_batch(
+                cleaned, normalize_hinglish=False, batch_size=32
             )
-            results.append(result)
+            if len(embeddings) != len(texts):
+                raise RuntimeError("Batch embedding returned incomplete results")
+        except Exception as e:
+            logger.error(f"Batch pipeline failed, processing one by one: {str(e)}")
+            return [
+                self.process_complaint(
+                    text=complaint.get("text", ""),
+                    hostel=complaint.get("hostel", "UNKNOWN"),
+                    complaint_id=complaint.get("complaint_id"),
+                    metadata=complaint.get("metadata", {})
+                )
+                for complaint in complaints
+            ]
+        
+        results = []
+        for complaint, text, classification, embedding in zip(
+            complaints, texts, classifications, embeddings
+        ):
+            results.append(self._aggregate_complaint(
+                text,
+                complaint.get("hostel", "UNKNOWN"),
+                complaint.get("complaint_id") or generate_complaint_id(),
+                complaint.get("metadata") or {},
+                classification,
+                embedding,
+                start_time,
+                t0
+            ))
         
         return results
     
@@ -4,26 +4,80 @@ Enhanced Issue Service - Day 6 Integration
 Adds: DB persistence, session tracking, heuristics
 """
 
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, List
-import uuid
+from typing import Dict, Any, Optional, List, Tuple
+import os
+import threading
+import time
+
+import numpy as np
 
 from app.preprocessing.text_cleaner import preprocess_text
 from app.services.classification_service import get_classification_service
 from app.services.embedding_service import get_embedding_service
 from app.core.session import get_session_manager
 from app.core.heuristics import HeuristicEngine
-from app.db.session import get_db_context
-from app.db.models.issue import IssueModel, IssueStatus
+from app.db.session import engine, get_db_context
+from app.db.models.issue import IssueModel, IssueStatus, issue_summary
 from app.db.models.complaint import ComplaintModel
 from app.repositories.issue_repository import IssueRepository
-from app.repositories.complaint_repository import ComplaintRepository
-from app.issues.issue_id import generate_issue_id, generate_issue_key
-from app.issues.urgency_rules import get_urgency_score
+from app.repositories.complaint_repository import (
+    ComplaintRepository,
+    pack_embedding_i8,
+    unpack_embedding
+)
+from app.issues.issue_id import generate_complaint_id, generate_issue_id, generate_issue_key
+from app.issues.similarity_numba import max_cosine
+from app.issues.validators import MAX_TEXT_LENGTH, validate_complaint_text
+from app.issues.urgency_rules import get_urgency_display_label, get_urgency_score
+from app.config import INCREMENTAL_ISSUE_STATS
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on concurrent complaints in batch_process_complaints. SQLite
+# allows one writer at a time, so there batches run on the calling thread
+# (parallel writers only queue on the file lock or fail "database is locked")
+BATCH_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Issues whose embedding window stays in memory (LRU beyond this)
+ISSUE_EMBEDDING_CACHE_SIZE = 1000
+
+# Duplicate checks compare against an issue's newest this-many complaints,
+# whether the window was just reloaded from the DB or kept up in memory
+ISSUE_EMBEDDING_WINDOW = 100
+
+
+class _IssueEmbeddingWindow:
+    """
+    An issue's newest ISSUE_EMBEDDING_WINDOW embeddings as a ring buffer
+    
+    The (W, D) matrix is preallocated, so an append overwrites the oldest
+    row in place (O(D)) instead of copying the matrix, and memory per issue
+    is fixed. Row order does not matter to max_cosine.
+    """
+    
+    def __init__(self, dim: int, rows: List[Tuple[str, np.ndarray]]):
+        self.matrix = np.zeros((ISSUE_EMBEDDING_WINDOW, dim), dtype=np.float32)
+        self.complaint_ids: List[Optional[str]] = [None] * ISSUE_EMBEDDING_WINDOW
+        self.count = 0
+        self._next = 0
+        # rows are newest first; append oldest first so the newest survive
+        for complaint_id, vector in reversed(rows[:ISSUE_EMBEDDING_WINDOW]):
+            self.append(complaint_id, vector)
+    
+    def append(self, complaint_id: str, vector: np.ndarray):
+        self.matrix[self._next] = vector
+        self.complaint_ids[self._next] = complaint_id
+        self._next = (self._next + 1) % ISSUE_EMBEDDING_WINDOW
+        self.count = min(self.count + 1, ISSUE_EMBEDDING_WINDOW)
+    
+    def snapshot(self) -> Tuple[List[str], np.ndarray]:
+        """(complaint ids, (count, D) matrix view); rows 0..count-1 are filled"""
+        return self.complaint_ids[:self.count], self.matrix[:self.count]
+
 
 class IssueServiceDay6:
     """
@@ -39,6 +93,15 @@ class IssueServiceDay6:
         self.session_manager = get_session_manager()
         self.heuristic_engine = HeuristicEngine()
         
+        # issue_id -> window of its newest unit-norm float32 embeddings;
+        # appended on insert, rehydrated from the stored int8 embeddings on first miss
+        self._issue_embeddings: "OrderedDict[str, _IssueEmbeddingWindow]" = OrderedDict()
+        self._issue_embeddings_lock = threading.Lock()
+        
+        # One lock per issue key: find-or-create, the duplicate check and the
+        # insert for the same hostel/category run one at a time in-process
+        self._issue_key_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        
         logger.info("IssueServiceDay6 initialized with DB persistence")
 
     def process_complaint(
@@ -58,14 +121,35 @@ class IssueServiceDay6:
         4. Heuristic evaluation
         5. Persistence
         """
-        start_time = datetime.utcnow()
+        start_time = datetime.utcnow()  # wall clock, for timestamps only
+        t0 = time.perf_counter()        # monotonic, for durations
+        cached_issue_id = None
+        
+        # Fast-fail garbage before two transformer passes
+        try:
+            validate_complaint_text(text)
+        except ValueError as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "complaint_id": complaint_id,
+                "text_preview": text or "",
+                "processing_time_seconds": round(time.perf_counter() - t0, 3)
+            }
+        
+        text_len = len(text)
+        if text_len > MAX_TEXT_LENGTH:
+            logger.warning(f"Complaint text truncated from {text_len} to {MAX_TEXT_LENGTH} chars")
+            text = text[:MAX_TEXT_LENGTH]
+            text_len = MAX_TEXT_LENGTH
+        text_preview = text if text_len <= 100 else text[:100] + "..."
         
         try:
             # Generate complaint ID if not provided
-            complaint_id = complaint_id or f"COMP-{uuid.uuid4().hex[:8]}"
+            complaint_id = complaint_id or generate_complaint_id()
             metadata = metadata or {}
             
-            logger.info(f"Processing complaint: {complaint_id}")
+            logger.info("Processing complaint: %s", complaint_id)
             
             # ----------------------------------
             # 1️⃣ Session Management (Day 6.2)
@@ -87,61 +171,51 @@ class IssueServiceDay6:
                     "success": False,
                     "error": "Session complaint limit exceeded",
                     "session_id": session_id,
-                    "processing_time_seconds": (datetime.utcnow() - start_time).total_seconds()
+                    "processing_time_seconds": time.perf_counter() - t0
                 }
             
             # ----------------------------------
             # 2️⃣ Classification (Day 3 + Day 4)
             # ----------------------------------
-            classification = self.classifier.classify_with_urgency(text, detailed=False)
+            classification = self.classifier.classify_with_urgency_result(text, detailed=False)
             
-            if "error" in classification:
-                raise ValueError(f"Classification failed: {classification['error']}")
+            if classification.error is not None:
+                raise ValueError(f"Classification failed: {classification.error}")
             
-            category = classification["category"]
-            urgency = classification["urgency"]
-            response_time = classification.get("response_time_hours", 24)
+            category = classification.category
+            urgency = classification.urgency
+            response_time = classification.response_time_hours
             
             # ----------------------------------
             # 3️⃣ Embedding (Day 2)
             # ----------------------------------
             clean_text = preprocess_text(text, normalize_hinglish=False)
-            embedding = self.embedding_service.generate_embedding(
-                clean_text,
-                normalize_hinglish=False
-            )
+            embedding = self.embedding_service.embed_preprocessed(clean_text)
             
             # ----------------------------------
             # 4️⃣ Issue Aggregation + DB Persistence
             # ----------------------------------
-            with get_db_context() as db:
+            issue_key = generate_issue_key(category, hostel)
+            with self._issue_key_locks[issue_key], get_db_context() as db:
                 issue_repo = IssueRepository(db)
                 complaint_repo = ComplaintRepository(db)
                 
-                # Find or create issue
-                issue_key = generate_issue_key(category, hostel)
-                issue = issue_repo.get_by_hostel_category(hostel, category)
-                
-                if not issue:
-                    # Create new issue
-                    issue_id = generate_issue_id(category, hostel)
-                    issue = issue_repo.create({
-                        "id": issue_id,
-                        "hostel": hostel,
-                        "category": category,
-                        "status": IssueStatus.OPEN,
-                        "urgency_max": urgency,
-                        "urgency_avg": get_urgency_score(urgency),
-                        "complaint_count": 0,
-                        "unique_complaint_count": 0,
-                        "duplicate_count": 0
-                    })
-                    is_new_issue = True
-                else:
-                    is_new_issue = False
+                # Find (locked) or create issue; a lost creation race
+                # re-reads the winner instead of rolling back
+                issue, is_new_issue = issue_repo.get_or_create_for_update({
+                    "id": generate_issue_id(category, hostel),
+                    "hostel": hostel,
+                    "category": category,
+                    "status": IssueStatus.OPEN.value,
+                    "urgency_max": urgency,
+                    "urgency_avg": get_urgency_score(urgency),
+                    "complaint_count": 0,
+                    "unique_complaint_count": 0,
+                    "duplicate_count": 0
+                })
                 
                 # Detect duplicates
-                is_duplicate, similarity_score = self._check_duplicate(
+                is_duplicate, similarity_score, duplicate_of = self._check_duplicate(
                     issue.id, embedding, complaint_repo
                 )
                 
@@ -155,147 +229,281 @@ class IssueServiceDay6:
                     "hostel": hostel,
                     "similarity_score": similarity_score,
                     "is_duplicate": is_duplicate,
-                    "duplicate_of": None,  # Could enhance this
+                    "duplicate_of": duplicate_of,
+                    "embedding_i8": pack_embedding_i8(embedding),
                     "session_id": session_id,
                     "extra_metadata": metadata  # Renamed field
                 }
                 
-                complaint = complaint_repo.create(complaint_data)
+                complaint_repo.insert(complaint_data)
+                self._append_issue_embedding(issue.id, complaint_id, embedding)
+                cached_issue_id = issue.id
                 
                 # Update issue statistics
-                all_complaints = complaint_repo.get_by_issue(issue.id)
-                urgency_scores = [get_urgency_score(c.urgency) for c in all_complaints]
-                max_urgency_score = max(urgency_scores)
-                avg_urgency_score = sum(urgency_scores) / len(urgency_scores)
-                
-                urgency_map = {1: "Low", 2: "Medium", 3: "High", 4: "Critical"}
-                max_urgency_label = urgency_map.get(max_urgency_score, "Low")
-                
-                issue_repo.increment_counts(
-                    issue,
-                    is_duplicate,
-                    max_urgency_label,
-                    avg_urgency_score
-                )
+                if INCREMENTAL_ISSUE_STATS:
+                    issue_repo.increment_counts_incremental(
+                        issue, is_duplicate, get_urgency_score(urgency)
+                    )
+                else:
+                    max_urgency_label, avg_urgency_score = self._recomputed_urgency_stats(
+                        issue, complaint_repo
+                    )
+                    issue_repo.increment_counts(
+                        issue,
+                        is_duplicate,
+                        max_urgency_label,
+                        avg_urgency_score
+                    )
                 
-                # ----------------------------------
-                # 5️⃣ Session Update (After Success)
-                # ----------------------------------
-                self.session_manager.register_complaint(
-                    session_id=session_id,
-                    complaint_id=complaint_id,
-                    issue_id=issue.id,
-                    category=category,
-                    urgency=urgency,
+                # Plain-dict snapshot: nothing below touches the ORM after commit
+                issue_snapshot = issue.to_dict(summary=True)
+            
+            # DB transaction committed - the cached embedding row is durable
+            cached_issue_id = None
+            
+            # ----------------------------------
+            # 5️⃣ Session Update (After Success)
+            # ----------------------------------
+            self.session_manager.register_complaint(
+                session_id=session_id,
+                complaint_id=complaint_id,
+                issue_id=issue_snapshot["issue_id"],
+                category=category,
+                urgency=urgency,
+                similarity_score=similarity_score,
+                is_duplicate=is_duplicate,
+                session=session
+            )
+            
+            # ----------------------------------
+            # 6️⃣ Heuristic Evaluation (Day 6.3)
+            # ----------------------------------
+            try:
+                heuristics = self.heuristic_engine.evaluate(
+                    session=session,
+                    current_issue_id=issue_snapshot["issue_id"],
+                    current_urgency=urgency,
+                    is_duplicate=is_duplicate,
                     similarity_score=similarity_score,
-                    is_duplicate=is_duplicate
+                    timestamp=start_time
                 )
-                
-                # ----------------------------------
-                # 6️⃣ Heuristic Evaluation (Day 6.3)
-                # ----------------------------------
-                try:
-                    heuristics = self.heuristic_engine.evaluate(
-                        session=session,
-                        current_issue_id=issue.id,
-                        current_urgency=urgency,
-                        is_duplicate=is_duplicate,
-                        similarity_score=similarity_score,
-                        timestamp=start_time
-                    )
-                except Exception as e:
-                    logger.error(f"Heuristic evaluation failed: {str(e)}")
-                    heuristics = {
-                        "is_follow_up": False,
-                        "is_escalation": False,
-                        "possible_noise": False,
-                        "details": {},
-                        "error": str(e)
-                    }
-                
-                # ----------------------------------
-                # 7️⃣ Build Response
-                # ----------------------------------
-                processing_time = (datetime.utcnow() - start_time).total_seconds()
-                
-                response = {
-                    "success": True,
-                    "processing_time_seconds": round(processing_time, 3),
-                    "complaint_id": complaint_id,
-                    "text_preview": text[:100] + "..." if len(text) > 100 else text,
-                    "classification": {
-                        "category": category,
-                        "category_confidence": classification.get("category_confidence", 0.0),
-                        "urgency": urgency,
-                        "urgency_confidence": classification.get("urgency_confidence", 0.0),
-                        "response_time_hours": response_time
-                    },
-                    "issue_aggregation": {
-                        "status": "new_issue_created" if is_new_issue else "added_to_existing",
-                        "issue_id": issue.id,
-                        "is_new_complaint": not is_duplicate,
-                        "is_duplicate": is_duplicate,
-                        "similarity_score": round(similarity_score, 4) if similarity_score else None,
-                        "complaint_count": issue.complaint_count,
-                        "unique_complaint_count": issue.unique_complaint_count,
-                        "urgency_max": issue.urgency_max,
-                        "urgency_avg": round(issue.urgency_avg, 2)
-                    },
-                    "session": {
-                        "session_id": session_id,
-                        "complaints_in_session": len(session.entries)
-                    },
-                    "heuristics": heuristics,
-                    "metadata": {
-                        "text_length": len(text),
-                        "hostel": hostel,
-                        "timestamp": start_time.isoformat(),
-                        "db_persisted": True,
-                        **metadata
-                    }
+            except Exception as e:
+                logger.error(f"Heuristic evaluation failed: {str(e)}")
+                heuristics = {
+                    "is_follow_up": False,
+                    "is_escalation": False,
+                    "possible_noise": False,
+                    "details": {},
+                    "error": str(e)
                 }
-                
-                logger.info(
-                    f"Complaint processed: {complaint_id} → "
-                    f"Issue: {issue.id}, Duplicate: {is_duplicate}, "
-                    f"Follow-up: {heuristics.get('is_follow_up', False)}"
-                )
-                
-                return response
-        
+            
+            # ----------------------------------
+            # 7️⃣ Build Response
+            # ----------------------------------
+            processing_time = time.perf_counter() - t0
+            
+            response = {
+                "success": True,
+                "processing_time_seconds": round(processing_time, 3),
+                "complaint_id": complaint_id,
+                "text_preview": text_preview,
+                "classification": {
+                    "category": category,
+                    "category_confidence": classification.category_confidence,
+                    "urgency": urgency,
+                    "urgency_confidence": classification.urgency_confidence,
+                    "response_time_hours": response_time
+                },
+                "issue_aggregation": {
+                    "status": "new_issue_created" if is_new_issue else "added_to_existing",
+                    "issue_id": issue_snapshot["issue_id"],
+                    "is_new_complaint": not is_duplicate,
+                    "is_duplicate": is_duplicate,
+                    "similarity_score": round(similarity_score, 4) if similarity_score else None,
+                    "complaint_count": issue_snapshot["complaint_count"],
+                    "unique_complaint_count": issue_snapshot["unique_complaint_count"],
+                    "urgency_max": issue_snapshot["urgency_max"],
+                    "urgency_avg": issue_snapshot["urgency_avg"]
+                },
+                "session": {
+                    "session_id": session_id,
+                    "complaints_in_session": len(session.entries)
+                },
+                "heuristics": heuristics,
+                "metadata": {
+                    "text_length": text_len,
+                    "hostel": hostel,
+                    "timestamp": start_time.isoformat(),
+                    "db_persisted": True,
+                    **metadata
+                }
+            }
+            
+            logger.info(
+                "Complaint processed: %s → Issue: %s, Duplicate: %s, Follow-up: %s",
+                complaint_id, issue_snapshot['issue_id'], is_duplicate,
+                heuristics.get('is_follow_up', False)
+            )
+            
+            return response
+    
         except Exception as e:
             logger.error(f"Failed to process complaint: {str(e)}")
             
+            if cached_issue_id is not None:
+                # Transaction rolled back - drop the row we cached for it
+                self._forget_issue_embeddings(cached_issue_id)
+            
             return {
                 "success": False,
                 "error": str(e),
                 "complaint_id": complaint_id,
-                "text_preview": text[:100] + "..." if len(text) > 100 else text,
-                "processing_time_seconds": round((datetime.utcnow() - start_time).total_seconds(), 3)
+                "text_preview": text_preview,
+                "processing_time_seconds": round(time.perf_counter() - t0, 3)
             }
     
+    def batch_process_complaints(
+        self,
+        complaints: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process multiple complaints concurrently, results in input order.
+        
+        Inference releases the GIL and each worker opens its own DB
+        session, so one complaint's model pass overlaps another's writes.
+        SessionManager is not thread-safe and the heuristics depend on the
+        order of a session's entries, so complaints sharing a session_id
+        run one after another, in input order, in a single worker. On
+        SQLite the whole batch runs sequentially on the calling thread.
+        """
+        if not complaints:
+            return []
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(complaints)
+        
+        # Complaints without a session_id each start a new session
+        groups: Dict[Any, List[int]] = defaultdict(list)
+        for i, complaint in enumerate(complaints):
+            groups[complaint.get("session_id") or ("new", i)].append(i)
+        
+        def _process(complaint: Dict[str, Any]) -> Dict[str, Any]:
+            return self.process_complaint(
+                text=complaint.get("text", ""),
+                hostel=complaint.get("hostel", "UNKNOWN"),
+                complaint_id=complaint.get("complaint_id"),
+                session_id=complaint.get("session_id"),
+                metadata=complaint.get("metadata", {})
+            )
+        
+        def _process_group(indices: List[int]):
+            for i in indices:
+                results[i] = _process(complaints[i])
+        
+        workers = min(max_workers or BATCH_MAX_WORKERS, len(groups))
+        if workers <= 1 or engine.dialect.name == "sqlite":
+            _process_group(range(len(complaints)))
+            return results
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="day6-batch") as pool:
+            # list() waits for every group and re-raises worker errors
+            list(pool.map(_process_group, groups.values()))
+        return results
+    
+    def _recomputed_urgency_stats(
+        self,
+        issue: IssueModel,
+        complaint_repo: ComplaintRepository
+    ) -> Tuple[str, float]:
+        """
+        (urgency_max label, urgency_avg) recomputed from all the issue's complaints
+        
+        Slow path for INCREMENTAL_ISSUE_STATS=false; the new complaint must
+        already be flushed.
+        """
+        max_urgency_score, avg_urgency_score = complaint_repo.urgency_stats_by_issue_exact(issue.id)
+        return get_urgency_display_label(max_urgency_score), avg_urgency_score
+    
     def _check_duplicate(
         self,
         issue_id: str,
-        embedding: List[float],
+        embedding: np.ndarray,
         complaint_repo: ComplaintRepository,
         threshold: float = 0.88
     ) -> tuple:
-        """Check if complaint is duplicate within issue"""
-        from app.issues.similarity import cosine_similarity
+        """
+        Check if complaint is duplicate within issue
+        
+        The issue's newest ISSUE_EMBEDDING_WINDOW complaints are held as one
+        (K, D) unit-norm matrix, so cosine similarity against all of them is
+        a single fused scan (max_cosine). Older complaints are not compared,
+        the same bound whether or not the issue was cached.
+        
+        Returns: (is_duplicate, similarity_score, duplicate_of)
+        """
+        complaint_ids, matrix = self._get_issue_embeddings(issue_id, complaint_repo)
         
-        # Get existing complaints for this issue
-        existing_complaints = complaint_repo.get_by_issue(issue_id)
+        if not complaint_ids:
+            return False, 0.0, None
         
-        if not existing_complaints:
-            return False, 0.0
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return False, 0.0, None
         
-        # For now, we don't have embeddings stored
-        # In production, you'd store and compare embeddings
-        # This is a simplified version
+        idx, best = max_cosine(matrix, query / norm)
         
-        # Return not duplicate for now
-        return False, 0.0
+        # Clamp into the [0, 1] range the similarity_score column allows
+        score = min(1.0, max(0.0, best))
+        
+        if score >= threshold:
+            return True, score, complaint_ids[idx]
+        
+        return False, score, None
+    
+    # ==================== ISSUE EMBEDDING CACHE ====================
+    
+    def _get_issue_embeddings(
+        self,
+        issue_id: str,
+        complaint_repo: ComplaintRepository
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        (complaint ids, matrix) of an issue's embedding window, loaded from
+        DB on miss. The matrix is a view of the live window: only use it
+        under the issue key lock, which also serializes appends.
+        """
+        with self._issue_embeddings_lock:
+            window = self._issue_embeddings.get(issue_id)
+            if window is not None:
+                self._issue_embeddings.move_to_end(issue_id)
+                return window.snapshot()
+        
+        # Decoded to float32 once here; every later check is a plain SGEMV
+        rows = complaint_repo.get_embeddings_by_issue(issue_id, limit=ISSUE_EMBEDDING_WINDOW)
+        window = _IssueEmbeddingWindow(self.embedding_service.embedding_dim, rows)
+        
+        with self._issue_embeddings_lock:
+            self._issue_embeddings[issue_id] = window
+            self._issue_embeddings.move_to_end(issue_id)
+            if len(self._issue_embeddings) > ISSUE_EMBEDDING_CACHE_SIZE:
+                self._issue_embeddings.popitem(last=False)
+        
+        return window.snapshot()
+    
+    def _append_issue_embedding(self, issue_id: str, complaint_id: str, embedding: np.ndarray):
+        """Add a newly stored complaint's row to its issue's window (oldest drops out)"""
+        with self._issue_embeddings_lock:
+            window = self._issue_embeddings.get(issue_id)
+            if window is None:
+                # Not cached yet - the next lookup rehydrates from the DB
+                return
+            # Round through int8 so the cached row equals what a DB reload sees
+            window.append(complaint_id, unpack_embedding(pack_embedding_i8(embedding)))
+    
+    def _forget_issue_embeddings(self, issue_id: str):
+        with self._issue_embeddings_lock:
+            self._issue_embeddings.pop(issue_id, None)
     
     def get_issue(self, issue_id: str) -> Optional[Dict]:
         """Get issue by ID"""
@@ -326,7 +534,8 @@ class IssueServiceDay6:
                 except KeyError:
                     pass
             
-            issues = issue_repo.get_all(
+            # Column rows, not ORM objects: the listing only reads them
+            issues = issue_repo.get_all_lite(
                 status=status_enum,
                 hostel=hostel,
                 category=category,
@@ -334,7 +543,7 @@ class IssueServiceDay6:
             )
             
             return {
-                "issues": [issue.to_dict(summary=True) for issue in issues],
+                "issues": [issue_summary(issue) for issue in issues],
                 "count": len(issues)
             }
     
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Complaint ID Testing Script
+Tests ComplaintIdGenerator ordering, worker ids and fork handling
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.issues import issue_id
+from app.issues.issue_id import ComplaintIdGenerator
+
+
+def test_ids_increase():
+    """Test that IDs from one generator strictly increase"""
+    print("\n" + "=" * 60)
+    print("TEST 1: Strictly Increasing IDs")
+    print("=" * 60)
+
+    generator = ComplaintIdGenerator(worker_id=3)
+    ids = [generator.next_id() for _ in range(20000)]
+    assert all(a < b for a, b in zip(ids, ids[1:]))
+    assert all((value >> 12) & 0x3FF == 3 for value in ids)
+    print(f"✓ {len(ids)} IDs strictly increasing, all carrying worker 3")
+
+    complaint_id = issue_id.generate_complaint_id()
+    assert complaint_id.startswith("COMP-") and len(complaint_id) <= 21
+    int(complaint_id[5:], 16)
+    print(f"✓ Public format: {complaint_id}")
+
+    print("✅ Strictly increasing IDs: PASSED")
+
+
+def test_worker_id_resolution():
+    """Test WORKER_ID, the pid fallback and range checks"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Worker ID Resolution")
+    print("=" * 60)
+
+    previous = os.environ.pop("WORKER_ID", None)
+    try:
+        assert ComplaintIdGenerator().worker_id == os.getpid() & 0x3FF
+        print("✓ Unset WORKER_ID falls back to the pid")
+
+        # Read on first use, not when the generator is built
+        generator = ComplaintIdGenerator()
+        os.environ["WORKER_ID"] = "517"
+        assert (generator.next_id() >> 12) & 0x3FF == 517
+        print("✓ WORKER_ID read on first use")
+
+        os.environ["WORKER_ID"] = "1024"
+        try:
+            ComplaintIdGenerator().next_id()
+            assert False, "expected ValueError for WORKER_ID=1024"
+        except ValueError:
+            pass
+        print("✓ Out-of-range WORKER_ID rejected")
+    finally:
+        os.environ.pop("WORKER_ID", None)
+        if previous is not None:
+            os.environ["WORKER_ID"] = previous
+
+    print("✅ Worker ID resolution: PASSED")
+
+
+def test_fork_resets_worker_id():
+    """Test that a forked child does not reuse the parent's worker id"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Worker ID After Fork")
+    print("=" * 60)
+
+    if not hasattr(os, "fork"):
+        print("⚠️  os.fork unavailable; skipped")
+        return
+
+    parent_worker = issue_id._complaint_ids.worker_id
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Child: a post_fork hook would set WORKER_ID here
+        os.environ["WORKER_ID"] = str((parent_worker + 1) & 0x3FF)
+        os.write(write_fd, str(issue_id._complaint_ids.worker_id).encode())
+        os._exit(0)
+
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    child_worker = int(os.read(read_fd, 16))
+    os.close(read_fd)
+
+    assert child_worker == (parent_worker + 1) & 0x3FF, (parent_worker, child_worker)
+    print(f"✓ Parent worker {parent_worker}, child worker {child_worker}")
+    print("✅ Worker ID after fork: PASSED")
+
+
+def main():
+    """Run all tests"""
+    try:
+        print("=" * 60)
+        print("COMPLAINT ID TESTING")
+        print("=" * 60)
+
+        test_ids_increase()
+        test_worker_id_resolution()
+        test_fork_resets_worker_id()
+
+        print("\n" + "=" * 60)
+        print("✅ ALL COMPLAINT ID TESTS PASSED")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ TEST ERROR: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,15 @@ Day 7B Testing Script
 Tests observability features
 """
 
+import os
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+# Trace marks are a no-op unless tracing is on; enable it before app imports
+os.environ["ENABLE_TRACING"] = "true"
+
 from app.observability.context import (
     generate_request_id,
     set_request_id,
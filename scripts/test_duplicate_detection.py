@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Duplicate Detection Testing Script
+Tests Day 7A centroid screening, exact-text matching, legacy issues and
+embedding backfill, and the Day 6 per-issue embedding window
+(stub embeddings against a temporary SQLite database; no model needed)
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.models import ComplaintModel, IssueModel  # noqa: F401 (register tables)
+from app.repositories.complaint_repository import ComplaintRepository, pack_embedding_i8
+from app.services.embedding_service import EmbeddingService
+from app.services.issue_service_day6 import ISSUE_EMBEDDING_WINDOW, _IssueEmbeddingWindow
+from app.services.issue_service_day7a import (
+    CENTROID_SCREEN_THRESHOLD,
+    MIN_EMBEDDING_TEXT_LENGTH,
+    IssueServiceDay7A,
+    _advance_centroid
+)
+
+DIM = 16
+
+
+def _unit(*components) -> np.ndarray:
+    """Unit vector with the given leading components"""
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[:len(components)] = components
+    return vector / np.linalg.norm(vector)
+
+
+def _axis(i: int) -> np.ndarray:
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[i] = 1.0
+    return vector
+
+
+class DuplicateFixture:
+    """One issue in a throwaway database, filled through the repository"""
+
+    def __init__(self, tmp_dir: str, with_centroid: bool = True):
+        engine = create_engine(f"sqlite:///{tmp_dir}/dup.db")
+        Base.metadata.create_all(bind=engine)
+        self.engine = engine
+        self.db = sessionmaker(bind=engine)()
+        self.repo = ComplaintRepository(self.db)
+        self.with_centroid = with_centroid
+
+        self.issue = IssueModel(
+            id="ISS-TEST", hostel="BH1", category="Water", status="OPEN",
+            urgency_max="Low", urgency_avg=1.0, complaint_count=0,
+            unique_complaint_count=0, duplicate_count=0, centroid_count=0
+        )
+        self.db.add(self.issue)
+        self.db.flush()
+        self._count = 0
+
+    def add(self, text: str, embedding: np.ndarray) -> str:
+        complaint_id = self.add_unembedded(text)
+        self.repo.set_embeddings_i8([(complaint_id, embedding)])
+        if self.with_centroid:
+            self.issue.centroid, self.issue.centroid_count = _advance_centroid(
+                self.issue.centroid, self.issue.centroid_count, embedding
+            )
+        return complaint_id
+
+    def add_unembedded(self, text: str, urgency: str = "Low") -> str:
+        """A complaint stored without an embedding (e.g. a skipped Critical one)"""
+        self._count += 1
+        complaint_id = f"COMP-{self._count}"
+        self.repo.insert({
+            "id": complaint_id, "issue_id": self.issue.id, "text": text,
+            "category": "Water", "urgency": urgency, "hostel": "BH1",
+            "is_duplicate": False
+        })
+        return complaint_id
+
+    def embedding_of(self, complaint_id: str):
+        return self.db.get(ComplaintModel, complaint_id).embedding_i8
+
+    def close(self):
+        self.db.close()
+        self.engine.dispose()
+
+
+class KeywordEmbedder:
+    """Stub embedder: texts mentioning a keyword map onto its vector"""
+
+    model_name = "keyword-stub"
+
+    def __init__(self, vectors: dict):
+        self.vectors = vectors
+        self.batches = []
+
+    def get_dimension(self):
+        return DIM
+
+    def embed(self, text):
+        return self.embed_batch([text], batch_size=1)[0]
+
+    def embed_batch(self, texts, batch_size=32):
+        self.batches.append(list(texts))
+        out = np.zeros((len(texts), DIM), dtype=np.float32)
+        for i, text in enumerate(texts):
+            out[i] = next(
+                (vector for word, vector in self.vectors.items() if word in text),
+                _axis(DIM - 1)
+            )
+        return out
+
+
+def _check(service, fixture, embedding, text, pending=None):
+    flags = {"duplicate_detection": False}
+    result = service._check_duplicate_safe(
+        fixture.issue, embedding, text, fixture.repo, "COMP-NEW", flags,
+        pending=pending
+    )
+    assert not flags["duplicate_detection"], "duplicate detection degraded"
+    return result
+
+
+def test_screened_scan():
+    """Test near duplicates found through the screen, unrelated ones rejected"""
+    print("\n" + "=" * 60)
+    print("TEST 1: Centroid Screen + Scan")
+    print("=" * 60)
+
+    service = IssueServiceDay7A()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fixture = DuplicateFixture(tmp_dir)
+        first = fixture.add("no water in bathroom since morning", _unit(1.0, 0.1))
+        fixture.add("bathroom taps dry since morning", _unit(1.0, 0.2))
+
+        is_dup, score, dup_of = _check(
+            service, fixture, _unit(1.0, 0.12), "water not coming in bathroom"
+        )
+        assert is_dup and dup_of == first, (is_dup, score, dup_of)
+        print(f"✓ Near duplicate matched {dup_of} (similarity {score:.3f})")
+
+        is_dup, score, dup_of = _check(
+            service, fixture, _axis(5), "fan making noise at night"
+        )
+        assert not is_dup and dup_of is None
+        assert score < CENTROID_SCREEN_THRESHOLD
+        print(f"✓ Unrelated complaint screened out (similarity {score:.3f})")
+
+        fixture.close()
+
+    print("✅ Centroid screen + scan: PASSED")
+
+
+def test_exact_text_bypasses_screen():
+    """Test an exact repeat in a spread-out issue (below the screen)"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Exact Text Bypasses Screen")
+    print("=" * 60)
+
+    service = IssueServiceDay7A()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fixture = DuplicateFixture(tmp_dir)
+        # Mutually orthogonal members: each is ~0.58 from the centroid
+        first = fixture.add("Geyser not working on 2nd floor", _axis(0))
+        fixture.add("low water pressure in showers", _axis(1))
+        fixture.add("water cooler leaking near mess", _axis(2))
+
+        is_dup, score, dup_of = _check(
+            service, fixture, _axis(0), "  geyser not working on 2nd FLOOR "
+        )
+        assert is_dup and dup_of == first and score == 1.0, (is_dup, score, dup_of)
+        print(f"✓ Exact repeat matched {dup_of} despite the screen")
+
+        pending = [("COMP-PENDING", _axis(7), "Tank overflowing on roof")]
+        is_dup, score, dup_of = _check(
+            service, fixture, _axis(7), "tank overflowing on roof", pending=pending
+        )
+        assert is_dup and dup_of == "COMP-PENDING"
+        print("✓ Exact repeat of an earlier batch item matched")
+
+        fixture.close()
+
+    print("✅ Exact text bypass: PASSED")
+
+
+def test_issue_without_centroid():
+    """Test issues created before centroids: scan, then seed the centroid"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Issue Without Centroid")
+    print("=" * 60)
+
+    service = IssueServiceDay7A()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fixture = DuplicateFixture(tmp_dir, with_centroid=False)
+        first = fixture.add("no water in bathroom since morning", _unit(1.0, 0.1))
+        fixture.add("bathroom taps dry since morning", _unit(1.0, 0.2))
+        assert fixture.issue.centroid is None
+
+        is_dup, score, dup_of = _check(
+            service, fixture, _unit(1.0, 0.12), "water not coming in bathroom"
+        )
+        assert is_dup and dup_of == first, (is_dup, score, dup_of)
+        assert fixture.issue.centroid is not None
+        assert fixture.issue.centroid_count == 2
+        print(f"✓ Duplicate found without a centroid; centroid seeded from "
+              f"{fixture.issue.centroid_count} complaints")
+
+        fixture.close()
+
+    print("✅ Issue without centroid: PASSED")
+
+
+def test_skipped_complaints_backfilled():
+    """Test that complaints stored without an embedding become matchable"""
+    print("\n" + "=" * 60)
+    print("TEST 4: Embedding Backfill")
+    print("=" * 60)
+
+    sparks = _unit(1.0, 0.0, 0.0, 0.6)  # passes the screen of an axis-0 issue
+    embedder = KeywordEmbedder({"spark": sparks})
+    service = IssueServiceDay7A()
+    service.__dict__["embedding_service"] = EmbeddingService(embedder=embedder)
+    embedder.batches.clear()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fixture = DuplicateFixture(tmp_dir)
+        fixture.add("no water in bathroom since morning", _axis(0))
+        critical = fixture.add_unembedded(
+            "sparks coming out of the geyser switch", urgency="Critical"
+        )
+        short = fixture.add_unembedded("spark!!")
+        assert len("spark!!") < MIN_EMBEDDING_TEXT_LENGTH
+
+        is_dup, score, dup_of = _check(service, fixture, sparks, "geyser switch sparking")
+        assert is_dup and dup_of == critical, (is_dup, score, dup_of)
+        assert fixture.embedding_of(critical) is not None, "Critical complaint not embedded"
+        assert fixture.issue.centroid_count == 2
+        assert embedder.batches == [["sparks coming out of the geyser switch"]], embedder.batches
+        print(f"✓ Skipped Critical complaint embedded on the next scan and "
+              f"matched (similarity {score:.3f})")
+
+        assert fixture.embedding_of(short) is None, "short texts must stay unembedded"
+        _check(service, fixture, sparks, "sparks near the geyser again")
+        assert len(embedder.batches) == 1, "backfilled rows must not be re-embedded"
+        print("✓ Short texts stay unembedded; backfilled rows are not re-embedded")
+
+        fixture.close()
+
+    print("✅ Embedding backfill: PASSED")
+
+
+def test_day6_window_matches_reload():
+    """Test that an appended Day 6 window equals a fresh reload's window"""
+    print("\n" + "=" * 60)
+    print("TEST 5: Day 6 Embedding Window")
+    print("=" * 60)
+
+    rng = np.random.default_rng(3)
+    total = ISSUE_EMBEDDING_WINDOW + 40
+    vectors = rng.standard_normal((total, DIM)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    rows = [(f"COMP-{i}", vectors[i]) for i in range(total)]  # oldest first
+
+    # Cached since 60 complaints, then kept up by appends
+    window = _IssueEmbeddingWindow(DIM, rows[:60][::-1])
+    buffer = window.matrix
+    for complaint_id, vector in rows[60:]:
+        window.append(complaint_id, vector)
+    assert window.matrix is buffer and window.matrix.shape == (ISSUE_EMBEDDING_WINDOW, DIM)
+    print(f"✓ {total - 60} appends reuse one ({ISSUE_EMBEDDING_WINDOW}, {DIM}) buffer")
+
+    # What a process without the issue cached loads: newest first, limited
+    reloaded = _IssueEmbeddingWindow(DIM, rows[::-1][:ISSUE_EMBEDDING_WINDOW])
+    for candidate in (window, reloaded):
+        ids, matrix = candidate.snapshot()
+        assert sorted(ids) == sorted(f"COMP-{i}" for i in range(40, total))
+        by_id = dict(zip(ids, matrix))
+        assert all(np.array_equal(by_id[f"COMP-{i}"], vectors[i]) for i in range(40, total))
+    print(f"✓ Appended and reloaded windows hold the same newest {ISSUE_EMBEDDING_WINDOW}")
+
+    partial = _IssueEmbeddingWindow(DIM, rows[:3][::-1])
+    ids, matrix = partial.snapshot()
+    assert ids == ["COMP-0", "COMP-1", "COMP-2"] and matrix.shape == (3, DIM)
+    print("✓ Partly filled window exposes only its filled rows")
+
+    print("✅ Day 6 embedding window: PASSED")
+
+
+def main():
+    """Run all tests"""
+    try:
+        print("=" * 60)
+        print("DUPLICATE DETECTION TESTING")
+        print("=" * 60)
+
+        test_screened_scan()
+        test_exact_text_bypasses_screen()
+        test_issue_without_centroid()
+        test_skipped_complaints_backfilled()
+        test_day6_window_matches_reload()
+
+        print("\n" + "=" * 60)
+        print("✅ ALL DUPLICATE DETECTION TESTS PASSED")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ TEST ERROR: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Embedding Micro-Batching Testing Script
+Tests MicroBatcher coalescing and EmbeddingService.submit_preprocessed
+(uses a stub embedder, so no model download is needed)
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from app.services.embedding_service import EmbeddingService, MicroBatcher
+
+
+class StubEmbedder:
+    """Deterministic unit vectors; records every batch it encodes"""
+
+    model_name = "stub-embedder"
+
+    def __init__(self, dim: int = 8, delay: float = 0.0, fail: bool = False):
+        self.dim = dim
+        self.delay = delay
+        self.fail = fail
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def get_dimension(self):
+        return self.dim
+
+    def embed(self, text):
+        return self.embed_batch([text], batch_size=1)[0]
+
+    def embed_batch(self, texts, batch_size=32):
+        with self._lock:
+            self.batches.append(list(texts))
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("encoder unavailable")
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            out[i, sum(map(ord, text)) % self.dim] = 1.0
+        return out
+
+
+def test_concurrent_submits_share_a_batch():
+    """Test that concurrent texts are encoded in one forward pass"""
+    print("\n" + "=" * 60)
+    print("TEST 1: Coalescing")
+    print("=" * 60)
+
+    embedder = StubEmbedder()
+    batcher = MicroBatcher(embedder.embed_batch, max_batch=32, max_wait=0.05)
+
+    texts = [f"complaint {i}" for i in range(20)]
+    futures = [batcher.submit(text) for text in texts]
+    results = [future.result(timeout=5) for future in futures]
+
+    calls = len(embedder.batches)
+    assert calls == 1, embedder.batches
+    assert embedder.batches[0] == texts
+    expected = embedder.embed_batch(texts)
+    for result, row in zip(results, expected):
+        assert np.array_equal(result, row)
+
+    print(f"✓ {len(texts)} submits -> {calls} encoder call")
+    print("✅ Coalescing: PASSED")
+
+
+def test_batch_size_cap():
+    """Test that a burst larger than max_batch is split"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Batch Size Cap")
+    print("=" * 60)
+
+    embedder = StubEmbedder()
+    batcher = MicroBatcher(embedder.embed_batch, max_batch=4, max_wait=0.05)
+
+    futures = [batcher.submit(f"text {i}") for i in range(10)]
+    for future in futures:
+        future.result(timeout=5)
+
+    sizes = [len(batch) for batch in embedder.batches]
+    assert sum(sizes) == 10
+    assert max(sizes) <= 4
+    print(f"✓ Batch sizes: {sizes}")
+    print("✅ Batch size cap: PASSED")
+
+
+def test_failure_and_cancellation():
+    """Test error propagation and dropping cancelled futures"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Failure and Cancellation")
+    print("=" * 60)
+
+    failing = MicroBatcher(StubEmbedder(fail=True).embed_batch, max_wait=0.01)
+    future = failing.submit("no water since morning")
+    try:
+        future.result(timeout=5)
+        assert False, "expected the batch error"
+    except RuntimeError as e:
+        assert "encoder unavailable" in str(e)
+    print("✓ Encoder errors reach every waiting caller")
+
+    embedder = StubEmbedder()
+    batcher = MicroBatcher(embedder.embed_batch, max_batch=8, max_wait=0.1)
+    kept = batcher.submit("kept one")
+    dropped = batcher.submit("dropped one")
+    assert dropped.cancel()
+    kept.result(timeout=5)
+    assert embedder.batches == [["kept one"]], embedder.batches
+    print("✓ Cancelled futures are not encoded")
+
+    print("✅ Failure and cancellation: PASSED")
+
+
+def test_submit_preprocessed_cache():
+    """Test that submit_preprocessed caches results and serves hits"""
+    print("\n" + "=" * 60)
+    print("TEST 4: submit_preprocessed Cache")
+    print("=" * 60)
+
+    embedder = StubEmbedder(delay=0.01)
+    service = EmbeddingService(embedder=embedder, cache_size=16)
+    embedder.batches.clear()
+
+    first = service.submit_preprocessed("fan not working in room 12").result(timeout=5)
+    assert first.base is None, "cached rows must not be views of the batch matrix"
+    assert not first.flags.writeable
+
+    hit = service.submit_preprocessed("fan not working in room 12")
+    assert hit.done(), "cache hits must not wait for the batcher"
+    assert hit.result() is first
+    assert len(embedder.batches) == 1
+    assert service.embed_preprocessed_coalesced("fan not working in room 12") is first
+
+    stats = service.get_cache_stats()
+    assert stats["size"] == 1 and stats["hits"] == 2
+    print(f"✓ Cache stats: {stats}")
+    print("✅ submit_preprocessed cache: PASSED")
+
+
+def main():
+    """Run all tests"""
+    try:
+        print("=" * 60)
+        print("EMBEDDING MICRO-BATCHING TESTING")
+        print("=" * 60)
+
+        test_concurrent_submits_share_a_batch()
+        test_batch_size_cap()
+        test_failure_and_cancellation()
+        test_submit_preprocessed_cache()
+
+        print("\n" + "=" * 60)
+        print("✅ ALL MICRO-BATCHING TESTS PASSED")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ TEST ERROR: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
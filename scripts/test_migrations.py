@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Schema Migration Testing Script
+Tests that older databases upgrade to the current schema in place, and
+the int8 embedding encoding they are migrated to
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import numpy as np
+from sqlalchemy import create_engine, inspect, text
+
+from app.db.base import Base
+from app.db import migrations
+from app.db.models import ComplaintModel, IssueModel  # noqa: F401 (register tables)
+from app.repositories.complaint_repository import pack_embedding_i8, unpack_embedding
+
+_INSERT_ISSUE = (
+    "INSERT INTO issues (id, hostel, category, status, urgency_max, urgency_avg, "
+    "complaint_count, unique_complaint_count, duplicate_count, created_at, last_updated) "
+    "VALUES ('ISS-OLD', 'BH1', 'Water', 'OPEN', 'Low', 1.0, 0, 0, 0, "
+    "'2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+)
+
+
+def _engine(tmp_dir: str, name: str):
+    return create_engine(f"sqlite:///{tmp_dir}/{name}.db")
+
+
+def _index_names(engine, table: str):
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def _column_names(engine, table: str):
+    return {column["name"] for column in inspect(engine).get_columns(table)}
+
+
+def _legacy_database(tmp_dir: str, name: str):
+    """Current tables minus everything the migrations add (unversioned)"""
+    engine = _engine(tmp_dir, name)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_complaint_issue_dup"))
+        conn.execute(text("ALTER TABLE complaints DROP COLUMN embedding_i8"))
+        conn.execute(text("ALTER TABLE issues DROP COLUMN centroid"))
+        conn.execute(text("ALTER TABLE issues DROP COLUMN centroid_count"))
+        conn.execute(text(_INSERT_ISSUE))
+    return engine
+
+
+def _unit_vectors(count: int, dim: int = 32):
+    vectors = np.random.default_rng(7).standard_normal((count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _version_4_database(tmp_dir: str, name: str, vectors):
+    """Schema version 4: embeddings in embedding_fp16 / embedding_blob"""
+    engine = _engine(tmp_dir, name)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE complaints DROP COLUMN embedding_i8"))
+        conn.execute(text("ALTER TABLE complaints ADD COLUMN embedding_blob BLOB"))
+        conn.execute(text("ALTER TABLE complaints ADD COLUMN embedding_fp16 BLOB"))
+        conn.execute(text(
+            "INSERT INTO issues (id, hostel, category, status, urgency_max, urgency_avg, "
+            "complaint_count, unique_complaint_count, duplicate_count, centroid_count, "
+            "created_at, last_updated) VALUES ('ISS-OLD', 'BH1', 'Water', 'OPEN', 'Low', "
+            "1.0, 0, 0, 0, 0, '2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+        ))
+        for i, vector in enumerate(vectors):
+            # Alternate the two legacy columns; the last row has no embedding
+            column = "embedding_fp16" if i % 2 else "embedding_blob"
+            value = vector.astype(np.float16 if i % 2 else np.float32).tobytes()
+            conn.execute(text(
+                f"INSERT INTO complaints (id, issue_id, text, category, urgency, hostel, "
+                f"is_duplicate, created_at, {column}) VALUES (:id, 'ISS-OLD', 'no water', "
+                f"'Water', 'Low', 'BH1', 0, '2024-01-01 00:00:00', :value)"
+            ), {"id": f"COMP-{i}", "value": value})
+        conn.execute(text(
+            "INSERT INTO complaints (id, issue_id, text, category, urgency, hostel, "
+            "is_duplicate, created_at) VALUES ('COMP-NONE', 'ISS-OLD', 'ok', "
+            "'Water', 'Low', 'BH1', 0, '2024-01-01 00:00:00')"
+        ))
+    migrations.stamp(engine, 4)
+    return engine
+
+
+def test_upgrade_legacy_database():
+    """Test upgrading an unversioned database"""
+    print("\n" + "=" * 60)
+    print("TEST 1: Upgrade Legacy Database")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = _legacy_database(tmp_dir, "legacy")
+
+        assert migrations.get_schema_version(engine) == 0
+        assert "ix_complaint_issue_dup" not in _index_names(engine, "complaints")
+        assert "embedding_i8" not in _column_names(engine, "complaints")
+
+        version = migrations.upgrade(engine)
+
+        assert version == migrations.SCHEMA_VERSION
+        assert migrations.get_schema_version(engine) == migrations.SCHEMA_VERSION
+        assert "ix_complaint_issue_dup" in _index_names(engine, "complaints")
+        columns = _column_names(engine, "complaints")
+        assert "embedding_i8" in columns
+        assert not {"embedding_blob", "embedding_fp16"} & columns
+        assert {"centroid", "centroid_count"} <= _column_names(engine, "issues")
+        with engine.connect() as conn:
+            centroid, count = conn.execute(text(
+                "SELECT centroid, centroid_count FROM issues WHERE id = 'ISS-OLD'"
+            )).one()
+        assert centroid is None and count == 0
+        print(f"✓ Upgraded to schema version {version}")
+
+        engine.dispose()
+
+    print("✅ Legacy upgrade: PASSED")
+
+
+def test_upgrade_is_idempotent():
+    """Test that upgrades re-run safely on current and stamped databases"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Idempotent Upgrade")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Current schema but never stamped: every step must be a no-op
+        engine = _engine(tmp_dir, "unstamped")
+        Base.metadata.create_all(bind=engine)
+        assert migrations.upgrade(engine) == migrations.SCHEMA_VERSION
+        assert migrations.upgrade(engine) == migrations.SCHEMA_VERSION
+        print("✓ Unstamped current schema upgrades without errors")
+        engine.dispose()
+
+        # New database: stamped, nothing pending
+        engine = _engine(tmp_dir, "new")
+        assert migrations.is_new_database(engine)
+        Base.metadata.create_all(bind=engine)
+        migrations.stamp(engine)
+        assert not migrations.is_new_database(engine)
+        assert migrations.get_schema_version(engine) == migrations.SCHEMA_VERSION
+        assert migrations.upgrade(engine) == migrations.SCHEMA_VERSION
+        print("✓ Stamped database has no pending steps")
+        engine.dispose()
+
+    print("✅ Idempotent upgrade: PASSED")
+
+
+def test_embeddings_consolidated():
+    """Test re-packing fp16/float32 embeddings into embedding_i8"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Embedding Column Consolidation")
+    print("=" * 60)
+
+    vectors = _unit_vectors(6)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = _version_4_database(tmp_dir, "v4", vectors)
+
+        assert migrations.upgrade(engine) == migrations.SCHEMA_VERSION
+        columns = _column_names(engine, "complaints")
+        assert "embedding_i8" in columns
+        assert not {"embedding_blob", "embedding_fp16"} & columns
+        print("✓ embedding_fp16 / embedding_blob dropped")
+
+        with engine.connect() as conn:
+            rows = dict(conn.execute(text("SELECT id, embedding_i8 FROM complaints")).all())
+        assert rows.pop("COMP-NONE") is None
+        for i, vector in enumerate(vectors):
+            restored = unpack_embedding(rows[f"COMP-{i}"])
+            assert float(restored @ vector) / float(np.linalg.norm(restored)) > 0.999
+        print(f"✓ {len(vectors)} legacy embeddings re-packed as int8")
+
+        engine.dispose()
+
+    print("✅ Embedding consolidation: PASSED")
+
+
+def test_int8_round_trip():
+    """Test that pack/unpack keeps cosine similarity within 0.5%"""
+    print("\n" + "=" * 60)
+    print("TEST 4: int8 Embedding Round Trip")
+    print("=" * 60)
+
+    vectors = _unit_vectors(200, dim=512)
+    packed = [pack_embedding_i8(vector) for vector in vectors]
+    assert all(len(value) == 4 + 512 for value in packed)
+
+    restored = np.vstack([unpack_embedding(value) for value in packed])
+    assert restored.dtype == np.float32
+    self_cosines = np.sum(restored * vectors, axis=1) / np.linalg.norm(restored, axis=1)
+    assert self_cosines.min() > 0.999, self_cosines.min()
+
+    exact = vectors[:20] @ vectors[20:].T
+    approx = restored[:20] @ restored[20:].T
+    error = float(np.abs(exact - approx).max())
+    assert error < 0.005, error
+    print(f"✓ 4 + dim bytes per row; max pairwise cosine error {error:.4f}")
+
+    zero = unpack_embedding(pack_embedding_i8(np.zeros(8, dtype=np.float32)))
+    assert not np.any(zero)
+    print("✓ Zero vector survives the round trip")
+
+    print("✅ int8 round trip: PASSED")
+
+
+def main():
+    """Run all tests"""
+    try:
+        print("=" * 60)
+        print("SCHEMA MIGRATION TESTING")
+        print("=" * 60)
+
+        test_upgrade_legacy_database()
+        test_upgrade_is_idempotent()
+        test_embeddings_consolidated()
+        test_int8_round_trip()
+
+        print("\n" + "=" * 60)
+        print("✅ ALL SCHEMA MIGRATION TESTS PASSED")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ TEST ERROR: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
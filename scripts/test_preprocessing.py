@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Preprocessing Testing Script
+Tests Hinglish normalization on both dictionary scan paths
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.preprocessing import text_cleaner
+from app.preprocessing.text_cleaner import (
+    HinglishNormalizer,
+    batch_preprocess,
+    preprocess_text
+)
+
+
+def _corpus():
+    """Every map key alone, in words, and run together with its neighbours"""
+    keys = list(HinglishNormalizer.HINGLISH_MAP)
+    texts = list(keys)
+    texts += [f"x{key}y" for key in keys]
+    texts += ["".join(keys), " ".join(keys), " ".join(reversed(keys))]
+    texts += [
+        "thikyu",
+        "paani nhi aa rha hostel me",
+        "ho rha hai sb thik nai",
+        "rhe rhi rha kyu kya",
+    ]
+    return texts
+
+
+def test_expected_output():
+    """Test leftmost-longest substitution on known inputs"""
+    print("\n" + "=" * 60)
+    print("TEST 1: Hinglish Normalization Output")
+    print("=" * 60)
+
+    cases = [
+        ("paani nhi aa rha hostel me", "pani nahi aa raha hostel main"),
+        ("Electricity cut ho gya hai", "electricity cut ho gya hai"),
+        # Overlapping keys: "thik" starts first, so "kyu" never matches
+        ("thikyu", "theekyu"),
+        ("kyu nai", "kyon nahi"),
+    ]
+
+    for text, expected in cases:
+        result = preprocess_text(text)
+        assert result == expected, f"{text!r} -> {result!r}, expected {expected!r}"
+        print(f"✓ {text!r} -> {result!r}")
+
+    print("✅ Hinglish normalization output: PASSED")
+
+
+def test_scan_paths_agree():
+    """Test that the regex fallback matches the Aho-Corasick scan"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Regex Fallback vs Automaton")
+    print("=" * 60)
+
+    texts = _corpus()
+
+    if text_cleaner._HINGLISH_AUTOMATON is None:
+        print("⚠️  pyahocorasick not installed; checking the regex path only")
+        for text in texts:
+            assert text_cleaner._replace_hinglish_keys(text) == \
+                text_cleaner._replace_with_pattern(text)
+    else:
+        for text in texts:
+            via_automaton = text_cleaner._replace_with_automaton(text)
+            via_pattern = text_cleaner._replace_with_pattern(text)
+            assert via_automaton == via_pattern, \
+                f"{text!r}: automaton {via_automaton!r} != regex {via_pattern!r}"
+
+    print(f"✓ Compared {len(texts)} texts")
+    print("✅ Scan paths agree: PASSED")
+
+
+def test_batch_matches_single():
+    """Test that batch_preprocess matches preprocess_text"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Batch vs Single Preprocessing")
+    print("=" * 60)
+
+    texts = _corpus() + ["", "  Mess   food is not good  ", None]
+
+    assert batch_preprocess(texts) == [preprocess_text(text) for text in texts]
+    assert batch_preprocess(texts, normalize_hinglish=False) == [
+        preprocess_text(text, normalize_hinglish=False) for text in texts
+    ]
+
+    print(f"✓ Batch of {len(texts)} matches one-by-one preprocessing")
+    print("✅ Batch preprocessing: PASSED")
+
+
+def main():
+    """Run all tests"""
+    try:
+        print("=" * 60)
+        print("PREPROCESSING TESTING")
+        print("=" * 60)
+
+        test_expected_output()
+        test_scan_paths_agree()
+        test_batch_matches_single()
+
+        print("\n" + "=" * 60)
+        print("✅ ALL PREPROCESSING TESTS PASSED")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ TEST ERROR: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
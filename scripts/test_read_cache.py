@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Issue Read Cache Testing Script
+Tests copies, the generation check and commit-driven invalidation
+(temporary SQLite database; no model needed)
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.models import ComplaintModel, IssueModel  # noqa: F401 (register tables)
+from app.db.models.issue import IssueStatus
+from app.repositories.complaint_repository import ComplaintRepository
+from app.repositories.issue_read_cache import IssueReadCache, issue_read_cache
+from app.repositories.issue_repository import IssueRepository
+
+
+def _cache_issue(issue_id: str):
+    """Cache a read of the issue and a listing, as get_issue/get_issues do"""
+    generation = issue_read_cache.generation
+    issue_read_cache.put(("issue", issue_id), {"issue_id": issue_id}, generation)
+    issue_read_cache.put(("issues", None, None, None, 50), {"count": 1}, generation)
+
+
+def _is_cached(issue_id: str) -> bool:
+    return issue_read_cache.get(("issue", issue_id)) is not None
+
+
+def test_copies_and_generation():
+    """Test that callers get copies and stale puts are dropped"""
+    print("\n" + "=" * 60)
+    print("TEST 1: Copies and Generation Check")
+    print("=" * 60)
+
+    cache = IssueReadCache(ttl_seconds=60.0, max_size=2)
+    result = {"issue_id": "ISS-1", "complaints": [{"id": "COMP-1"}]}
+    cache.put(("issue", "ISS-1"), result, cache.generation)
+    result["complaints"].append({"id": "COMP-2"})
+
+    first = cache.get(("issue", "ISS-1"))
+    first["complaints"].clear()
+    assert cache.get(("issue", "ISS-1"))["complaints"] == [{"id": "COMP-1"}]
+    print("✓ Cached results are copied in and out")
+
+    # A read that started before an invalidation must not re-insert its row
+    generation = cache.generation
+    cache.invalidate(["ISS-2"])
+    cache.put(("issue", "ISS-2"), {"issue_id": "ISS-2", "status": "OPEN"}, generation)
+    assert cache.get(("issue", "ISS-2")) is None
+    print("✓ Put after an invalidation is dropped")
+
+    cache.put(("issue", "ISS-2"), {}, cache.generation)
+    cache.put(("issue", "ISS-3"), {}, cache.generation)
+    assert cache.get(("issue", "ISS-1")) is None, "LRU bound not applied"
+    expiring = IssueReadCache(ttl_seconds=0.01)
+    expiring.put(("issue", "ISS-1"), {}, expiring.generation)
+    time.sleep(0.02)
+    assert expiring.get(("issue", "ISS-1")) is None
+    print("✓ Size and TTL bounds applied")
+
+    print("✅ Copies and generation check: PASSED")
+
+
+def test_commit_invalidates():
+    """Test that committed writes from any session drop cached reads"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Commit-Driven Invalidation")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{tmp_dir}/cache.db")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+
+        with Session() as db:
+            db.add(IssueModel(
+                id="ISS-CACHE", hostel="BH1", category="Water", status="OPEN",
+                urgency_max="Low", urgency_avg=1.0, complaint_count=0,
+                unique_complaint_count=0, duplicate_count=0
+            ))
+            db.commit()
+
+        # Admin status update (the Day 6 endpoint's repository path)
+        _cache_issue("ISS-CACHE")
+        with Session() as db:
+            IssueRepository(db).update_status("ISS-CACHE", IssueStatus.IN_PROGRESS)
+            assert _is_cached("ISS-CACHE"), "invalidated before commit"
+            db.commit()
+        assert not _is_cached("ISS-CACHE")
+        assert issue_read_cache.get(("issues", None, None, None, 50)) is None
+        print("✓ Status update commit invalidates the issue and listings")
+
+        # Rolled-back writes leave the cache alone
+        _cache_issue("ISS-CACHE")
+        with Session() as db:
+            IssueRepository(db).update_status("ISS-CACHE", IssueStatus.RESOLVED)
+            db.rollback()
+        assert _is_cached("ISS-CACHE")
+        print("✓ Rolled-back write keeps the cached read")
+
+        # Core INSERTs bypass the flush hook; the repository marks them
+        with Session() as db:
+            ComplaintRepository(db).insert({
+                "id": "COMP-CACHE", "issue_id": "ISS-CACHE", "text": "no water",
+                "category": "Water", "urgency": "Low", "hostel": "BH1",
+                "is_duplicate": False
+            })
+            db.commit()
+        assert not _is_cached("ISS-CACHE")
+        print("✓ Core complaint insert invalidates its issue")
+
+        engine.dispose()
+
+    print("✅ Commit-driven invalidation: PASSED")
+
+
+def main():
+    """Run all tests"""
+    try:
+        print("=" * 60)
+        print("ISSUE READ CACHE TESTING")
+        print("=" * 60)
+
+        test_copies_and_generation()
+        test_commit_invalidates()
+
+        print("\n" + "=" * 60)
+        print("✅ ALL READ CACHE TESTS PASSED")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {str(e)}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ TEST ERROR: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()